@@ -111,19 +111,11 @@ def read_campaigns_configurations(
     return []
 
 
-@router.get(
-    path="/{campaign_code}",
-    response_model=CampaignConfigResponse,
-    status_code=status.HTTP_200_OK,
-)
-@api_cache.cache_response
-def read_campaign_configuration(
-    _request: Request,
-    campaign_code: str = Depends(dependencies.campaign_code_exists_check),
-    lang: str = Depends(dependencies.language_check),
-):
+def get_campaign_configuration(
+    campaign_code: str, lang: str
+) -> CampaignConfigResponse | CampaignConfigInternal | None:
     """
-    Read campaign configuration.
+    Get campaign configuration (translated).
     """
 
     configuration = CAMPAIGNS_CONFIG.get(campaign_code)
@@ -170,4 +162,26 @@ def read_campaign_configuration(
 
         return configuration
 
+    return None
+
+
+@router.get(
+    path="/{campaign_code}",
+    response_model=CampaignConfigResponse,
+    status_code=status.HTTP_200_OK,
+)
+@api_cache.cache_response
+def read_campaign_configuration(
+    _request: Request,
+    campaign_code: str = Depends(dependencies.campaign_code_exists_check),
+    lang: str = Depends(dependencies.language_check),
+):
+    """
+    Read campaign configuration.
+    """
+
+    configuration = get_campaign_configuration(campaign_code=campaign_code, lang=lang)
+    if configuration:
+        return configuration
+
     raise ResourceNotFoundHTTPException("Campaign configuration not found.")
@@ -24,30 +24,45 @@ SOFTWARE.
 """
 
 import logging
+import os
+import tempfile
+import uuid
 from datetime import date, datetime
 from io import StringIO
 
 import pandas as pd
 import requests
-from fastapi import APIRouter, Depends, Request, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from starlette.concurrency import run_in_threadpool
 
+from app import constants
 from app import crud
 from app import databases
 from app import http_exceptions
 from app import utils
 from app.api import dependencies
+from app.api.v1.endpoints.campaign_configurations import get_campaign_configuration
 from app.core.settings import get_settings
+from app.enums.campaign_section import CampaignSection
 from app.enums.legacy_campaign_code import LegacyCampaignCode
+from app.helpers import content_encoding
 from app.logginglib import init_custom_logger
 from app.schemas.campaign import Campaign
+from app.schemas.campaign_batch import CampaignBatch
+from app.schemas.campaign_batch_request import CampaignBatchRequest
 from app.schemas.campaign_request import CampaignRequest
 from app.schemas.date_filter import DateFilter
+from app.schemas.facet_counts import FacetCounts
 from app.schemas.filter_options import FilterOptions
+from app.schemas.responses_page import ResponsesPage
 from app.services import azure_blob_storage_interactions
+from app.services.access_log import AccessLog
 from app.services import google_cloud_storage_interactions
 from app.services.api_cache import ApiCache
 from app.services.campaign import CampaignService
+from app.services.compute_executor import ComputeExecutor
 
 logger = logging.getLogger(__name__)
 init_custom_logger(logger)
@@ -56,6 +71,10 @@ router = APIRouter(prefix="/campaigns")
 
 api_cache = ApiCache()
 
+compute_executor = ComputeExecutor()
+
+access_log = AccessLog()
+
 settings = get_settings()
 
 
@@ -64,43 +83,123 @@ settings = get_settings()
     response_model=Campaign,
     status_code=status.HTTP_200_OK,
 )
+@access_log.record_requests
 @api_cache.cache_response
-def read_campaign(
+async def read_campaign(
     campaign_req: CampaignRequest,
     _request: Request,
     campaign_code: str = Depends(dependencies.campaign_code_exists_check),
     lang: str = Depends(dependencies.language_check),
     q_code: str = Depends(dependencies.q_code_check),
     response_year: str = Depends(dependencies.response_year_check),
+    sections: list[CampaignSection] | None = Query(default=None),
 ):
     """
     Read campaign.
+    Use the query parameter `sections` to only include specific sections, all sections are included by default.
+    The section `age_summary` is only included when requested.
     """
 
     filter_1 = campaign_req.filter_1
     filter_2 = campaign_req.filter_2
 
-    # Service
-    campaign_service = CampaignService(
-        campaign_code=campaign_code,
-        response_year=response_year,
-        language=lang,
-        filter_1=filter_1,
-        filter_2=filter_2,
-    )
+    def get_campaign() -> Campaign:
+        # Service
+        # Created off the event loop, filter keywords in other languages are translated with a network request
+        campaign_service = CampaignService(
+            campaign_code=campaign_code,
+            response_year=response_year,
+            language=lang,
+            filter_1=filter_1,
+            filter_2=filter_2,
+        )
+
+        return campaign_service.get_campaign(q_code=q_code, sections=sections)
 
-    # Campaign
-    campaign = campaign_service.get_campaign(q_code=q_code)
+    # Campaign (computed in the compute executor)
+    campaign = await compute_executor.run(get_campaign)
 
     return campaign
 
 
+@router.post(
+    path="/{campaign_code}/batch",
+    response_model=CampaignBatch,
+    status_code=status.HTTP_200_OK,
+)
+@api_cache.cache_response
+async def read_campaign_batch(
+    campaign_batch_req: CampaignBatchRequest,
+    _request: Request,
+    campaign_code: str = Depends(dependencies.campaign_code_exists_check),
+    lang: str = Depends(dependencies.language_check),
+    response_year: str = Depends(dependencies.response_year_check),
+):
+    """
+    Read campaign for one or more q codes, and optionally the campaign configuration, filter options and histogram
+    options, in one request.
+    The campaigns are computed from the same filtered responses.
+    """
+
+    # Q codes
+    campaign_q_codes = crud.Campaign(campaign_code=campaign_code).get_q_codes()
+    q_codes = list(dict.fromkeys(campaign_batch_req.q_codes)) or list(campaign_q_codes)
+    for q_code in q_codes:
+        if q_code not in campaign_q_codes:
+            raise http_exceptions.ResourceNotFoundHTTPException(
+                "Campaign does not have the provided q_code"
+            )
+
+    def get_campaign_batch() -> CampaignBatch:
+        # Service
+        # Created off the event loop, filter keywords in other languages are translated with a network request
+        campaign_service = CampaignService(
+            campaign_code=campaign_code,
+            response_year=response_year,
+            language=lang,
+            filter_1=campaign_batch_req.filter_1,
+            filter_2=campaign_batch_req.filter_2,
+        )
+
+        configuration = None
+        if campaign_batch_req.include_configuration:
+            configuration = get_campaign_configuration(
+                campaign_code=campaign_code, lang=lang
+            )
+
+        filter_options = None
+        if campaign_batch_req.include_filter_options:
+            filter_options = campaign_service.get_filter_options()
+
+        histogram_options = None
+        if campaign_batch_req.include_histogram_options:
+            histogram_options = campaign_service.get_histogram_options()
+
+        campaigns = [
+            campaign_service.get_campaign(
+                q_code=q_code, sections=campaign_batch_req.sections
+            )
+            for q_code in q_codes
+        ]
+
+        return CampaignBatch(
+            configuration=configuration,
+            filter_options=filter_options,
+            histogram_options=histogram_options,
+            campaigns=campaigns,
+        )
+
+    # Campaign batch (computed in the compute executor)
+    campaign_batch = await compute_executor.run(get_campaign_batch)
+
+    return campaign_batch
+
+
 @router.get(
     path="/{campaign_code}/filter-options",
     response_model=FilterOptions,
     status_code=status.HTTP_200_OK,
 )
-@api_cache.cache_response
 def read_filter_options(
     _request: Request,
     campaign_code: str = Depends(dependencies.campaign_code_exists_check),
@@ -113,10 +212,131 @@ def read_filter_options(
     # Service
     campaign_service = CampaignService(campaign_code=campaign_code, language=lang)
 
-    # Filter options
-    filter_options = campaign_service.get_filter_options()
+    # Filter options (serialized)
+    filter_options_payload = campaign_service.get_filter_options_payload()
 
-    return filter_options
+    return content_encoding.create_response(
+        request=_request,
+        body=filter_options_payload.body,
+        etag=filter_options_payload.etag,
+        compressed=filter_options_payload.compressed,
+    )
+
+
+@router.post(
+    path="/{campaign_code}/facet-counts",
+    response_model=FacetCounts,
+    status_code=status.HTTP_200_OK,
+)
+async def read_facet_counts(
+    campaign_req: CampaignRequest,
+    campaign_code: str = Depends(dependencies.campaign_code_exists_check),
+    q_code: str = Depends(dependencies.q_code_check),
+    response_year: str = Depends(dependencies.response_year_check),
+):
+    """
+    Read the respondents count of each filter option for campaign, given the current filters.
+    """
+
+    filter_1 = campaign_req.filter_1
+    filter_2 = campaign_req.filter_2
+
+    def get_facet_counts() -> FacetCounts:
+        # Service
+        campaign_service = CampaignService(
+            campaign_code=campaign_code,
+            response_year=response_year,
+            filter_1=filter_1,
+            filter_2=filter_2,
+        )
+
+        return campaign_service.get_facet_counts(q_code=q_code)
+
+    # Facet counts (computed in the compute executor)
+    facet_counts = await compute_executor.run(get_facet_counts)
+
+    return facet_counts
+
+
+@router.post(
+    path="/{campaign_code}/responses",
+    response_model=ResponsesPage,
+    status_code=status.HTTP_200_OK,
+)
+async def read_responses(
+    campaign_req: CampaignRequest,
+    request: Request,
+    campaign_code: str = Depends(dependencies.campaign_code_exists_check),
+    lang: str = Depends(dependencies.language_check),
+    q_code: str = Depends(dependencies.q_code_check),
+    response_year: str = Depends(dependencies.response_year_check),
+    cursor: str = Query(default=""),
+    limit: int = Query(
+        default=constants.RESPONSES_SAMPLE_PAGE_SIZE,
+        ge=1,
+        le=constants.RESPONSES_PAGE_MAX_LIMIT,
+    ),
+):
+    """
+    Read a page of responses for campaign.
+    Use `next_cursor` of a page as `cursor` to read the next page, the first page is included in the campaign.
+    Pages with a `limit` larger than 100, or requested with `Accept: application/x-ndjson`, are streamed as
+    newline delimited JSON with the next cursor in the header `X-Next-Cursor`.
+    """
+
+    filter_1 = campaign_req.filter_1
+    filter_2 = campaign_req.filter_2
+
+    # Service
+    # Created off the event loop, filter keywords in other languages are translated with a network request
+    campaign_service = await run_in_threadpool(
+        CampaignService,
+        campaign_code=campaign_code,
+        response_year=response_year,
+        language=lang,
+        filter_1=filter_1,
+        filter_2=filter_2,
+    )
+
+    # Offset of the page
+    try:
+        offset = campaign_service.get_responses_offset(cursor=cursor)
+    except ValueError as e:
+        raise http_exceptions.BadRequestHTTPException(str(e))
+
+    # Stream large pages
+    if (
+        limit > constants.RESPONSES_PAGE_STREAMING_MIN_LIMIT
+        or "application/x-ndjson" in request.headers.get("accept", "")
+    ):
+        # Filter the responses in the compute executor, the rows are built while streaming
+        next_cursor = await compute_executor.run(
+            campaign_service.get_responses_next_cursor,
+            q_code=q_code,
+            offset=offset,
+            limit=limit,
+        )
+
+        return StreamingResponse(
+            content=campaign_service.iter_responses_ndjson(
+                q_code=q_code, offset=offset, limit=limit
+            ),
+            media_type="application/x-ndjson",
+            headers={
+                "X-Next-Cursor": next_cursor or "",
+                "Access-Control-Expose-Headers": "X-Next-Cursor",
+            },
+        )
+
+    # Responses page (computed in the compute executor)
+    responses_page = await compute_executor.run(
+        campaign_service.get_responses_page,
+        q_code=q_code,
+        offset=offset,
+        limit=limit,
+    )
+
+    return responses_page
 
 
 @router.get(
@@ -143,6 +363,83 @@ def read_histogram_options(
     return histogram_options
 
 
+def create_campaign_data_response(
+    campaign_service: CampaignService,
+    from_date: date = None,
+    to_date: date = None,
+    unique_filename_code: str = "",
+) -> StreamingResponse:
+    """
+    Create response streaming the campaign data as CSV.
+    The CSV is encoded from memory while it is sent, if caching in Cloud Storage is enabled it is streamed from the
+    cached CSV file instead if it exists, otherwise the CSV is cached after it was sent.
+    """
+
+    # Filename seen by the user
+    csv_filename = campaign_service.get_campaign_data_csv_filename(
+        from_date=from_date, to_date=to_date
+    )
+
+    headers = {
+        "Content-Type": "text/csv",
+        "Content-Disposition": f"attachment; filename={csv_filename}",
+        "Access-Control-Expose-Headers": "Content-Disposition",
+    }
+
+    # Stream directly
+    if not (settings.CLOUD_SERVICE and settings.CSV_EXPORT_CLOUD_CACHE_ENABLED):
+        return StreamingResponse(
+            content=campaign_service.iter_campaign_data_csv(
+                from_date=from_date, to_date=to_date
+            ),
+            media_type="text/csv",
+            headers=headers,
+        )
+
+    # Filename in Cloud Storage
+    storage_csv_filename = campaign_service.get_campaign_data_storage_csv_filename(
+        from_date=from_date, to_date=to_date, unique_filename_code=unique_filename_code
+    )
+
+    # Stream from Cloud Storage
+    url = campaign_service.get_campaign_data_url(
+        cloud_service=settings.CLOUD_SERVICE, csv_filename=storage_csv_filename
+    )
+    if url:
+
+        def iter_file():
+            with requests.Session() as session:
+                response = session.get(url=url, stream=True)
+                response.raise_for_status()
+                for chunk in response.iter_content(1024 * 1024):
+                    yield chunk
+
+        return StreamingResponse(
+            content=iter_file(),
+            media_type="text/csv",
+            headers=headers,
+        )
+
+    # Stream directly, save the CSV while streaming and upload it to Cloud Storage afterwards
+    csv_filepath = os.path.join(
+        tempfile.gettempdir(), f"wra_{uuid.uuid4().hex}_{storage_csv_filename}"
+    )
+
+    return StreamingResponse(
+        content=campaign_service.iter_campaign_data_csv(
+            from_date=from_date, to_date=to_date, csv_filepath=csv_filepath
+        ),
+        media_type="text/csv",
+        headers=headers,
+        background=BackgroundTask(
+            campaign_service.upload_campaign_data_csv,
+            cloud_service=settings.CLOUD_SERVICE,
+            csv_filepath=csv_filepath,
+            csv_filename=storage_csv_filename,
+        ),
+    )
+
+
 @router.post(
     path="/{campaign_code}/data/public",
     response_class=StreamingResponse,
@@ -185,26 +482,8 @@ def download_campaign_public_data(
             f"{utils.get_string_hash_value(campaign_code)}{unique_filename_code}"
         )
 
-    # Get url and filename
-    url, csv_filename = campaign_service.get_campaign_data_url_and_filename(
-        cloud_service=settings.CLOUD_SERVICE, unique_filename_code=unique_filename_code
-    )
-
-    def iter_file():
-        with requests.Session() as session:
-            response = session.get(url=url, stream=True)
-            response.raise_for_status()
-            for chunk in response.iter_content(1024 * 1024):
-                yield chunk
-
-    return StreamingResponse(
-        content=iter_file(),
-        media_type="text/csv",
-        headers={
-            "Content-Type": "text/csv",
-            "Content-Disposition": f"attachment; filename={csv_filename}",
-            "Access-Control-Expose-Headers": "Content-Disposition",
-        },
+    return create_campaign_data_response(
+        campaign_service=campaign_service, unique_filename_code=unique_filename_code
     )
 
 
@@ -256,43 +535,23 @@ def download_campaign_data(
     except ValueError as e:
         logger.warning(f"Could not parse date from date_filter: {str(e)}")
 
-    # Azure
-    if settings.CLOUD_SERVICE == "azure":
-        # Cleanup
-        azure_blob_storage_interactions.cleanup(
-            container_name=settings.AZURE_STORAGE_CONTAINER_TMP_DATA
-        )
-
-    # Google
-    elif settings.CLOUD_SERVICE == "google":
-        # Cleanup
-        google_cloud_storage_interactions.cleanup(
-            bucket_name=settings.GOOGLE_CLOUD_STORAGE_BUCKET_TMP_DATA
-        )
-
-    # Get url and filename
-    (
-        url,
-        csv_filename,
-    ) = campaign_service.get_campaign_data_url_and_filename(
-        cloud_service=settings.CLOUD_SERVICE, from_date=from_date, to_date=to_date
-    )
-
-    def iter_file():
-        with requests.Session() as session:
-            response = session.get(url=url, stream=True)
-            response.raise_for_status()
-            for chunk in response.iter_content(1024 * 1024):
-                yield chunk
-
-    return StreamingResponse(
-        content=iter_file(),
-        media_type="text/csv",
-        headers={
-            "Content-Type": "text/csv",
-            "Content-Disposition": f"attachment; filename={csv_filename}",
-            "Access-Control-Expose-Headers": "Content-Disposition",
-        },
+    if settings.CSV_EXPORT_CLOUD_CACHE_ENABLED:
+        # Azure
+        if settings.CLOUD_SERVICE == "azure":
+            # Cleanup
+            azure_blob_storage_interactions.cleanup(
+                container_name=settings.AZURE_STORAGE_CONTAINER_TMP_DATA
+            )
+
+        # Google
+        elif settings.CLOUD_SERVICE == "google":
+            # Cleanup
+            google_cloud_storage_interactions.cleanup(
+                bucket_name=settings.GOOGLE_CLOUD_STORAGE_BUCKET_TMP_DATA
+            )
+
+    return create_campaign_data_response(
+        campaign_service=campaign_service, from_date=from_date, to_date=to_date
     )
 
 
@@ -316,7 +575,9 @@ async def download_campaign_countries_breakdown(
     df = campaign_crud.get_dataframe()
 
     # Countries breakdown
-    df = pd.DataFrame({"count": df.groupby(["canonical_country"]).size()}).reset_index()
+    df = pd.DataFrame(
+        {"count": df.groupby(["canonical_country"], observed=True).size()}
+    ).reset_index()
 
     # Sort
     df = df.sort_values(by="count", ascending=False)
@@ -359,7 +620,9 @@ async def download_campaign_source_files_breakdown(
     df = campaign_crud.get_dataframe()
 
     # Source files breakdown
-    df = pd.DataFrame({"count": df.groupby(["data_source"]).size()}).reset_index()
+    df = pd.DataFrame(
+        {"count": df.groupby(["data_source"], observed=True).size()}
+    ).reset_index()
 
     # Sort
     df = df.sort_values(by="count", ascending=False)
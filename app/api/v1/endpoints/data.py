@@ -28,6 +28,7 @@ import logging
 from fastapi import APIRouter, BackgroundTasks, Depends, status
 
 from app import global_variables
+from app import prefork
 from app.api import dependencies
 from app.helpers import data_loader
 from app.logginglib import init_custom_logger
@@ -63,6 +64,12 @@ def init_data_reloading(
 ):
     """Init data reloading"""
 
+    # The prefork launcher reloads data and replaces the workers
+    if global_variables.is_prefork_worker:
+        prefork.request_reload()
+
+        return
+
     if not global_variables.is_loading_data:
         try:
             background_tasks.add_task(data_loader.reload_data, True)
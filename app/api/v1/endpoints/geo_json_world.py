@@ -23,26 +23,34 @@ SOFTWARE.
 
 """
 
-import json
 import logging
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 
+from app.enums.geometry_resolution import GeometryResolution
 from app.logginglib import init_custom_logger
+from app.services.geometry import Geometry
 
 logger = logging.getLogger(__name__)
 init_custom_logger(logger)
 
 router = APIRouter(prefix="/geo-json-world")
 
+geometry = Geometry()
+
 
 @router.get(
     path="",
     status_code=status.HTTP_200_OK,
 )
-def read_geo_json_world():
-    """Read GeoJSON world"""
-
-    # Source credit: https://raw.githubusercontent.com/holtzy/D3-graph-gallery/master/DATA/world.geojson
-    with open("geo_json_world.json", "r", encoding="utf-8") as file:
-        return json.loads(file.read())
+def read_geo_json_world(
+    request: Request, resolution: GeometryResolution = GeometryResolution.full
+):
+    """
+    Read GeoJSON world.
+    Use the query parameter `resolution` to get simplified geometry with less precise coordinates.
+    """
+
+    return geometry.get_response(
+        request=request, name="geo_json_world", resolution=resolution
+    )
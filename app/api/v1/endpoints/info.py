@@ -26,6 +26,8 @@ SOFTWARE.
 from fastapi import APIRouter, status
 
 from app.core.settings import get_settings
+from app.services.api_cache import ApiCache
+from app.services.compute_executor import ComputeExecutor
 
 settings = get_settings()
 
@@ -35,3 +37,13 @@ router = APIRouter(prefix="/info")
 @router.get(path="/version", status_code=status.HTTP_200_OK)
 def show_version():
     return {"version": settings.VERSION}
+
+
+@router.get(path="/api-cache", status_code=status.HTTP_200_OK)
+def show_api_cache_stats():
+    return ApiCache().get_stats()
+
+
+@router.get(path="/compute-executor", status_code=status.HTTP_200_OK)
+def show_compute_executor_stats():
+    return ComputeExecutor().get_stats()
@@ -23,30 +23,40 @@ SOFTWARE.
 
 """
 
-import json
 import logging
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Request, status
 
+from app.enums.geometry_resolution import GeometryResolution
 from app.http_exceptions import ResourceNotFoundHTTPException
 from app.logginglib import init_custom_logger
+from app.services.geometry import Geometry
 
 logger = logging.getLogger(__name__)
 init_custom_logger(logger)
 
 router = APIRouter(prefix="/topo-json")
 
+geometry = Geometry()
+
 
 @router.get(
     path="/{alpha2_code}",
     status_code=status.HTTP_200_OK,
 )
-def read_topo_json(alpha2_code: str):
-    """Read TopoJSON"""
+def read_topo_json(
+    request: Request,
+    alpha2_code: str,
+    resolution: GeometryResolution = GeometryResolution.full,
+):
+    """
+    Read TopoJSON.
+    Use the query parameter `resolution` to get simplified geometry with less precise coordinates.
+    """
 
     if alpha2_code.lower() == "mx":
-        # Source credit: https://gist.githubusercontent.com/diegovalle/5129746/raw/c1c35e439b1d5e688bca20b79f0e53a1fc12bf9e/mx_tj.json
-        with open("topo_json_mx.json", "r", encoding="utf-8") as file:
-            return json.loads(file.read())
+        return geometry.get_response(
+            request=request, name="topo_json_mx", resolution=resolution
+        )
 
     raise ResourceNotFoundHTTPException("No TopoJSON found for country.")
@@ -318,4 +318,7 @@ TRANSLATIONS_JSON = "translations.json"
 ACCESS_TOKEN_EXPIRE_DAYS = 30
 N_WORDCLOUD_WORDS = 100
 N_TOP_WORDS = 20
-N_RESPONSES_SAMPLE = 1000
+RESPONSES_SAMPLE_PAGE_SIZE = 10
+N_RESPONSES_SAMPLE_NOT_ENGLISH = 100
+RESPONSES_PAGE_MAX_LIMIT = 10000
+RESPONSES_PAGE_STREAMING_MIN_LIMIT = 100
@@ -0,0 +1,95 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.settings import get_settings
+from app.helpers import content_encoding
+
+settings = get_settings()
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with gzip or brotli depending on the Accept-Encoding header.
+    Responses that already have a content encoding (e.g. precompressed responses from the API cache), and streaming
+    responses, are sent as they are.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = content_encoding.get_accepted_encoding(
+            Headers(scope=scope).get("accept-encoding")
+        )
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        initial_message: Message = {}
+        started = False
+
+        async def send_compressed(message: Message):
+            nonlocal initial_message, started
+
+            if message["type"] == "http.response.start":
+                # Wait for the body before sending the headers
+                initial_message = message
+                return
+
+            if message["type"] != "http.response.body" or started:
+                await send(message)
+                return
+
+            started = True
+            headers = MutableHeaders(raw=initial_message["headers"])
+            body = message.get("body", b"")
+            if (
+                "content-encoding" not in headers
+                and not message.get("more_body", False)
+                and len(body) >= settings.COMPRESSION_MINIMUM_SIZE
+            ):
+                if len(body) >= settings.COMPRESSION_THREADPOOL_MINIMUM_SIZE:
+                    # Do not block the event loop while compressing large bodies
+                    body = await run_in_threadpool(
+                        content_encoding.compress, body, encoding, True
+                    )
+                else:
+                    body = content_encoding.compress(body, encoding, dynamic=True)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                headers.add_vary_header("Accept-Encoding")
+                message["body"] = body
+
+            await send(initial_message)
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -44,6 +44,25 @@ CLOUD_SERVICE = os.getenv("CLOUD_SERVICE", "").lower()
 if CLOUD_SERVICE and CLOUD_SERVICE not in ["google", "azure"]:
     raise Exception(f"Invalid cloud service: {CLOUD_SERVICE}.")
 
+# Check campaign sections executor
+CAMPAIGN_SECTIONS_EXECUTOR = os.getenv(
+    "CAMPAIGN_SECTIONS_EXECUTOR", "sequential"
+).lower()
+if CAMPAIGN_SECTIONS_EXECUTOR not in ["sequential", "thread"]:
+    raise Exception(
+        f"Invalid campaign sections executor: {CAMPAIGN_SECTIONS_EXECUTOR}."
+    )
+
+# Check API cache backend
+API_CACHE_BACKEND = os.getenv("API_CACHE_BACKEND", "").lower()
+if API_CACHE_BACKEND and API_CACHE_BACKEND not in ["disk", "redis"]:
+    raise Exception(f"Invalid API cache backend: {API_CACHE_BACKEND}.")
+
+# Check workers mode
+WORKERS_MODE = os.getenv("WORKERS_MODE", "snapshots").lower()
+if WORKERS_MODE not in ["snapshots", "prefork"]:
+    raise Exception(f"Invalid workers mode: {WORKERS_MODE}.")
+
 # Allow origins
 ALLOW_ORIGINS = os.getenv("ALLOW_ORIGINS", "").split(" ")
 ALLOW_ORIGINS = list(filter(None, ALLOW_ORIGINS))
@@ -67,6 +86,50 @@ class Settings(BaseSettings):
     NEWRELIC_API_KEY: str = os.getenv("NEWRELIC_API_KEY")
     NEW_RELIC_URL: str = os.getenv("NEW_RELIC_URL")
     CLOUD_SERVICE: str = CLOUD_SERVICE
+    CAMPAIGN_SECTIONS_EXECUTOR: str = CAMPAIGN_SECTIONS_EXECUTOR
+    CAMPAIGN_SECTIONS_WORKERS: int = int(
+        os.getenv("CAMPAIGN_SECTIONS_WORKERS", os.cpu_count() or 1)
+    )
+    COMPUTE_WORKERS: int = int(os.getenv("COMPUTE_WORKERS", os.cpu_count() or 1))
+    COMPUTE_QUEUE_SIZE: int = int(os.getenv("COMPUTE_QUEUE_SIZE", 16))
+    COMPUTE_TIMEOUT_SECONDS: float = float(os.getenv("COMPUTE_TIMEOUT_SECONDS", 30))
+    COMPRESSION_GZIP_LEVEL: int = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_QUALITY: int = int(os.getenv("COMPRESSION_BROTLI_QUALITY", 5))
+    COMPRESSION_BROTLI_DYNAMIC_QUALITY: int = int(
+        os.getenv("COMPRESSION_BROTLI_DYNAMIC_QUALITY", 4)
+    )
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1000))
+    COMPRESSION_THREADPOOL_MINIMUM_SIZE: int = int(
+        os.getenv("COMPRESSION_THREADPOOL_MINIMUM_SIZE", 32 * 1024)
+    )
+    CSV_EXPORT_CLOUD_CACHE_ENABLED: bool = (
+        os.getenv("CSV_EXPORT_CLOUD_CACHE_ENABLED", "").lower() == "true"
+    )
+    ACCESS_LOG_FILEPATH: str = os.getenv("ACCESS_LOG_FILEPATH", "access_log.jsonl")
+    API_CACHE_WARM_UP_MAX_REQUESTS: int = int(
+        os.getenv("API_CACHE_WARM_UP_MAX_REQUESTS", 50)
+    )
+    API_CACHE_WARM_UP_TIME_BUDGET_SECONDS: float = float(
+        os.getenv("API_CACHE_WARM_UP_TIME_BUDGET_SECONDS", 120)
+    )
+    API_CACHE_WARM_UP_CPU_FRACTION: float = float(
+        os.getenv("API_CACHE_WARM_UP_CPU_FRACTION", 0.25)
+    )
+    WORKERS: int = int(os.getenv("WORKERS", 1))
+    WORKERS_MODE: str = WORKERS_MODE
+    CAMPAIGN_SNAPSHOTS_DIRECTORY: str = os.getenv(
+        "CAMPAIGN_SNAPSHOTS_DIRECTORY", "campaign_snapshots"
+    )
+    API_CACHE_MAX_BYTES: int = int(os.getenv("API_CACHE_MAX_BYTES", 256 * 1024**2))
+    API_CACHE_TTL_SECONDS: int = int(os.getenv("API_CACHE_TTL_SECONDS", 0))
+    API_CACHE_BACKEND: str = API_CACHE_BACKEND
+    API_CACHE_DISK_DIRECTORY: str = os.getenv("API_CACHE_DISK_DIRECTORY", "api_cache")
+    API_CACHE_DISK_MAX_BYTES: int = int(
+        os.getenv("API_CACHE_DISK_MAX_BYTES", 1024**3)
+    )
+    API_CACHE_REDIS_URL: str = os.getenv(
+        "API_CACHE_REDIS_URL", "redis://localhost:6379/0"
+    )
 
     # Google
     GOOGLE_CLOUD_STORAGE_BUCKET_FILE: str = os.getenv(
@@ -88,6 +151,10 @@ class Settings(BaseSettings):
 
     # Only for legacy campaigns
     GOOGLE_MAPS_API_KEY: str = os.getenv("GOOGLE_MAPS_API_KEY")
+    REGION_COORDINATES_JSON: str = os.getenv(
+        "REGION_COORDINATES_JSON", "region_coordinates.json"
+    )
+    REGION_GEOCODER_BATCH_SIZE: int = int(os.getenv("REGION_GEOCODER_BATCH_SIZE", 25))
 
 
 class DevSettings(Settings):
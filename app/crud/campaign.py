@@ -23,21 +23,35 @@ SOFTWARE.
 
 """
 
-import copy
+from typing import Mapping
 
-import inflect
+import numpy as np
 from pandas import DataFrame
 
 from app import databases, utils
 from app.databases import Database
 from app.enums.legacy_campaign_code import LegacyCampaignCode
 from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
+from app.helpers.content_encoding import EncodedPayload
+from app.helpers.frozen_dict import FrozenDict
+from app.helpers.ngram_table import NgramTable
 from app.schemas.category import ParentCategory
 from app.schemas.country import Country
 from app.schemas.region import Region
 from app.schemas.response_column import ResponseSampleColumn
 
-inflect_engine = inflect.engine()
+
+def sort_by_first_occurring_numbers(values: list[str]) -> tuple[str, ...]:
+    """Sort non-empty values by the first occurring numbers e.g. ages or age buckets"""
+
+    return tuple(
+        sorted(
+            [x for x in values if x],
+            key=lambda x: utils.extract_first_occurring_numbers(
+                value=x, first_less_than_symbol_to_0=True
+            ),
+        )
+    )
 
 
 class Campaign:
@@ -61,138 +75,64 @@ class Campaign:
 
         self.__campaign_config = CAMPAIGNS_CONFIG.get(campaign_code)
 
-    def get_countries_list(self) -> list[Country]:
-        """Get countries list"""
-
-        countries = self.__db.countries
-        if countries:
-            countries = [x.copy(deep=True) for x in list(countries.values()) if x]
-            countries = sorted(countries, key=lambda x: x.name)
-
-            return countries
+    def get_countries_list(self) -> tuple[Country, ...]:
+        """Get countries list (sorted by name, read-only)"""
 
-        return []
-
-    def get_countries_dict(self) -> dict[str, Country]:
-        """Get countries dict"""
+        return self.__db.countries_list
 
-        countries = self.__db.countries
-        if countries:
-            return {k: v.copy(deep=True) for k, v in countries.items()}
+    def get_countries_dict(self) -> Mapping[str, Country]:
+        """Get countries dict (read-only)"""
 
-        return {}
+        return self.__db.countries
 
-    def get_country_regions(self, country_alpha2_code: str) -> list[Region]:
-        """Get country regions"""
+    def get_country_regions(self, country_alpha2_code: str) -> tuple[Region, ...]:
+        """Get country regions (sorted by name, read-only)"""
 
-        countries = self.__db.countries
-        country = countries.get(country_alpha2_code)
+        country = self.__db.countries.get(country_alpha2_code)
         if country:
-            return [x.copy() for x in country.regions if x]
+            return country.regions
 
-        return []
+        return ()
 
-    def get_q_codes(self) -> list[str]:
+    def get_q_codes(self) -> tuple[str, ...]:
         """Get q codes"""
 
-        q_codes = copy.copy(self.__db.q_codes)
-
-        return q_codes
-
-    def get_response_years(self) -> list[str]:
-        """Get response years"""
+        return self.__db.q_codes
 
-        response_years = copy.copy(self.__db.response_years)
-        response_years = sorted(response_years, key=lambda x: x)
+    def get_response_years(self) -> tuple[str, ...]:
+        """Get response years (sorted)"""
 
-        return response_years
+        return self.__db.response_years
 
-    def get_ages(self) -> list[str]:
-        """Get ages"""
+    def get_ages(self) -> tuple[str, ...]:
+        """Get ages (sorted)"""
 
-        ages = self.__db.ages
-        if ages:
-            ages = [x for x in ages if x]
-            ages = sorted(
-                ages,
-                key=lambda x: utils.extract_first_occurring_numbers(
-                    value=x, first_less_than_symbol_to_0=True
-                ),
-            )
+        return self.__db.ages
 
-            return ages
+    def get_age_buckets(self) -> tuple[str, ...]:
+        """Get age buckets (sorted)"""
 
-        return []
-
-    def get_age_buckets(self) -> list[str]:
-        """Get age buckets"""
-
-        age_buckets = self.__db.age_buckets
-        if age_buckets:
-            age_buckets = [x for x in age_buckets if x]
-            age_buckets = sorted(
-                age_buckets,
-                key=lambda x: utils.extract_first_occurring_numbers(
-                    value=x, first_less_than_symbol_to_0=True
-                ),
-            )
-
-            return age_buckets
-
-        return []
-
-    def get_age_buckets_default(self) -> list[str]:
-        """Get age buckets default"""
+        return self.__db.age_buckets
 
-        age_buckets_default = self.__db.age_buckets_default
-        if age_buckets_default:
-            age_buckets_default = [x for x in age_buckets_default if x]
-            age_buckets_default = sorted(
-                age_buckets_default,
-                key=lambda x: utils.extract_first_occurring_numbers(
-                    value=x, first_less_than_symbol_to_0=True
-                ),
-            )
+    def get_age_buckets_default(self) -> tuple[str, ...]:
+        """Get age buckets default (sorted)"""
 
-            return age_buckets_default
+        return self.__db.age_buckets_default
 
-        return []
+    def get_genders(self) -> tuple[str, ...]:
+        """Get genders (sorted)"""
 
-    def get_genders(self) -> list[str]:
-        """Get genders"""
+        return self.__db.genders
 
-        genders = self.__db.genders
-        if genders:
-            genders = [x for x in genders if x]
-            genders = sorted(genders, key=lambda x: x)
+    def get_living_settings(self) -> tuple[str, ...]:
+        """Get living settings (sorted)"""
 
-            return genders
-
-        return []
+        return self.__db.living_settings
 
-    def get_living_settings(self) -> list[str]:
-        """Get living settings"""
+    def get_professions(self) -> tuple[str, ...]:
+        """Get professions (sorted)"""
 
-        living_settings = self.__db.living_settings
-        if living_settings:
-            living_settings = [x for x in living_settings if x]
-            living_settings = sorted(living_settings, key=lambda x: x)
-
-            return living_settings
-
-        return []
-
-    def get_professions(self) -> list[str]:
-        """Get professions"""
-
-        professions = self.__db.professions
-        if professions:
-            professions = [x for x in professions if x]
-            professions = sorted(professions, key=lambda x: x)
-
-            return professions
-
-        return []
+        return self.__db.professions
 
     def get_responses_sample_columns(self) -> list[ResponseSampleColumn]:
         """Get responses sample columns"""
@@ -217,7 +157,7 @@ class Campaign:
 
         respondent_noun = self.__db.respondent_noun_singular
         if respondent_noun:
-            respondent_noun_plural = inflect_engine.plural(respondent_noun)
+            respondent_noun_plural = utils.get_plural(respondent_noun)
 
             return respondent_noun_plural
 
@@ -230,6 +170,76 @@ class Campaign:
 
         return dataframe.copy()
 
+    def get_rows_count(self) -> int:
+        """Get rows count"""
+
+        return len(self.__db.dataframe.index)
+
+    def get_column_values(self, column_name: str, rows: np.ndarray) -> np.ndarray:
+        """
+        Get the values of a dataframe column at rows.
+        Only the values at rows are built, the column can be categorical (e.g. in a memory-mapped snapshot).
+        """
+
+        return np.asarray(self.__db.dataframe[column_name].array.take(rows))
+
+    def get_responses_sample_rows(
+        self, q_code: str, canonical_code_col_name: str
+    ) -> np.ndarray:
+        """Get ids of rows with a non-empty response and canonical code, in a seeded random order"""
+
+        responses_sample_rows = self.__db.responses_sample_rows.get(q_code)
+        if responses_sample_rows:
+            rows = responses_sample_rows.get(canonical_code_col_name)
+            if rows is not None:
+                return rows
+
+        return np.empty(0, dtype=np.int64)
+
+    def get_dimension_codes(
+        self, column_names: tuple[str, ...]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Get the code of each row and the labels of the codes for one or more columns"""
+
+        dimension_codes = self.__db.dimension_codes.get(column_names)
+        if dimension_codes:
+            return dimension_codes
+
+        return np.full(self.get_rows_count(), -1, dtype=np.int64), np.empty(
+            0, dtype=object
+        )
+
+    def get_category_codes(
+        self, column_name: str
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Get the row id and code of each category in a column, and the labels of the codes"""
+
+        category_codes = self.__db.category_codes.get(column_name)
+        if category_codes:
+            return category_codes
+
+        return (
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=object),
+        )
+
+    def get_age_values(self, column_name: str) -> np.ndarray:
+        """Get the numeric ages of all rows in an age column (NaN if not numeric)"""
+
+        age_values = self.__db.age_values.get(column_name)
+        if age_values is not None:
+            return age_values
+
+        return np.full(self.get_rows_count(), np.nan)
+
+    def get_filter_options_payload(self, language: str) -> EncodedPayload | None:
+        """Get serialized filter options"""
+
+        return self.__db.filter_options_payloads.get(
+            f"{self.__campaign_config.campaign_code}:{language}"
+        )
+
     def get_parent_categories(self) -> list[ParentCategory]:
         """Get parent categories"""
 
@@ -247,70 +257,120 @@ class Campaign:
 
         return []
 
-    def get_ngrams_unfiltered(self, q_code: str) -> tuple:
-        """Get ngrams unfiltered"""
+    def get_ngrams_unfiltered(
+        self, q_code: str
+    ) -> tuple[NgramTable, NgramTable, NgramTable]:
+        """Get ngrams unfiltered (unigram, bigram and trigram tables, read-only)"""
 
         ngrams_unfiltered = self.__db.ngrams_unfiltered.get(q_code)
+        if ngrams_unfiltered:
+            return ngrams_unfiltered
 
-        if not ngrams_unfiltered:
-            return ()
+        empty_table = NgramTable.from_counts(ngram_counts={})
 
-        unigram_count_dict = ngrams_unfiltered.get("unigram")
-        bigram_count_dict = ngrams_unfiltered.get("bigram")
-        trigram_count_dict = ngrams_unfiltered.get("trigram")
-
-        return (
-            unigram_count_dict.copy(),
-            bigram_count_dict.copy(),
-            trigram_count_dict.copy(),
-        )
+        return empty_table, empty_table, empty_table
 
     def set_ngrams_unfiltered(
         self, ngrams_unfiltered: dict[str, dict[str, int]], q_code: str
     ):
         """Set ngrams unfiltered"""
 
-        self.__db.ngrams_unfiltered[q_code] = ngrams_unfiltered
+        self.__db.ngrams_unfiltered[q_code] = NgramTable.create_tables(
+            ngram_counts_list=[
+                ngrams_unfiltered.get("unigram"),
+                ngrams_unfiltered.get("bigram"),
+                ngrams_unfiltered.get("trigram"),
+            ]
+        )
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Get the amount of bytes used by the campaign data"""
+
+        return self.__db.get_memory_usage()
+
+    def set_responses_sample_rows(
+        self, responses_sample_rows: dict[str, dict[str, np.ndarray]]
+    ):
+        """Set responses sample rows"""
+
+        self.__db.responses_sample_rows = responses_sample_rows
+
+    def set_dimension_codes(
+        self, dimension_codes: dict[tuple[str, ...], tuple[np.ndarray, np.ndarray]]
+    ):
+        """Set dimension codes"""
+
+        self.__db.dimension_codes = dimension_codes
+
+    def set_category_codes(
+        self, category_codes: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]]
+    ):
+        """Set category codes"""
+
+        self.__db.category_codes = category_codes
+
+    def set_age_values(self, age_values: dict[str, np.ndarray]):
+        """Set age values"""
+
+        self.__db.age_values = age_values
+
+    def set_filter_options_payload(self, language: str, payload: EncodedPayload):
+        """Set serialized filter options"""
+
+        # Key includes the campaign code, campaigns can share a db e.g. dataexchange and allcampaigns
+        self.__db.filter_options_payloads[
+            f"{self.__campaign_config.campaign_code}:{language}"
+        ] = payload
+
+    def clear_filter_options_payloads(self):
+        """Clear serialized filter options"""
+
+        self.__db.filter_options_payloads = {}
 
     def set_response_years(self, response_years: list[str]):
         """Set response years"""
 
-        self.__db.response_years = response_years
+        self.__db.response_years = tuple(sorted(response_years))
 
     def set_ages(self, ages: list[str]):
         """Set ages"""
 
-        self.__db.ages = ages
+        self.__db.ages = sort_by_first_occurring_numbers(values=ages)
 
     def set_age_buckets(self, age_buckets: list[str]):
         """Set age buckets"""
 
-        self.__db.age_buckets = age_buckets
+        self.__db.age_buckets = sort_by_first_occurring_numbers(values=age_buckets)
 
     def set_age_buckets_default(self, age_buckets_default: list[str]):
         """Set age buckets default"""
 
-        self.__db.age_buckets_default = age_buckets_default
+        self.__db.age_buckets_default = sort_by_first_occurring_numbers(
+            values=age_buckets_default
+        )
 
     def set_countries(self, countries: dict[str, Country]):
         """Set countries"""
 
-        self.__db.countries = countries
+        self.__db.countries = FrozenDict(countries)
+        self.__db.countries_list = tuple(
+            sorted([x for x in countries.values() if x], key=lambda x: x.name)
+        )
 
     def set_genders(self, genders: list[str]):
         """Set genders"""
 
-        self.__db.genders = genders
+        self.__db.genders = tuple(sorted([x for x in genders if x]))
 
     def set_living_settings(self, living_settings: list[str]):
         """Set living settings"""
 
-        self.__db.living_settings = living_settings
+        self.__db.living_settings = tuple(sorted([x for x in living_settings if x]))
 
     def set_professions(self, professions: list[str]):
         """Set professions"""
 
-        self.__db.professions = professions
+        self.__db.professions = tuple(sorted([x for x in professions if x]))
 
     def set_dataframe(self, df: DataFrame):
         """Set dataframe"""
@@ -320,4 +380,14 @@ class Campaign:
     def set_q_codes(self, q_codes: list[str]):
         """Set q codes"""
 
-        self.__db.q_codes = q_codes
+        self.__db.q_codes = tuple(q_codes)
+
+    def get_version(self) -> str:
+        """Get version of the campaign data"""
+
+        return self.__db.version
+
+    def set_version(self, version: str):
+        """Set version of the campaign data"""
+
+        self.__db.version = version
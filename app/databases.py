@@ -25,12 +25,15 @@ SOFTWARE.
 
 import os
 
+import numpy as np
 from pandas import DataFrame
-from pydantic import BaseModel
 
 from app.core.settings import get_settings
 from app.enums.legacy_campaign_code import LegacyCampaignCode
 from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
+from app.helpers.content_encoding import EncodedPayload
+from app.helpers.frozen_dict import FrozenDict
+from app.helpers.ngram_table import NgramTable
 from app.schemas.category import ParentCategory
 from app.schemas.country import Country
 from app.schemas.response_column import ResponseSampleColumn
@@ -39,49 +42,117 @@ from app.schemas.user import UserInternal
 settings = get_settings()
 
 
-class Database(BaseModel):
+class Database:
     """
     Stores data related to a campaign in memory.
+    Snapshot of a campaign's data, lookup tables are stored as tuples and arrays.
     """
 
-    dataframe: DataFrame = DataFrame(
-        columns=[
-            "q1_response",
-            "q1_canonical_code",
-            "q1_lemmatized",
-            "q1_parent_category",
-            "canonical_country",
-            "alpha2country",
-            "region",
-            "province",
-            "age",
-            "age_bucket",
-            "age_bucket_default",
-            "gender",
-            "ingestion_time",
-            "data_source",
-            "profession",
-            "setting",
-            "response_year",
-        ]
-    )  # A dummy empty dataframe with possible column names
-    q_codes: list[str] = []
-    response_years: list[str] = []
-    respondent_noun_singular: str
-    countries: dict[str, Country] = {}
-    genders: list[str] = []
-    living_settings: list[str] = []
-    professions: list[str] = []
-    ages: list[str] = []
-    age_buckets: list[str] = []
-    age_buckets_default: list[str] = []
-    responses_sample_columns: list[ResponseSampleColumn]
-    parent_categories: list[ParentCategory]
-    ngrams_unfiltered: dict[str, dict[str, dict[str, int]]] = {}
-    user: UserInternal | None = None
-
-    class Config:
-        arbitrary_types_allowed = True
+    __slots__ = (
+        "dataframe",
+        "q_codes",
+        "response_years",
+        "respondent_noun_singular",
+        "countries",
+        "countries_list",
+        "genders",
+        "living_settings",
+        "professions",
+        "ages",
+        "age_buckets",
+        "age_buckets_default",
+        "responses_sample_columns",
+        "parent_categories",
+        "ngrams_unfiltered",
+        "responses_sample_rows",
+        "dimension_codes",
+        "category_codes",
+        "age_values",
+        "filter_options_payloads",
+        "user",
+        "version",
+    )
+
+    def __init__(
+        self,
+        respondent_noun_singular: str,
+        responses_sample_columns: list[ResponseSampleColumn],
+        parent_categories: list[ParentCategory],
+        user: UserInternal | None = None,
+    ):
+        # A dummy empty dataframe with possible column names
+        self.dataframe: DataFrame = DataFrame(
+            columns=[
+                "q1_response",
+                "q1_canonical_code",
+                "q1_lemmatized",
+                "q1_parent_category",
+                "canonical_country",
+                "alpha2country",
+                "region",
+                "province",
+                "age",
+                "age_bucket",
+                "age_bucket_default",
+                "gender",
+                "ingestion_time",
+                "data_source",
+                "profession",
+                "setting",
+                "response_year",
+            ]
+        )
+        self.q_codes: tuple[str, ...] = ()
+        self.response_years: tuple[str, ...] = ()
+        self.respondent_noun_singular = respondent_noun_singular
+        self.countries: FrozenDict = FrozenDict()
+        self.countries_list: tuple[Country, ...] = ()
+        self.genders: tuple[str, ...] = ()
+        self.living_settings: tuple[str, ...] = ()
+        self.professions: tuple[str, ...] = ()
+        self.ages: tuple[str, ...] = ()
+        self.age_buckets: tuple[str, ...] = ()
+        self.age_buckets_default: tuple[str, ...] = ()
+        self.responses_sample_columns = responses_sample_columns
+        self.parent_categories = parent_categories
+        self.ngrams_unfiltered: dict[
+            str, tuple[NgramTable, NgramTable, NgramTable]
+        ] = {}
+        self.responses_sample_rows: dict[str, dict[str, np.ndarray]] = {}
+        self.dimension_codes: dict[tuple[str, ...], tuple[np.ndarray, np.ndarray]] = {}
+        self.category_codes: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self.age_values: dict[str, np.ndarray] = {}
+        self.filter_options_payloads: dict[str, EncodedPayload] = {}
+        self.user = user
+
+        # Hash of the dataframe, identifies the data of the campaign across processes
+        self.version = ""
+
+    def get_memory_usage(self) -> dict[str, int]:
+        """Get the amount of bytes used by the dataframe and the lookup tables"""
+
+        def arrays_nbytes(arrays) -> int:
+            return sum(x.nbytes for x in arrays)
+
+        return {
+            "dataframe": int(self.dataframe.memory_usage(deep=True).sum()),
+            "ngrams_unfiltered": NgramTable.get_tables_memory_usage(
+                tables=[x for tables in self.ngrams_unfiltered.values() for x in tables]
+            ),
+            "responses_sample_rows": sum(
+                arrays_nbytes(x.values()) for x in self.responses_sample_rows.values()
+            ),
+            "dimension_codes": sum(
+                arrays_nbytes(x) for x in self.dimension_codes.values()
+            ),
+            "category_codes": sum(
+                arrays_nbytes(x) for x in self.category_codes.values()
+            ),
+            "age_values": arrays_nbytes(self.age_values.values()),
+            "filter_options_payloads": sum(
+                x.get_size() for x in self.filter_options_payloads.values()
+            ),
+        }
 
 
 databases_dict: dict[str, Database] = {}
@@ -27,4 +27,10 @@ SOFTWARE.
 region_coordinates: dict = {}
 
 is_loading_data = False
+
+# Incremented when an API cache warm-up starts, a running warm-up stops when a newer one starts
+api_cache_warm_up_id = 0
 initial_loading_data_complete = False
+
+# Set in worker processes forked by the prefork launcher
+is_prefork_worker = False
@@ -0,0 +1,153 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import gzip
+import hashlib
+
+import brotli
+from fastapi import Request, Response, status
+
+from app.core.settings import get_settings
+
+settings = get_settings()
+
+# Supported content encodings, in order of preference
+ENCODINGS = ("br", "gzip")
+
+
+def compress(body: bytes, encoding: str, dynamic: bool = False) -> bytes:
+    """
+    Compress body with the content encoding.
+    Dynamic bodies are compressed once per response, brotli uses a lower quality for them.
+    """
+
+    if encoding == "br":
+        if dynamic:
+            quality = settings.COMPRESSION_BROTLI_DYNAMIC_QUALITY
+        else:
+            quality = settings.COMPRESSION_BROTLI_QUALITY
+
+        return brotli.compress(body, quality=quality)
+    elif encoding == "gzip":
+        return gzip.compress(
+            body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+        )
+
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def compress_variants(body: bytes) -> dict[str, bytes]:
+    """Compress body with each supported content encoding, small bodies are not compressed"""
+
+    if len(body) < settings.COMPRESSION_MINIMUM_SIZE:
+        return {}
+
+    return {encoding: compress(body, encoding) for encoding in ENCODINGS}
+
+
+class EncodedPayload:
+    """An encoded response body, its ETag and its compressed variants"""
+
+    __slots__ = ("body", "etag", "compressed")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()}"'
+        self.compressed = compress_variants(body)
+
+    def get_size(self) -> int:
+        """Get the amount of bytes of the body and its compressed variants"""
+
+        return len(self.body) + sum(len(x) for x in self.compressed.values())
+
+
+def get_accepted_encoding(accept_encoding: str | None) -> str | None:
+    """Get the preferred supported content encoding from the Accept-Encoding header"""
+
+    if not accept_encoding:
+        return None
+
+    # Quality of each encoding accepted by the client
+    qualities: dict[str, float] = {}
+    for value in accept_encoding.split(","):
+        encoding, _, params = value.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[encoding.strip().lower()] = quality
+
+    wildcard_quality = qualities.get("*", 0.0)
+    accepted = [
+        (qualities.get(encoding, wildcard_quality), -index, encoding)
+        for index, encoding in enumerate(ENCODINGS)
+    ]
+    quality, _, encoding = max(accepted)
+    if quality <= 0:
+        return None
+
+    return encoding
+
+
+def create_response(
+    request: Request | None,
+    body: bytes,
+    etag: str,
+    compressed: dict[str, bytes],
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Create response from an encoded body, or a 304 response if the client already has the current version.
+    The body is compressed with the content encoding preferred by the client if a compressed variant exists.
+    """
+
+    headers = dict(headers) if headers else {}
+
+    if request and compressed:
+        headers["Vary"] = "Accept-Encoding"
+        encoding = get_accepted_encoding(request.headers.get("accept-encoding"))
+        if encoding:
+            body = compressed[encoding]
+
+            # Each variant has its own ETag
+            etag = f'{etag[:-1]}-{encoding}"'
+            headers["Content-Encoding"] = encoding
+
+    headers["ETag"] = etag
+
+    if request:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            etags = [x.strip().removeprefix("W/") for x in if_none_match.split(",")]
+            if "*" in etags or etag in etags:
+                headers.pop("Content-Encoding", None)
+
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,57 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import base64
+import binascii
+
+
+def encode_cursor(offset: int, version: str) -> str:
+    """
+    Encode the offset of a page as an opaque cursor.
+    The version of the data is included, a cursor is not valid after the data changed.
+    """
+
+    return (
+        base64.urlsafe_b64encode(f"{version[:12]}:{offset}".encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+def decode_cursor(cursor: str, version: str) -> int:
+    """Decode the offset of a page from a cursor, raise ValueError if the cursor is invalid or expired"""
+
+    try:
+        value = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError):
+        raise ValueError("Invalid cursor.")
+
+    cursor_version, _, offset = value.rpartition(":")
+    if not offset.isdigit():
+        raise ValueError("Invalid cursor.")
+    if cursor_version != version[:12]:
+        raise ValueError("Cursor expired, the data has changed.")
+
+    return int(offset)
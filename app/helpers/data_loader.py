@@ -23,33 +23,43 @@ SOFTWARE.
 
 """
 
+import asyncio
 import copy
-import json
 import logging
 import math
+import os
+import threading
+import time
 from io import StringIO
 
+import numpy as np
 import pandas as pd
 import requests
 from fastapi import Request
 
 from app import constants, databases, utils
+from app.api import dependencies
 from app import crud
 from app import global_variables
 from app.api.v1.endpoints.campaigns import read_campaign
+from app.api.v1.endpoints.campaigns import router as campaigns_router
 from app.core.settings import get_settings
+from app.enums.campaign_section import CampaignSection
 from app.enums.legacy_campaign_code import LegacyCampaignCode
-from app.helpers import q_codes_finder, q_col_names
+from app.helpers import membership_counts, q_codes_finder, q_col_names, row_selection
 from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
 from app.logginglib import init_custom_logger
 from app.schemas.campaign_request import CampaignRequest
 from app.schemas.country import Country
 from app.schemas.region import Region
 from app.services import azure_blob_storage_interactions
+from app.services.access_log import AccessLog
+from app.services import campaign_snapshots
 from app.services import google_cloud_storage_interactions
-from app.services import google_maps_interactions
+from app.services import region_geocoder
 from app.services.api_cache import ApiCache
 from app.services.campaign import CampaignService
+from app.services.region_geocoder import RegionGeocoder
 from app.services.translations_cache import TranslationsCache
 
 logger = logging.getLogger(__name__)
@@ -57,6 +67,23 @@ init_custom_logger(logger)
 
 settings = get_settings()
 
+# Columns (or combinations of columns) counted in the breakdowns and histogram
+DIMENSIONS_COLUMN_NAMES: list[tuple[str, ...]] = [
+    ("setting",),
+    ("age",),
+    ("age_midpoint_range",),
+    ("age_bucket",),
+    ("age_bucket_default",),
+    ("gender",),
+    ("profession",),
+    ("canonical_country",),
+    ("alpha2country",),
+    ("region",),
+    ("province",),
+    ("response_year",),
+    ("alpha2country", "canonical_country", "region"),
+]
+
 
 def load_campaign_data(campaign_code: str):
     """
@@ -74,6 +101,9 @@ def load_campaign_data(campaign_code: str):
     # CRUD
     campaign_crud = crud.Campaign(campaign_code=campaign_code, db=db_tmp)
 
+    # Serialized filter options of the current data are created again for the new data
+    campaign_crud.clear_filter_options_payloads()
+
     # Get df
     df_responses = load_campaign_df(campaign_code=campaign_code)
     if df_responses is None:
@@ -242,19 +272,8 @@ def load_campaign_data(campaign_code: str):
         response_years = [x for x in response_years if x]
         campaign_crud.set_response_years(response_years=response_years)
 
-        # Create countries
-        countries: dict[str, Country] = {}
-        countries_alpha2_codes = df_responses[["alpha2country"]].drop_duplicates()
-        for idx in range(len(countries_alpha2_codes)):
-            alpha2_code = countries_alpha2_codes["alpha2country"].iloc[idx]
-            country = constants.COUNTRIES_DATA.get(alpha2_code)
-            countries[alpha2_code] = Country(
-                alpha2_code=alpha2_code,
-                name=country.get("name"),
-                demonym=country.get("demonym"),
-            )
-
-        # Add regions and provinces to countries
+        # Get regions and provinces of countries
+        countries_regions: dict[str, list[Region]] = {}
         unique_canonical_country_region_province = df_responses[
             ["alpha2country", "region", "province"]
         ].drop_duplicates()
@@ -265,11 +284,24 @@ def load_campaign_data(campaign_code: str):
             region = unique_canonical_country_region_province["region"].iloc[idx]
             province = unique_canonical_country_region_province["province"].iloc[idx]
             if region:
-                country = countries.get(alpha2_code)
-                if country and (region not in country.regions):
-                    country.regions.append(
-                        Region(code=region, name=region, province=province)
-                    )
+                countries_regions.setdefault(alpha2_code, []).append(
+                    Region(code=region, name=region, province=province)
+                )
+
+        # Create countries (regions sorted by name)
+        countries: dict[str, Country] = {}
+        countries_alpha2_codes = df_responses[["alpha2country"]].drop_duplicates()
+        for idx in range(len(countries_alpha2_codes)):
+            alpha2_code = countries_alpha2_codes["alpha2country"].iloc[idx]
+            country = constants.COUNTRIES_DATA.get(alpha2_code)
+            countries[alpha2_code] = Country(
+                alpha2_code=alpha2_code,
+                name=country.get("name"),
+                demonym=country.get("demonym"),
+                regions=tuple(
+                    sorted(countries_regions.get(alpha2_code, []), key=lambda x: x.name)
+                ),
+            )
 
         # Set countries
         campaign_crud.set_countries(countries=countries)
@@ -294,9 +326,99 @@ def load_campaign_data(campaign_code: str):
             professions.append(profession)
         campaign_crud.set_professions(professions=professions)
 
+        # Set responses sample rows
+        # For each question, the ids of rows with a non-empty response and canonical code
+        # The ids are shuffled once with a seeded random generator, a selection keeps this order
+        responses_sample_rows: dict[str, dict[str, np.ndarray]] = {}
+        for q_code in campaign_q_codes:
+            response_col_name = q_col_names.get_response_col_name(q_code=q_code)
+            has_response = (df_responses[response_col_name] != "").to_numpy()
+            responses_sample_rows[q_code] = {}
+
+            # The canonical code column can differ per campaign using this db e.g. dataexchange and allcampaigns
+            canonical_code_col_names = {
+                q_col_names.get_canonical_code_col_name(q_code=q_code),
+                q_col_names.get_canonical_code_col_name(
+                    q_code=q_code, campaign_code=campaign_code
+                ),
+            }
+            for canonical_code_col_name in canonical_code_col_names:
+                if canonical_code_col_name not in df_responses.columns:
+                    continue
+                has_canonical_code = (
+                    df_responses[canonical_code_col_name] != ""
+                ).to_numpy()
+                responses_sample_rows[q_code][
+                    canonical_code_col_name
+                ] = row_selection.shuffle_rows(
+                    rows=np.flatnonzero(has_response & has_canonical_code),
+                    seed=1,
+                )
+        campaign_crud.set_responses_sample_rows(
+            responses_sample_rows=responses_sample_rows
+        )
+
+        # Set dimension codes
+        # The values of columns used in breakdowns encoded as codes, to count both filters in a single pass
+        dimension_codes: dict[tuple[str, ...], tuple[np.ndarray, np.ndarray]] = {}
+        for column_names in DIMENSIONS_COLUMN_NAMES:
+            if set(column_names).issubset(df_responses.columns):
+                dimension_codes[column_names] = membership_counts.factorize_columns(
+                    df=df_responses, column_names=column_names
+                )
+        campaign_crud.set_dimension_codes(dimension_codes=dimension_codes)
+
+        # Set age values
+        # Numeric ages, NaN if the age is not a number
+        age_values: dict[str, np.ndarray] = {}
+        for column_name in ["age", "age_midpoint_range"]:
+            if column_name in df_responses.columns:
+                age_values[column_name] = np.array(
+                    [
+                        int(x) if isinstance(x, str) and x.isnumeric() else np.nan
+                        for x in df_responses[column_name]
+                    ],
+                    dtype=np.float64,
+                )
+        campaign_crud.set_age_values(age_values=age_values)
+
+        # Set category codes
+        # Parent categories are counted once per row, sub-categories are counted each time they occur
+        category_codes: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        for q_code in campaign_q_codes:
+            parent_category_col_name = q_col_names.get_parent_category_col_name(
+                q_code=q_code
+            )
+            if parent_category_col_name in df_responses.columns:
+                category_codes[
+                    parent_category_col_name
+                ] = membership_counts.explode_categories(
+                    values=df_responses[parent_category_col_name].to_numpy(),
+                    unique_per_row=True,
+                )
+            for canonical_code_col_name in {
+                q_col_names.get_canonical_code_col_name(q_code=q_code),
+                q_col_names.get_canonical_code_col_name(
+                    q_code=q_code, campaign_code=campaign_code
+                ),
+            }:
+                if canonical_code_col_name in df_responses.columns:
+                    category_codes[
+                        canonical_code_col_name
+                    ] = membership_counts.explode_categories(
+                        values=df_responses[canonical_code_col_name].to_numpy(),
+                        unique_per_row=False,
+                    )
+        campaign_crud.set_category_codes(category_codes=category_codes)
+
         # Set dataframe
         campaign_crud.set_dataframe(df=df_responses)
 
+        # Set version
+        campaign_crud.set_version(
+            version=utils.get_dataframe_hash_value(df=df_responses)
+        )
+
         # Set tmp db as current db
         databases.set_campaign_db(campaign_code=campaign_code, db=db_tmp)
 
@@ -399,6 +521,9 @@ def load_campaign_df(campaign_code: str) -> pd.DataFrame | None:
 
         df = df.fillna("")
 
+        # Row ids are used as positions in the column arrays
+        df = df.reset_index(drop=True)
+
         return df
     else:
         raise Exception(f"Could not load dataframe for campaign {campaign_code}.")
@@ -496,6 +621,7 @@ def load_initial_data():
         load_campaigns_data()
         load_region_coordinates()
         load_api_cache_with_unfiltered_campaigns_responses()
+        start_api_cache_warm_up()
         print("INFO:\t  Data loading completed.")
     except (Exception,) as e:
         logger.error(f"An error occurred while loading initial data: {str(e)}")
@@ -556,6 +682,7 @@ def reload_data(
         if clear_api_cache:
             ApiCache().clear_cache()
             load_api_cache_with_unfiltered_campaigns_responses()
+            start_api_cache_warm_up()
 
         print("Data reloading completed.")
     except (Exception,) as e:
@@ -584,7 +711,25 @@ def load_campaigns_data():
         try:
             load_campaign_data(campaign_code=campaign_config.campaign_code)
             load_campaign_ngrams_unfiltered(campaign_code=campaign_config.campaign_code)
-            ApiCache().clear_cache()
+
+            invalidate_campaign_api_cache(campaign_code=campaign_config.campaign_code)
+
+            # Publish the campaign data for the worker processes
+            if settings.WORKERS > 1 and settings.WORKERS_MODE == "snapshots":
+                campaign_snapshots.publish_snapshot(
+                    campaign_code=campaign_config.campaign_code,
+                    db=databases.get_campaign_db(
+                        campaign_code=campaign_config.campaign_code
+                    ),
+                )
+
+            # Memory used by the campaign data
+            memory_usage = crud.Campaign(
+                campaign_code=campaign_config.campaign_code
+            ).get_memory_usage()
+            print(
+                f"INFO:\t  Campaign {campaign_config.campaign_code} data uses {sum(memory_usage.values()) / 1024 ** 2:.1f} MB."
+            )
         except (Exception,):
             logger.exception(
                 f"""Error loading data for campaign {campaign_config.campaign_code}"""
@@ -593,6 +738,58 @@ def load_campaigns_data():
     print(f"INFO:\t  Loading campaigns data completed.")
 
 
+def invalidate_campaign_api_cache(campaign_code: str):
+    """Remove the cached responses of a campaign, allcampaigns uses the db of dataexchange"""
+
+    if campaign_code == LegacyCampaignCode.dataexchange.value:
+        ApiCache().invalidate_campaigns(
+            campaign_codes=[
+                LegacyCampaignCode.dataexchange.value,
+                LegacyCampaignCode.allcampaigns.value,
+            ]
+        )
+    else:
+        ApiCache().invalidate_campaigns(campaign_codes=[campaign_code])
+
+
+def load_worker_initial_data():
+    """
+    Load initial data in a worker process.
+    Campaigns data is not loaded from source, the snapshots published by the main process are attached.
+    """
+
+    load_translations_cache()
+    attach_campaigns_snapshots()
+
+
+def attach_campaigns_snapshots():
+    """Attach the published campaigns snapshots that are newer than the current data"""
+
+    try:
+        campaigns_codes = campaign_snapshots.attach_published_snapshots()
+    except (Exception,) as e:
+        logger.error(f"An error occurred while attaching campaigns snapshots: {str(e)}")
+
+        return
+
+    if campaigns_codes:
+        print(f"INFO:\t  Attached snapshots of campaigns {', '.join(campaigns_codes)}.")
+
+        # Region coordinates of new regions may have been saved by the main process
+        if os.path.isfile(settings.REGION_COORDINATES_JSON):
+            global_variables.region_coordinates = (
+                region_geocoder.load_region_coordinates()
+            )
+
+        for campaign_code in campaigns_codes:
+            invalidate_campaign_api_cache(campaign_code=campaign_code)
+
+        start_api_cache_warm_up()
+
+    if campaign_snapshots.read_manifest():
+        global_variables.initial_loading_data_complete = True
+
+
 def load_translations_cache():
     """Load translations cache"""
 
@@ -602,20 +799,22 @@ def load_translations_cache():
 
 
 def load_region_coordinates():
-    """Load region coordinates"""
+    """
+    Load region coordinates.
 
-    print(f"INFO:\t  Loading region coordinates...")
+    Coordinates of new regions are resolved in the background by the region geocoder.
+    """
 
-    region_coordinates_json = "region_coordinates.json"
-    new_coordinates_added = False
+    print(f"INFO:\t  Loading region coordinates...")
 
     if global_variables.region_coordinates:
         coordinates = global_variables.region_coordinates
     else:
-        with open(region_coordinates_json, "r") as file:
-            coordinates: dict = json.loads(file.read())
+        coordinates = region_geocoder.load_region_coordinates()
+
+    global_variables.region_coordinates = coordinates
 
-    # Get new region coordinates (if coordinate is not in region_coordinates.json)
+    # Get new region coordinates (if coordinate is not in the region coordinates file)
     focused_on_country_campaigns_codes = []
     for campaign_code in [x.campaign_code for x in CAMPAIGNS_CONFIG.values()]:
         if (
@@ -635,44 +834,19 @@ def load_region_coordinates():
         country_name = countries[0].name
         country_regions = countries[0].regions
 
-        locations = [
-            {
-                "country_alpha2_code": country_alpha2_code,
-                "country_name": country_name,
-                "location": region.name,
-            }
-            for region in country_regions
-        ]
-        for location in locations:
-            location_country_alpha2_code = location["country_alpha2_code"]
-            location_country_name = location["country_name"]
-            location_name = location["location"]
-
+        for region in country_regions:
             # If coordinate already exists, continue
-            country_coordinates = coordinates.get(location_country_alpha2_code)
-            if country_coordinates and location_name in country_coordinates.keys():
+            country_coordinates = coordinates.get(country_alpha2_code)
+            if country_coordinates and region.name in country_coordinates.keys():
                 continue
 
-            # Get coordinate
-            coordinate = google_maps_interactions.get_coordinate(
-                location=f"{location_country_name}, {location_name}"
+            # Request coordinate
+            RegionGeocoder().request(
+                country_alpha2_code=country_alpha2_code,
+                country_name=country_name,
+                region=region.name,
             )
 
-            # Add coordinate to coordinates
-            if not coordinates.get(location_country_alpha2_code):
-                coordinates[location_country_alpha2_code] = {}
-            coordinates[location_country_alpha2_code][location_name] = coordinate
-
-            if not new_coordinates_added:
-                new_coordinates_added = True
-
-    # Save region coordinates (Only in dev)
-    if settings.STAGE == "dev" and new_coordinates_added:
-        with open(region_coordinates_json, "w") as file:
-            file.write(json.dumps(coordinates, indent=2))
-
-    global_variables.region_coordinates = coordinates
-
 
 def load_api_cache_with_unfiltered_campaigns_responses():
     """
@@ -681,29 +855,155 @@ def load_api_cache_with_unfiltered_campaigns_responses():
     """
 
     print("INFO:\t  Loading initial API cache...")
+
     for campaign_config in CAMPAIGNS_CONFIG.values():
         campaign_code = campaign_config.campaign_code
 
         # Build request
-        request = Request(
-            {
-                "type": "http",
-                "http_version": "1.1",
-                "path": f"{settings.API_PREFIX}/campaigns/{campaign_code}",
-                "headers": {},
-                "method": "POST",
-            }
-        )
+        request = create_read_campaign_request(campaign_code=campaign_code)
 
         # Call endpoint function
         try:
-            read_campaign(
-                campaign_req=CampaignRequest(filter_1=None, filter_2=None),
-                _request=request,
-                campaign_code=campaign_code,
-                lang="en",
-                q_code="q1",
-                response_year="",
+            asyncio.run(
+                read_campaign(
+                    campaign_req=CampaignRequest(filter_1=None, filter_2=None),
+                    _request=request,
+                    campaign_code=campaign_code,
+                    lang="en",
+                    q_code="q1",
+                    response_year="",
+                    sections=None,
+                )
             )
         except (Exception,):
             logger.warning(f"Could not load API cache for campaign: {campaign_code}.")
+
+        # Serialize filter options
+        try:
+            CampaignService(
+                campaign_code=campaign_code, language="en"
+            ).get_filter_options_payload()
+        except (Exception,):
+            logger.warning(
+                f"Could not load filter options for campaign: {campaign_code}."
+            )
+
+
+def create_read_campaign_request(campaign_code: str) -> Request:
+    """Create a request for calling the read campaign endpoint function outside of a request"""
+
+    # The route is added to the request, the API cache uses its response model to encode the response
+    read_campaign_route = next(
+        x for x in campaigns_router.routes if x.endpoint is read_campaign
+    )
+
+    return Request(
+        {
+            "type": "http",
+            "http_version": "1.1",
+            "path": f"{settings.API_PREFIX}/campaigns/{campaign_code}",
+            "headers": {},
+            "method": "POST",
+            "route": read_campaign_route,
+            "api_cache_warm_up": True,
+        }
+    )
+
+
+def start_api_cache_warm_up():
+    """
+    Start loading the API cache with the most frequent requests in the background.
+    The main process of prefork workers loads it before forking without pausing, the workers inherit the API cache.
+    """
+
+    global_variables.api_cache_warm_up_id += 1
+    warm_up_id = global_variables.api_cache_warm_up_id
+
+    if (
+        settings.WORKERS > 1
+        and settings.WORKERS_MODE == "prefork"
+        and not global_variables.is_prefork_worker
+    ):
+        load_api_cache_with_frequent_requests(
+            warm_up_id=warm_up_id, limit_cpu_usage=False
+        )
+    else:
+        threading.Thread(
+            target=load_api_cache_with_frequent_requests,
+            kwargs={"warm_up_id": warm_up_id},
+            daemon=True,
+        ).start()
+
+
+def load_api_cache_with_frequent_requests(
+    warm_up_id: int, limit_cpu_usage: bool = True
+):
+    """
+    Load the API cache with the most frequent requests from the access log.
+    Stops when the time budget is used or when a newer warm-up started, pauses between requests to limit CPU usage.
+    """
+
+    started = time.monotonic()
+    loaded_count = 0
+
+    try:
+        most_frequent_requests = AccessLog().get_most_frequent_requests(
+            n=settings.API_CACHE_WARM_UP_MAX_REQUESTS
+        )
+    except (Exception,) as e:
+        logger.warning(f"Could not read the most frequent requests: {str(e)}")
+
+        return
+
+    for endpoint, params in most_frequent_requests:
+        if (
+            warm_up_id != global_variables.api_cache_warm_up_id
+            or time.monotonic() - started
+            > settings.API_CACHE_WARM_UP_TIME_BUDGET_SECONDS
+        ):
+            break
+
+        if endpoint != read_campaign.__name__:
+            continue
+
+        request_started = time.monotonic()
+        try:
+            # Data may have changed since the request was recorded
+            campaign_code = dependencies.campaign_code_exists_check(
+                campaign_code=params["campaign_code"]
+            )
+            q_code = dependencies.q_code_check(
+                campaign_code=campaign_code, q_code=params["q_code"]
+            )
+            response_year = dependencies.response_year_check(
+                campaign_code=campaign_code, response_year=params["response_year"]
+            )
+            lang = dependencies.language_check(lang=params["lang"])
+            sections = params["sections"]
+
+            asyncio.run(
+                read_campaign(
+                    campaign_req=CampaignRequest.parse_obj(params["campaign_req"]),
+                    _request=create_read_campaign_request(campaign_code=campaign_code),
+                    campaign_code=campaign_code,
+                    lang=lang,
+                    q_code=q_code,
+                    response_year=response_year,
+                    sections=[CampaignSection(x) for x in sections]
+                    if sections
+                    else None,
+                )
+            )
+            loaded_count += 1
+        except (Exception,):
+            continue
+
+        # Limit the fraction of time spent computing
+        if limit_cpu_usage:
+            duration = time.monotonic() - request_started
+            time.sleep(duration * (1 / settings.API_CACHE_WARM_UP_CPU_FRACTION - 1))
+
+    if loaded_count:
+        print(
+            f"INFO:\t  Loaded API cache with {loaded_count} frequent requests in {time.monotonic() - started:.1f}s."
+        )
@@ -24,18 +24,23 @@ SOFTWARE.
 """
 
 import copy
+import json
 import re
+import threading
 
-import inflect
+from cachetools import LRUCache
 from pandas import DataFrame
 
 from app import constants
 from app import crud
+from app import utils
 from app.enums.legacy_campaign_code import LegacyCampaignCode
 from app.helpers import q_col_names
 from app.schemas.filter import Filter
 
-inflect_engine = inflect.engine()
+# Generated descriptions of filters
+descriptions_cache = LRUCache(maxsize=1000)
+descriptions_cache_lock = threading.Lock()
 
 
 def get_default_filter(campaign_code: str) -> Filter:
@@ -220,7 +225,62 @@ def generate_description_of_filter(
     respondent_noun_singular: str,
     respondent_noun_plural: str,
     response_topics_as_descriptions: list[str],
-):
+) -> str:
+    """
+    Generate description of filter.
+
+    Descriptions are cached, the respondents count only matters for singular or plural nouns.
+    """
+
+    key = json.dumps(
+        [
+            data_filter.dict(
+                include={
+                    "countries",
+                    "regions",
+                    "provinces",
+                    "genders",
+                    "professions",
+                    "keyword_filter",
+                    "keyword_exclude",
+                    "ages",
+                    "age_buckets",
+                    "only_responses_from_categories",
+                }
+            ),
+            respondents_count == 1,
+            respondent_noun_singular,
+            respondent_noun_plural,
+            response_topics_as_descriptions,
+        ],
+        sort_keys=True,
+    )
+
+    with descriptions_cache_lock:
+        description = descriptions_cache.get(key)
+    if description is None:
+        description = create_description_of_filter(
+            data_filter=data_filter,
+            respondents_count=respondents_count,
+            respondent_noun_singular=respondent_noun_singular,
+            respondent_noun_plural=respondent_noun_plural,
+            response_topics_as_descriptions=response_topics_as_descriptions,
+        )
+        with descriptions_cache_lock:
+            descriptions_cache[key] = description
+
+    return description
+
+
+def create_description_of_filter(
+    data_filter: Filter,
+    respondents_count: int,
+    respondent_noun_singular: str,
+    respondent_noun_plural: str,
+    response_topics_as_descriptions: list[str],
+) -> str:
+    """Create description of filter"""
+
     countries = data_filter.countries
     regions = data_filter.regions
     provinces = data_filter.provinces
@@ -242,7 +302,7 @@ def generate_description_of_filter(
             respondent = join_list_comma_and(professions, lower_words=True)
         else:
             respondent = join_list_comma_and(
-                [inflect_engine.plural(p) for p in professions], lower_words=True
+                [utils.get_plural(p) for p in professions], lower_words=True
             )
 
     # Countries
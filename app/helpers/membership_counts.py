@@ -0,0 +1,155 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import numpy as np
+import pandas as pd
+
+# Bits used to tag a row with the filters it is part of
+IN_FILTER_1 = 1
+IN_FILTER_2 = 2
+
+
+def get_rows_membership(
+    rows_count: int, rows_1: np.ndarray, rows_2: np.ndarray
+) -> np.ndarray:
+    """
+    Get the membership of each row, a combination of IN_FILTER_1 and IN_FILTER_2 (0 to 3).
+    """
+
+    membership = np.zeros(rows_count, dtype=np.int64)
+    membership[rows_1] |= IN_FILTER_1
+    membership[rows_2] |= IN_FILTER_2
+
+    return membership
+
+
+def factorize_columns(
+    df: pd.DataFrame, column_names: tuple[str, ...]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Encode the values of one or more columns as codes.
+    Labels are sorted (tuples of values if there is more than one column), missing values get code -1.
+    """
+
+    if len(column_names) == 1:
+        codes, labels = pd.factorize(df[column_names[0]], sort=True)
+    else:
+        codes, labels = pd.MultiIndex.from_frame(df[list(column_names)]).factorize(
+            sort=True
+        )
+
+    return codes.astype(np.int64), np.asarray(labels, dtype=object)
+
+
+def explode_categories(
+    values: np.ndarray, unique_per_row: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split values such as 'code1/code2' into one entry per category.
+    Returns the row id and code of each entry, and the labels of the codes.
+
+    :param values: The values of the column.
+    :param unique_per_row: Only include a category once per row.
+    """
+
+    rows = []
+    categories = []
+    for row, value in enumerate(values):
+        seen_categories = set()
+        for category in value.split("/"):
+            if not category:
+                continue
+            if unique_per_row:
+                if category in seen_categories:
+                    continue
+                seen_categories.add(category)
+            rows.append(row)
+            categories.append(category.strip())
+
+    codes, labels = pd.factorize(np.asarray(categories, dtype=object))
+
+    return (
+        np.asarray(rows, dtype=np.int64),
+        codes.astype(np.int64),
+        np.asarray(labels, dtype=object),
+    )
+
+
+def unique_entries(
+    rows: np.ndarray, codes: np.ndarray, codes_count: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Remove entries with the same row id and code, to count each code once per row.
+    """
+
+    if codes_count == 0:
+        return rows, codes
+
+    keys = np.unique(rows * codes_count + codes)
+
+    return keys // codes_count, keys % codes_count
+
+
+def count_per_filter(
+    codes: np.ndarray, membership: np.ndarray, codes_count: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Count the occurrences of each code in filter 1 and in filter 2 in a single pass.
+
+    :param codes: The code of each entry, entries with code -1 are ignored.
+    :param membership: The membership of each entry.
+    :param codes_count: The amount of unique codes.
+    """
+
+    keys = codes * 4 + membership
+    counts = np.bincount(keys[codes >= 0], minlength=codes_count * 4).reshape(
+        codes_count, 4
+    )
+
+    counts_1 = counts[:, IN_FILTER_1] + counts[:, IN_FILTER_1 | IN_FILTER_2]
+    counts_2 = counts[:, IN_FILTER_2] + counts[:, IN_FILTER_1 | IN_FILTER_2]
+
+    return counts_1, counts_2
+
+
+def first_occurrence_per_filter(
+    codes: np.ndarray, membership: np.ndarray, codes_count: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the position of the first entry of each code in filter 1 and in filter 2.
+    Codes that do not occur get the amount of entries as position.
+    """
+
+    keys = codes * 4 + membership
+    valid = codes >= 0
+    unique_keys, first_positions = np.unique(keys[valid], return_index=True)
+
+    first = np.full(codes_count * 4, len(codes), dtype=np.int64)
+    first[unique_keys] = np.flatnonzero(valid)[first_positions]
+    first = first.reshape(codes_count, 4)
+
+    first_1 = np.minimum(first[:, IN_FILTER_1], first[:, IN_FILTER_1 | IN_FILTER_2])
+    first_2 = np.minimum(first[:, IN_FILTER_2], first[:, IN_FILTER_1 | IN_FILTER_2])
+
+    return first_1, first_2
@@ -0,0 +1,227 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import bisect
+from typing import Iterable
+
+import numpy as np
+
+
+class NgramVocabulary:
+    """
+    Ngrams stored UTF-8 encoded in one buffer, sorted. The id of an ngram is its position in the vocabulary.
+    A vocabulary is shared by the unigram, bigram and trigram tables created together.
+    """
+
+    __slots__ = ("__buffer", "__offsets")
+
+    def __init__(self, buffer: np.ndarray, offsets: np.ndarray):
+        self.__buffer = buffer
+        self.__offsets = offsets
+
+        for array in (self.__buffer, self.__offsets):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_encoded_ngrams(cls, encoded_ngrams: list[bytes]) -> "NgramVocabulary":
+        """Create vocabulary from a sorted list of unique encoded ngrams"""
+
+        offsets = np.zeros(len(encoded_ngrams) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(
+            np.fromiter(
+                (len(x) for x in encoded_ngrams),
+                dtype=np.int64,
+                count=len(encoded_ngrams),
+            )
+        )
+
+        return cls(
+            buffer=np.frombuffer(b"".join(encoded_ngrams), dtype=np.uint8).copy(),
+            offsets=offsets,
+        )
+
+    def __len__(self) -> int:
+        return len(self.__offsets) - 1
+
+    def __get_encoded_ngram(self, ngram_id: int) -> bytes:
+        """Get encoded ngram"""
+
+        return self.__buffer[
+            self.__offsets[ngram_id] : self.__offsets[ngram_id + 1]
+        ].tobytes()
+
+    def get_ngrams(self, ngram_ids: np.ndarray) -> list[str]:
+        """Get the ngram of each id"""
+
+        return [self.__get_encoded_ngram(x).decode("utf-8") for x in ngram_ids]
+
+    def get_ids(self, ngrams: list[str]) -> np.ndarray:
+        """Get the id of each ngram, -1 if the ngram is not in the vocabulary"""
+
+        # UTF-8 encoded ngrams sort in the same order as the ngrams
+        ngram_ids = np.full(len(ngrams), -1, dtype=np.int32)
+        for index, ngram in enumerate(ngrams):
+            encoded_ngram = ngram.encode("utf-8")
+            position = bisect.bisect_left(
+                range(len(self)), encoded_ngram, key=self.__get_encoded_ngram
+            )
+            if (
+                position < len(self)
+                and self.__get_encoded_ngram(position) == encoded_ngram
+            ):
+                ngram_ids[index] = position
+
+        return ngram_ids
+
+    def get_memory_usage(self) -> int:
+        """Get the amount of bytes used by the arrays"""
+
+        return self.__buffer.nbytes + self.__offsets.nbytes
+
+
+class NgramTable:
+    """
+    Ngram ids and their counts stored as arrays, the ngrams are stored in a vocabulary.
+    Ngrams are kept in order of first occurrence, a sorted index of the ids is used for lookups.
+    """
+
+    __slots__ = ("__vocabulary", "__ids", "__counts", "__sorter")
+
+    def __init__(
+        self, vocabulary: NgramVocabulary, ids: np.ndarray, counts: np.ndarray
+    ):
+        self.__vocabulary = vocabulary
+        self.__ids = ids
+        self.__counts = counts
+        self.__sorter = np.argsort(ids, kind="stable")
+
+        for array in (self.__ids, self.__counts, self.__sorter):
+            array.flags.writeable = False
+
+    @classmethod
+    def from_counts(cls, ngram_counts: dict[str, int]) -> "NgramTable":
+        """Create table from a dict of ngram counts"""
+
+        return cls.create_tables(ngram_counts_list=[ngram_counts])[0]
+
+    @classmethod
+    def create_tables(
+        cls, ngram_counts_list: list[dict[str, int] | None]
+    ) -> tuple["NgramTable", ...]:
+        """Create tables from dicts of ngram counts, the tables share one vocabulary"""
+
+        ngram_counts_list = [x or {} for x in ngram_counts_list]
+
+        # Vocabulary
+        encoded_ngrams_list = [
+            [x.encode("utf-8") for x in ngram_counts.keys()]
+            for ngram_counts in ngram_counts_list
+        ]
+        vocabulary_encoded_ngrams = sorted(
+            {x for encoded_ngrams in encoded_ngrams_list for x in encoded_ngrams}
+        )
+        vocabulary = NgramVocabulary.from_encoded_ngrams(
+            encoded_ngrams=vocabulary_encoded_ngrams
+        )
+        vocabulary_ids = {x: index for index, x in enumerate(vocabulary_encoded_ngrams)}
+
+        return tuple(
+            cls(
+                vocabulary=vocabulary,
+                ids=np.fromiter(
+                    (vocabulary_ids[x] for x in encoded_ngrams),
+                    dtype=np.int32,
+                    count=len(encoded_ngrams),
+                ),
+                counts=np.fromiter(
+                    ngram_counts.values(), dtype=np.int32, count=len(ngram_counts)
+                ),
+            )
+            for ngram_counts, encoded_ngrams in zip(
+                ngram_counts_list, encoded_ngrams_list
+            )
+        )
+
+    @staticmethod
+    def get_tables_memory_usage(tables: Iterable["NgramTable"]) -> int:
+        """Get the amount of bytes used by tables, a shared vocabulary is counted once"""
+
+        memory_usage = 0
+        vocabularies = {}
+        for table in tables:
+            memory_usage += table.get_memory_usage()
+            vocabularies[id(table.__vocabulary)] = table.__vocabulary
+
+        return memory_usage + sum(x.get_memory_usage() for x in vocabularies.values())
+
+    def __len__(self) -> int:
+        return len(self.__counts)
+
+    def get_max_count(self) -> int:
+        """Get the highest count"""
+
+        if len(self.__counts) == 0:
+            return 0
+
+        return int(self.__counts.max())
+
+    def get_top(self, n: int) -> list[tuple[str, int]]:
+        """
+        Get the n ngrams with the highest counts, sorted by count (ASC).
+        Ngrams with the same count stay in order of first occurrence.
+        """
+
+        if n <= 0:
+            return []
+
+        top = np.argsort(self.__counts, kind="stable")[-n:]
+
+        return list(
+            zip(
+                self.__vocabulary.get_ngrams(ngram_ids=self.__ids[top]),
+                self.__counts[top].tolist(),
+            )
+        )
+
+    def get_counts(self, ngrams: list[str]) -> list[int]:
+        """Get the count of each ngram, 0 if the ngram is not in the table"""
+
+        if len(ngrams) == 0:
+            return []
+        if len(self.__counts) == 0:
+            return [0] * len(ngrams)
+
+        ngram_ids = self.__vocabulary.get_ids(ngrams=ngrams)
+        positions = np.searchsorted(self.__ids, ngram_ids, sorter=self.__sorter)
+        positions = self.__sorter[np.minimum(positions, len(self.__sorter) - 1)]
+        counts = np.where(
+            self.__ids[positions] == ngram_ids, self.__counts[positions], 0
+        )
+
+        return counts.tolist()
+
+    def get_memory_usage(self) -> int:
+        """Get the amount of bytes used by the arrays (without the vocabulary)"""
+
+        return self.__ids.nbytes + self.__counts.nbytes + self.__sorter.nbytes
@@ -0,0 +1,76 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import numpy as np
+
+
+def select_rows(
+    rows: np.ndarray, membership: np.ndarray, in_filter: int, n: int
+) -> np.ndarray:
+    """
+    Get the first n row ids of rows that are in the filter, in the order of rows.
+    rows is read in chunks that double in size, only the part needed for n row ids is read.
+    """
+
+    selected_rows = []
+    count = 0
+    start = 0
+    chunk_size = max(n, 1024)
+    while count < n and start < len(rows):
+        chunk = rows[start : start + chunk_size]
+        chunk = chunk[(membership[chunk] & in_filter) != 0]
+        selected_rows.append(chunk)
+        count += len(chunk)
+        start += chunk_size
+        chunk_size *= 2
+
+    if not selected_rows:
+        return rows[:0]
+
+    return np.concatenate(selected_rows)[:n]
+
+
+def shuffle_rows(rows: np.ndarray, seed: int = 1) -> np.ndarray:
+    """
+    Shuffle row ids using a seeded random generator, the order is the same for the same rows.
+    """
+
+    rng = np.random.default_rng(seed=seed)
+
+    return rng.permutation(rows)
+
+
+def interleave_rows(rows_1: np.ndarray, rows_2: np.ndarray) -> np.ndarray:
+    """
+    Interleave two arrays of row ids, the remaining rows of the longer array are added at the end.
+    """
+
+    n = min(len(rows_1), len(rows_2))
+    rows = np.empty(len(rows_1) + len(rows_2), dtype=np.result_type(rows_1, rows_2))
+    rows[0 : 2 * n : 2] = rows_1[:n]
+    rows[1 : 2 * n : 2] = rows_2[:n]
+    rows[2 * n :] = rows_1[n:] if len(rows_1) > n else rows_2[n:]
+
+    return rows
@@ -26,6 +26,13 @@ SOFTWARE.
 from fastapi import status, HTTPException
 
 
+class BadRequestHTTPException(HTTPException):
+    def __init__(self, detail: str = None):
+        if not detail:
+            detail = "Bad request"
+        super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
 class ResourceNotFoundHTTPException(HTTPException):
     def __init__(self, detail: str = None):
         if not detail:
@@ -82,3 +89,14 @@ class InternalServerErrorHTTPException(HTTPException):
         super().__init__(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=detail
         )
+
+
+class ServiceUnavailableHTTPException(HTTPException):
+    def __init__(self, detail: str = None, retry_after: int = 1):
+        if not detail:
+            detail = "Service unavailable, try again later"
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(retry_after)},
+        )
@@ -0,0 +1,162 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import gc
+import os
+import signal
+import socket
+import time
+
+import uvicorn
+
+from app import global_variables
+from app.helpers import data_loader
+
+
+class PreforkLauncher:
+    """
+    Loads the data once, then forks worker processes that share it copy-on-write.
+    On SIGHUP the data is reloaded and the workers are replaced gracefully.
+    """
+
+    def __init__(self, config: uvicorn.Config, workers: int):
+        self.__config = config
+        self.__workers = workers
+        self.__socket: socket.socket | None = None
+        self.__workers_pids: set[int] = set()
+        self.__should_reload = False
+        self.__should_exit = False
+
+    def run(self):
+        """Load data, fork workers and supervise them until SIGINT or SIGTERM"""
+
+        data_loader.load_initial_data()
+        self.__freeze()
+
+        self.__socket = self.__config.bind_socket()
+        for _ in range(self.__workers):
+            self.__fork_worker()
+
+        signal.signal(signal.SIGHUP, self.__handle_reload)
+        signal.signal(signal.SIGINT, self.__handle_exit)
+        signal.signal(signal.SIGTERM, self.__handle_exit)
+
+        while not self.__should_exit:
+            if self.__should_reload:
+                self.__should_reload = False
+                self.__reload()
+
+            self.__reap_workers(respawn=True)
+            time.sleep(0.5)
+
+        self.__stop_workers(pids=set(self.__workers_pids))
+
+    def __reload(self):
+        """Reload data, then replace the old workers with workers forked from the new data"""
+
+        print("INFO:\t  Reloading data before replacing workers...")
+
+        # Old data can be collected once it is replaced
+        gc.unfreeze()
+        data_loader.reload_data(clear_api_cache=True)
+        self.__freeze()
+
+        old_workers_pids = set(self.__workers_pids)
+        for _ in range(self.__workers):
+            self.__fork_worker()
+
+        # Old workers finish their requests before exiting
+        self.__stop_workers(pids=old_workers_pids)
+
+    def __fork_worker(self):
+        """Fork a worker that serves the app on the shared socket"""
+
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGHUP, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            global_variables.is_prefork_worker = True
+
+            try:
+                uvicorn.Server(config=self.__config).run(sockets=[self.__socket])
+            finally:
+                os._exit(0)
+
+        self.__workers_pids.add(pid)
+
+    def __stop_workers(self, pids: set[int]):
+        """Stop workers gracefully and wait for them to exit"""
+
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        for pid in pids:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+            self.__workers_pids.discard(pid)
+
+    def __reap_workers(self, respawn: bool):
+        """Reap exited workers, replace them if respawn is set"""
+
+        while self.__workers_pids:
+            try:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+
+            if pid in self.__workers_pids:
+                self.__workers_pids.discard(pid)
+                if respawn and not self.__should_exit:
+                    print(f"INFO:\t  Worker {pid} exited, starting a new worker...")
+                    self.__fork_worker()
+
+    @staticmethod
+    def __freeze():
+        """
+        Move all objects to the permanent generation.
+        The garbage collector then does not touch the loaded data, pages stay shared with the workers.
+        """
+
+        gc.collect()
+        gc.freeze()
+
+    def __handle_reload(self, *_args):
+        self.__should_reload = True
+
+    def __handle_exit(self, *_args):
+        self.__should_exit = True
+
+
+def request_reload():
+    """Ask the launcher (the parent of this worker) to reload data and replace the workers"""
+
+    os.kill(os.getppid(), signal.SIGHUP)
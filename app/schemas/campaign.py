@@ -32,13 +32,14 @@ class Campaign(BaseModel):
     all_questions: list[dict]
     current_response_years: list[str]
     all_response_years: list[str]
-    responses_sample: dict
-    responses_breakdown: dict
-    living_settings_breakdown: list
-    top_words_and_phrases: dict
-    histogram: dict
-    genders_breakdown: list[dict]
-    world_bubble_maps_coordinates: dict
+    responses_sample: dict | None
+    responses_breakdown: dict | None
+    living_settings_breakdown: list | None
+    top_words_and_phrases: dict | None
+    histogram: dict | None
+    genders_breakdown: list[dict] | None
+    world_bubble_maps_coordinates: dict | None
+    age_summary: dict | None
     filter_1_respondents_count: int
     filter_2_respondents_count: int
     filter_1_average_age: str
@@ -0,0 +1,49 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+from pydantic import Field
+
+from app.enums.campaign_section import CampaignSection
+from app.schemas.campaign_request import CampaignRequest
+
+
+class CampaignBatchRequest(CampaignRequest):
+    q_codes: list[str] = Field(
+        default=[],
+        description="The q codes to include campaigns for, all q codes are included by default",
+    )
+    sections: list[CampaignSection] | None = Field(
+        default=None,
+        description="The sections to include in campaigns, all sections except `age_summary` are included by default",
+    )
+    include_configuration: bool = Field(
+        default=True, description="Include the campaign configuration"
+    )
+    include_filter_options: bool = Field(
+        default=True, description="Include the filter options"
+    )
+    include_histogram_options: bool = Field(
+        default=True, description="Include the histogram options"
+    )
@@ -0,0 +1,57 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+from pydantic import BaseModel, Field
+
+
+class FacetCounts(BaseModel):
+    countries: list[dict] = Field(
+        default=[], description="Respondents count of each country"
+    )
+    regions: list[dict] = Field(
+        default=[], description="Respondents count of each region"
+    )
+    provinces: list[dict] = Field(
+        default=[], description="Respondents count of each province"
+    )
+    response_topics: list[dict] = Field(
+        default=[], description="Respondents count of each response topic"
+    )
+    ages: list[dict] = Field(default=[], description="Respondents count of each age")
+    age_buckets: list[dict] = Field(
+        default=[], description="Respondents count of each age bucket"
+    )
+    age_buckets_default: list[dict] = Field(
+        default=[], description="Respondents count of each default age bucket"
+    )
+    genders: list[dict] = Field(
+        default=[], description="Respondents count of each gender"
+    )
+    living_settings: list[dict] = Field(
+        default=[], description="Respondents count of each living setting"
+    )
+    professions: list[dict] = Field(
+        default=[], description="Respondents count of each profession"
+    )
+    years: list[dict] = Field(default=[], description="Respondents count of each year")
@@ -30,3 +30,6 @@ class Region(BaseModel):
     code: str = Field(description="The region's code is same as the region's name")
     name: str = Field(description="The region's name")
     province: str = Field(default="", description="The province")
+
+    class Config:
+        allow_mutation = False
@@ -0,0 +1,193 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import fcntl
+import json
+import logging
+import os
+import time
+from collections import Counter
+from functools import wraps
+from threading import Lock, Thread
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.settings import get_settings
+from app.helpers.singleton_meta import SingletonMeta
+from app.logginglib import init_custom_logger
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+settings = get_settings()
+
+# Recorded counts are written to the log at this interval
+FLUSH_INTERVAL_SECONDS = 60
+
+# Amount of most frequent requests kept when the log is compacted
+MAX_LOGGED_REQUESTS = 1000
+
+# Filter fields with free text typed by users, requests using them are not recorded
+FREE_TEXT_FILTER_FIELDS = ("keyword_filter", "keyword_exclude")
+
+
+class AccessLog(metaclass=SingletonMeta):
+    """
+    Records how often requests are made (Singleton class).
+    Only the parameters of a request are recorded, nothing about the client.
+    The counts are appended to a local JSON lines file, shared by the processes serving the API, and are used to warm
+    up the API cache with the most frequent requests.
+    """
+
+    def __init__(self):
+        self.__filepath = settings.ACCESS_LOG_FILEPATH
+        self.__lock = Lock()
+        self.__counts = Counter()
+        self.__last_flush = time.monotonic()
+        self.__flushing = False
+
+    def record_requests(self, func):
+        """Decorator for recording requests to an endpoint, place it above the API cache decorator"""
+
+        @wraps(func)
+        async def wrapper(*args: tuple, **kwargs: dict):
+            # Requests made by the API cache warm-up are not recorded
+            request = kwargs.get("_request")
+            if self.__filepath and not (
+                request and request.scope.get("api_cache_warm_up")
+            ):
+                try:
+                    self.__record(endpoint=func.__name__, kwargs=kwargs)
+                except (Exception,) as e:
+                    logger.warning(f"Could not record request: {str(e)}")
+
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    def __record(self, endpoint: str, kwargs: dict):
+        """Count request"""
+
+        params = jsonable_encoder(
+            {k: v for k, v in kwargs.items() if not k.startswith("_")}
+        )
+
+        # Anonymize, skip requests containing free text
+        for value in params.values():
+            if isinstance(value, dict):
+                for data_filter in value.values():
+                    if isinstance(data_filter, dict) and any(
+                        data_filter.get(x) for x in FREE_TEXT_FILTER_FIELDS
+                    ):
+                        return
+
+        key = json.dumps({"endpoint": endpoint, "params": params}, sort_keys=True)
+
+        with self.__lock:
+            self.__counts[key] += 1
+            flush = (
+                not self.__flushing
+                and time.monotonic() - self.__last_flush > FLUSH_INTERVAL_SECONDS
+            )
+            if flush:
+                self.__flushing = True
+
+        if flush:
+            # Write from a thread, the event loop does not wait on the file or its lock
+            Thread(target=self.__flush_in_background, daemon=True).start()
+
+    def __flush_in_background(self):
+        """Append the recorded counts to the log, allow the next flush when done"""
+
+        try:
+            self.flush()
+        finally:
+            with self.__lock:
+                self.__flushing = False
+
+    def flush(self):
+        """Append the recorded counts to the log"""
+
+        with self.__lock:
+            counts = self.__counts
+            self.__counts = Counter()
+            self.__last_flush = time.monotonic()
+
+        if not counts or not self.__filepath:
+            return
+
+        lines = "".join(
+            json.dumps({"key": key, "count": count}) + "\n"
+            for key, count in counts.items()
+        )
+        try:
+            with open(self.__filepath, "a", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                file.write(lines)
+        except OSError as e:
+            logger.warning(f"Could not write access log: {str(e)}")
+
+    def get_most_frequent_requests(self, n: int) -> list[tuple[str, dict]]:
+        """
+        Get the endpoint and params of the n most frequent requests.
+        The log is compacted, only the most frequent requests are kept.
+        """
+
+        self.flush()
+
+        if not self.__filepath or not os.path.isfile(self.__filepath):
+            return []
+
+        counts = Counter()
+        try:
+            with open(self.__filepath, "r+", encoding="utf-8") as file:
+                fcntl.flock(file, fcntl.LOCK_EX)
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        counts[entry["key"]] += entry["count"]
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+                # Compact
+                file.seek(0)
+                file.truncate()
+                file.write(
+                    "".join(
+                        json.dumps({"key": key, "count": count}) + "\n"
+                        for key, count in counts.most_common(MAX_LOGGED_REQUESTS)
+                    )
+                )
+        except OSError as e:
+            logger.warning(f"Could not read access log: {str(e)}")
+
+            return []
+
+        most_frequent_requests = []
+        for key, _ in counts.most_common(n):
+            request = json.loads(key)
+            most_frequent_requests.append((request["endpoint"], request["params"]))
+
+        return most_frequent_requests
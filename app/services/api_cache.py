@@ -23,26 +23,86 @@ SOFTWARE.
 
 """
 
+import asyncio
+import hashlib
 import inspect
 import json
+import logging
+from concurrent.futures import Future
 from functools import wraps
-from typing import Any
+from threading import Lock
+from typing import Any, NamedTuple
 
-from cachetools import LRUCache
-from fastapi import Request
+from cachetools import LRUCache, TTLCache
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import ResponseValidationError
+from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from app import utils
+from app import crud, utils
+from app.core.settings import get_settings
+from app.helpers import content_encoding
 from app.helpers.singleton_meta import SingletonMeta
+from app.http_exceptions import ServiceUnavailableHTTPException
+from app.logginglib import init_custom_logger
+from app.services.api_cache_backends import get_api_cache_backend
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+settings = get_settings()
+
+# Passed to the waiting requests when the first request was cancelled or rejected
+ABANDONED = object()
+
+
+class CachedResponse(NamedTuple):
+    """
+    An encoded response body, its ETag and the campaign code it was created for.
+    compressed contains the body compressed with each supported content encoding.
+    """
+
+    body: bytes
+    etag: str
+    campaign_code: str
+    compressed: dict[str, bytes]
 
 
 class ApiCache(metaclass=SingletonMeta):
     """
     Cache API responses (Singleton class).
+    Responses are stored encoded and precompressed, a cache hit returns the stored bytes without serializing or
+    compressing again.
+    The size of the cache is limited by the total size of the stored bodies, least recently used entries are evicted.
     """
 
     def __init__(self):
-        self.__cache = LRUCache(maxsize=1000)
+        if settings.API_CACHE_TTL_SECONDS > 0:
+            self.__cache = TTLCache(
+                maxsize=settings.API_CACHE_MAX_BYTES,
+                ttl=settings.API_CACHE_TTL_SECONDS,
+                getsizeof=self.__get_size,
+            )
+        else:
+            self.__cache = LRUCache(
+                maxsize=settings.API_CACHE_MAX_BYTES, getsizeof=self.__get_size
+            )
+        self.__lock = Lock()
+
+        # Keys being computed, requests with the same key wait for the result of the first request
+        # The generation of the cache when the computation started is stored with the future
+        self.__in_flight: dict[str, tuple[Future, int]] = {}
+
+        # Incremented when the cache is cleared or when a campaign is invalidated
+        # Results computed before clearing or invalidating are not stored
+        self.__generation = 0
+        self.__campaigns_generations: dict[str, int] = {}
+
+        self.__stats = {"hits": 0, "misses": 0, "coalesced": 0, "backend_hits": 0}
+
+        # Second level cache shared between processes or instances
+        self.__backend = get_api_cache_backend()
 
     def cache_response(self, func):
         """Decorator for caching API responses"""
@@ -51,36 +111,126 @@ class ApiCache(metaclass=SingletonMeta):
 
             @wraps(func)
             async def wrapper(*args: tuple, **kwargs: dict):
-                hash_value = self.__get_hash_value(**kwargs)
-                if self.__hash_exists(hash_value):
-                    # Return cached result
-                    return self.__cache.get(hash_value)
-                else:
-                    # Create result, cache result, return result
-                    result = await func(*args, **kwargs)
-                    self.__cache[hash_value] = result
-
+                request: Request | None = kwargs.get("_request")
+                campaign_code: str = kwargs.get("campaign_code", "")
+                key = self.__get_key(**kwargs)
+                while True:
+                    cached_response, future, is_first = self.__get_or_join(
+                        key, campaign_code
+                    )
+                    if is_first:
+                        break
+                    if not cached_response:
+                        # Wait for the result of the first request with the same key
+                        # Shielded, cancelling this request must not cancel the shared future
+                        cached_response = await asyncio.shield(
+                            asyncio.wrap_future(future)
+                        )
+                        if cached_response is ABANDONED:
+                            # The first request was cancelled or rejected, try again
+                            continue
+                        if not cached_response:
+                            return await func(*args, **kwargs)
+
+                    # Return cached response
+                    return self.__create_response(request, cached_response)
+
+                # Get result from the backend, or create result and store it in the backend
+                # Cache encoded result, return response
+                result = None
+                try:
+                    backend_key = self.__get_backend_key(key, campaign_code)
+                    if self.__backend:
+                        cached_response = await run_in_threadpool(
+                            self.__get_from_backend, backend_key, campaign_code
+                        )
+                    if not cached_response:
+                        result = await func(*args, **kwargs)
+                        cached_response = await run_in_threadpool(
+                            self.__encode_result, request, result, campaign_code
+                        )
+                        if self.__backend and cached_response:
+                            await run_in_threadpool(
+                                self.__set_in_backend, backend_key, cached_response
+                            )
+                except ServiceUnavailableHTTPException:
+                    self.__abandon(key, future)
+                    raise
+                except Exception as e:
+                    self.__complete(key, future, exception=e)
+                    raise
+                except BaseException:
+                    # Cancelled, e.g. the client disconnected
+                    self.__abandon(key, future)
+                    raise
+                self.__complete(key, future, cached_response=cached_response)
+
+                if not cached_response:
                     return result
 
+                return self.__create_response(request, cached_response)
+
         else:
 
             @wraps(func)
             def wrapper(*args: tuple, **kwargs: dict):
-                hash_value = self.__get_hash_value(**kwargs)
-                if self.__hash_exists(hash_value):
-                    # Return cached result
-                    return self.__cache.get(hash_value)
-                else:
-                    # Create result, cache result, return result
-                    result = func(*args, **kwargs)
-                    self.__cache[hash_value] = result
-
+                request: Request | None = kwargs.get("_request")
+                campaign_code: str = kwargs.get("campaign_code", "")
+                key = self.__get_key(**kwargs)
+                while True:
+                    cached_response, future, is_first = self.__get_or_join(
+                        key, campaign_code
+                    )
+                    if is_first:
+                        break
+                    if not cached_response:
+                        # Wait for the result of the first request with the same key
+                        cached_response = future.result()
+                        if cached_response is ABANDONED:
+                            # The first request was rejected, try again
+                            continue
+                        if not cached_response:
+                            return func(*args, **kwargs)
+
+                    # Return cached response
+                    return self.__create_response(request, cached_response)
+
+                # Get result from the backend, or create result and store it in the backend
+                # Cache encoded result, return response
+                result = None
+                try:
+                    backend_key = self.__get_backend_key(key, campaign_code)
+                    if self.__backend:
+                        cached_response = self.__get_from_backend(
+                            backend_key, campaign_code
+                        )
+                    if not cached_response:
+                        result = func(*args, **kwargs)
+                        cached_response = self.__encode_result(
+                            request, result, campaign_code
+                        )
+                        if self.__backend and cached_response:
+                            self.__set_in_backend(backend_key, cached_response)
+                except ServiceUnavailableHTTPException:
+                    self.__abandon(key, future)
+                    raise
+                except Exception as e:
+                    self.__complete(key, future, exception=e)
+                    raise
+                except BaseException:
+                    self.__abandon(key, future)
+                    raise
+                self.__complete(key, future, cached_response=cached_response)
+
+                if not cached_response:
                     return result
 
+                return self.__create_response(request, cached_response)
+
         return wrapper
 
-    def __get_hash_value(self, **kwargs: dict) -> str:
-        """Get hash value"""
+    def __get_key(self, **kwargs: dict) -> str:
+        """Get key"""
 
         # Get path from request
         request: Request | Any = kwargs.get("_request")
@@ -98,24 +248,251 @@ class ApiCache(metaclass=SingletonMeta):
         # Add path to jsonable kwargs
         kwargs_jsonable["path"] = path
 
-        # Create hash value
-        kwargs_json = json.dumps(kwargs_jsonable, sort_keys=True)
-        hash_value = utils.get_string_hash_value(kwargs_json)
+        # The json string is used as key, dict lookups hash it without an extra digest
+        key = json.dumps(kwargs_jsonable, sort_keys=True)
+
+        return key
+
+    @staticmethod
+    def __get_backend_key(key: str, campaign_code: str) -> str:
+        """
+        Get backend key.
+        Includes the app version and the version of the campaign data, instances with other data use other keys.
+        """
+
+        version = ""
+        if campaign_code:
+            try:
+                version = crud.Campaign(campaign_code=campaign_code).get_version()
+            except (Exception,):
+                pass
+
+        return f"api_cache:{settings.VERSION}:{campaign_code}:{version}:{utils.get_string_hash_value(key)}"
+
+    def __get_from_backend(
+        self, backend_key: str, campaign_code: str
+    ) -> CachedResponse | None:
+        """Get cached response from the backend"""
+
+        try:
+            value = self.__backend.get(backend_key)
+        except (Exception,) as e:
+            logger.warning(f"Could not get response from API cache backend: {str(e)}")
+
+            return None
+
+        if not value:
+            return None
+
+        etag, body = value.split(b"\n", 1)
+
+        with self.__lock:
+            self.__stats["backend_hits"] += 1
+
+        return self.__create_cached_response(
+            body=body, etag=etag.decode(), campaign_code=campaign_code
+        )
+
+    def __set_in_backend(self, backend_key: str, cached_response: CachedResponse):
+        """Set cached response in the backend"""
+
+        try:
+            self.__backend.set(
+                backend_key,
+                cached_response.etag.encode() + b"\n" + cached_response.body,
+            )
+        except (Exception,) as e:
+            logger.warning(f"Could not set response in API cache backend: {str(e)}")
+
+    def __get_or_join(
+        self, key: str, campaign_code: str
+    ) -> tuple[CachedResponse | None, Future | None, bool]:
+        """
+        Get cached response.
+        On a miss, get the future of the request computing the key, and whether this request is the first one.
+        """
+
+        with self.__lock:
+            cached_response = self.__cache.get(key)
+            if cached_response:
+                self.__stats["hits"] += 1
+
+                return cached_response, None, False
+
+            in_flight = self.__in_flight.get(key)
+            if in_flight:
+                self.__stats["coalesced"] += 1
+
+                return None, in_flight[0], False
+
+            self.__stats["misses"] += 1
+            future = Future()
+            self.__in_flight[key] = (future, self.__get_generation(campaign_code))
+
+            return None, future, True
+
+    def __complete(
+        self,
+        key: str,
+        future: Future,
+        cached_response: CachedResponse | None = None,
+        exception: Exception | None = None,
+    ):
+        """Cache response and pass it (or the exception) to the waiting requests"""
+
+        with self.__lock:
+            _, generation = self.__in_flight.pop(key)
+            if cached_response and generation == self.__get_generation(
+                cached_response.campaign_code
+            ):
+                try:
+                    self.__cache[key] = cached_response
+                except ValueError:
+                    # The response is larger than the cache
+                    pass
+
+        if exception:
+            future.set_exception(exception)
+        else:
+            future.set_result(cached_response)
+
+    def __abandon(self, key: str, future: Future):
+        """
+        Remove the key from the keys being computed without a result.
+        The waiting requests try again, one of them computes the key.
+        """
+
+        with self.__lock:
+            self.__in_flight.pop(key)
+
+        future.set_result(ABANDONED)
+
+    def __encode_result(
+        self, request: Request | None, result: Any, campaign_code: str
+    ) -> CachedResponse | None:
+        """Encode result, a response created by the endpoint itself is not cached"""
+
+        if isinstance(result, Response):
+            return None
 
-        return hash_value
+        return self.__encode(request, result, campaign_code)
 
-    def __hash_exists(self, hash_value: str) -> bool:
-        """Check if hash exists"""
+    @staticmethod
+    def __encode(
+        request: Request | None, result: Any, campaign_code: str
+    ) -> CachedResponse:
+        """
+        Encode result the same way FastAPI does, using the response model of the route if available.
+        The OpenAPI schema of the route is not affected, it is created from the response model.
+        """
 
-        return hash_value in self.__cache.keys()
+        route = request.scope.get("route") if request else None
+        response_field = getattr(route, "response_field", None)
+
+        # A result created as the response model by the service is serialized directly, without validating and
+        # encoding it again
+        if response_field and type(result) is response_field.type_:
+            body = utils.dumps_json(result)
+        else:
+            content = jsonable_encoder(result)
+
+            # Validate content with the response model e.g. to exclude fields not in the model
+            if response_field:
+                value, errors = response_field.validate(content, {}, loc=("response",))
+                if errors:
+                    raise ResponseValidationError(
+                        errors=errors if isinstance(errors, list) else [errors],
+                        body=content,
+                    )
+                content = jsonable_encoder(value)
+
+            body = JSONResponse(content=content).body
+
+        etag = f'"{hashlib.sha256(body).hexdigest()}"'
+
+        return ApiCache.__create_cached_response(
+            body=body, etag=etag, campaign_code=campaign_code
+        )
+
+    @staticmethod
+    def __create_cached_response(
+        body: bytes, etag: str, campaign_code: str
+    ) -> CachedResponse:
+        """Create cached response, compression runs once here and not for each response"""
+
+        return CachedResponse(
+            body=body,
+            etag=etag,
+            campaign_code=campaign_code,
+            compressed=content_encoding.compress_variants(body),
+        )
+
+    @staticmethod
+    def __create_response(
+        request: Request | None, cached_response: CachedResponse
+    ) -> Response:
+        """Create response, or a 304 response if the client already has the current version"""
+
+        return content_encoding.create_response(
+            request=request,
+            body=cached_response.body,
+            etag=cached_response.etag,
+            compressed=cached_response.compressed,
+        )
 
     def get_cache(self):
         """Get cache"""
 
         return self.__cache
 
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get stats.
+        coalesced is the amount of computations saved by waiting for a request with the same key.
+        """
+
+        with self.__lock:
+            return {
+                **self.__stats,
+                "size": len(self.__cache),
+                "bytes": self.__cache.currsize,
+                "in_flight": len(self.__in_flight),
+            }
+
+    def invalidate_campaigns(self, campaign_codes: list[str]):
+        """Remove the cached responses of campaigns"""
+
+        with self.__lock:
+            for campaign_code in campaign_codes:
+                self.__campaigns_generations[campaign_code] = (
+                    self.__campaigns_generations.get(campaign_code, 0) + 1
+                )
+
+            keys = [
+                key
+                for key, cached_response in self.__cache.items()
+                if cached_response.campaign_code in campaign_codes
+            ]
+            for key in keys:
+                self.__cache.pop(key, None)
+
     def clear_cache(self):
         """Clear cache"""
 
-        if len(self.__cache) > 0:
-            self.__cache.clear()
+        with self.__lock:
+            self.__generation += 1
+            if len(self.__cache) > 0:
+                self.__cache.clear()
+
+    def __get_generation(self, campaign_code: str) -> tuple[int, int]:
+        """Get generation of the cache and of the campaign"""
+
+        return self.__generation, self.__campaigns_generations.get(campaign_code, 0)
+
+    @staticmethod
+    def __get_size(cached_response: CachedResponse) -> int:
+        """Get size of a cached response"""
+
+        return len(cached_response.body) + sum(
+            len(x) for x in cached_response.compressed.values()
+        )
@@ -0,0 +1,386 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import hashlib
+import logging
+import os
+import socket
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from threading import Lock
+from urllib.parse import urlparse
+
+from app.core.settings import get_settings
+from app.logginglib import init_custom_logger
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+settings = get_settings()
+
+# Minimum amount of seconds between two sweeps of the disk backend
+DISK_SWEEP_INTERVAL_SECONDS = 60
+
+# Maximum amount of idle connections kept by the Redis backend
+REDIS_MAX_IDLE_CONNECTIONS = 8
+
+# Amount of seconds the Redis backend is bypassed after a connection failure, doubled on each consecutive failure
+REDIS_BACKOFF_SECONDS = 5
+REDIS_BACKOFF_MAX_SECONDS = 300
+
+
+class ApiCacheBackend(ABC):
+    """
+    Second level cache for API responses shared between processes or instances.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Get value"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes):
+        """Set value"""
+
+
+class DiskApiCacheBackend(ApiCacheBackend):
+    """
+    Stores values as files in a directory.
+    Expired files are removed and the total size of the files is kept below max_bytes by removing the oldest files,
+    the directory is swept at most once every DISK_SWEEP_INTERVAL_SECONDS.
+    """
+
+    def __init__(self, directory: str, ttl_seconds: int = 0, max_bytes: int = 0):
+        self.__directory = directory
+        self.__ttl_seconds = ttl_seconds
+        self.__max_bytes = max_bytes
+
+        self.__sweep_lock = Lock()
+        self.__last_sweep_time = 0.0
+
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def get(self, key: str) -> bytes | None:
+        """Get value"""
+
+        filepath = self.__get_filepath(key)
+        try:
+            if self.__ttl_seconds > 0:
+                if time.time() - os.path.getmtime(filepath) > self.__ttl_seconds:
+                    return None
+            with open(filepath, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    def set(self, key: str, value: bytes):
+        """Set value"""
+
+        # Write to a tmp file first, readers never see a partially written file
+        fd, tmp_filepath = tempfile.mkstemp(dir=self.__directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(value)
+            os.replace(tmp_filepath, self.__get_filepath(key))
+        except (Exception,):
+            if os.path.exists(tmp_filepath):
+                os.remove(tmp_filepath)
+            raise
+
+        if time.monotonic() - self.__last_sweep_time > DISK_SWEEP_INTERVAL_SECONDS:
+            self.sweep()
+
+    def sweep(self):
+        """Remove expired files, then remove the oldest files until the total size is below max_bytes"""
+
+        # Only one thread sweeps at a time, other threads skip
+        if not self.__sweep_lock.acquire(blocking=False):
+            return
+
+        try:
+            self.__last_sweep_time = time.monotonic()
+            now = time.time()
+
+            files = []
+            with os.scandir(self.__directory) as entries:
+                for entry in entries:
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    if entry.name.endswith(".tmp"):
+                        # Skip tmp files being written, unless they were left behind
+                        if now - stat.st_mtime > DISK_SWEEP_INTERVAL_SECONDS:
+                            self.__remove_file(entry.path)
+                        continue
+                    if (
+                        self.__ttl_seconds > 0
+                        and now - stat.st_mtime > self.__ttl_seconds
+                    ):
+                        self.__remove_file(entry.path)
+                        continue
+                    files.append((stat.st_mtime, stat.st_size, entry.path))
+
+            if self.__max_bytes > 0:
+                total_size = sum(x[1] for x in files)
+                if total_size > self.__max_bytes:
+                    files.sort()
+                    for _, size, filepath in files:
+                        if total_size <= self.__max_bytes:
+                            break
+                        self.__remove_file(filepath)
+                        total_size -= size
+        finally:
+            self.__sweep_lock.release()
+
+    @staticmethod
+    def __remove_file(filepath: str):
+        """Remove file, it might have been removed by another process"""
+
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+
+    def __get_filepath(self, key: str) -> str:
+        """Get filepath of key"""
+
+        return os.path.join(self.__directory, hashlib.sha256(key.encode()).hexdigest())
+
+
+class RedisConnection:
+    """
+    A connection to a server that speaks the Redis protocol (RESP).
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        password: str | None,
+        db: str,
+        timeout_seconds: float,
+    ):
+        self.__socket = socket.create_connection((host, port), timeout=timeout_seconds)
+        self.__reader = self.__socket.makefile("rb")
+
+        try:
+            if password:
+                self.execute("AUTH", password)
+            if db:
+                self.execute("SELECT", db)
+        except (Exception,):
+            self.close()
+            raise
+
+    def close(self):
+        """Close connection"""
+
+        try:
+            self.__reader.close()
+            self.__socket.close()
+        except OSError:
+            pass
+
+    def execute(self, *args: str | bytes):
+        """Send command and read reply"""
+
+        command = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            if isinstance(arg, str):
+                arg = arg.encode()
+            command.append(f"${len(arg)}\r\n".encode())
+            command.append(arg)
+            command.append(b"\r\n")
+        self.__socket.sendall(b"".join(command))
+
+        return self.__read_reply()
+
+    def __read_reply(self):
+        """Read reply"""
+
+        line = self.__reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server.")
+
+        reply_type, data = line[:1], line[1:-2]
+        if reply_type == b"+":
+            return data
+        if reply_type == b"-":
+            raise Exception(f"Redis error: {data.decode()}")
+        if reply_type == b":":
+            return int(data)
+        if reply_type == b"$":
+            length = int(data)
+            if length == -1:
+                return None
+            value = self.__reader.read(length + 2)
+
+            return value[:-2]
+        if reply_type == b"*":
+            length = int(data)
+            if length == -1:
+                return None
+
+            return [self.__read_reply() for _ in range(length)]
+
+        raise ConnectionError(f"Unknown reply type: {reply_type}.")
+
+
+class RedisApiCacheBackend(ApiCacheBackend):
+    """
+    Stores values in a server that speaks the Redis protocol (RESP) e.g. Redis, Valkey or Memorystore.
+    Each command uses an idle connection from a pool, or a new connection if there is none.
+    After a connection failure the server is bypassed (get returns None, set does nothing) for a backoff period that
+    doubles on each consecutive failure, requests do not wait on an unavailable server.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 0, timeout_seconds: float = 1.0):
+        parsed_url = urlparse(url)
+        self.__host = parsed_url.hostname or "localhost"
+        self.__port = parsed_url.port or 6379
+        self.__password = parsed_url.password
+        self.__db = parsed_url.path.lstrip("/")
+        self.__ttl_seconds = ttl_seconds
+        self.__timeout_seconds = timeout_seconds
+
+        self.__idle_connections: list[RedisConnection] = []
+        self.__lock = Lock()
+
+        self.__failures = 0
+        self.__bypass_until = 0.0
+
+    def get(self, key: str) -> bytes | None:
+        """Get value"""
+
+        return self.__execute("GET", key)
+
+    def set(self, key: str, value: bytes):
+        """Set value"""
+
+        if self.__ttl_seconds > 0:
+            self.__execute("SET", key, value, "EX", str(self.__ttl_seconds))
+        else:
+            self.__execute("SET", key, value)
+
+    def __execute(self, *args: str | bytes):
+        """
+        Execute command.
+        A failed idle connection might have been closed by the server, the command is retried once on a new connection.
+        """
+
+        if time.monotonic() < self.__bypass_until:
+            return None
+
+        connection = self.__get_idle_connection()
+        if connection:
+            try:
+                reply = connection.execute(*args)
+            except (ConnectionError, socket.timeout, OSError):
+                connection.close()
+            else:
+                self.__release_connection(connection)
+
+                return reply
+
+        connection = None
+        try:
+            connection = RedisConnection(
+                host=self.__host,
+                port=self.__port,
+                password=self.__password,
+                db=self.__db,
+                timeout_seconds=self.__timeout_seconds,
+            )
+            reply = connection.execute(*args)
+        except (ConnectionError, socket.timeout, OSError) as e:
+            if connection:
+                connection.close()
+            self.__on_failure(e)
+
+            return None
+        self.__release_connection(connection)
+
+        return reply
+
+    def __get_idle_connection(self) -> RedisConnection | None:
+        """Get an idle connection from the pool"""
+
+        with self.__lock:
+            if self.__idle_connections:
+                return self.__idle_connections.pop()
+
+        return None
+
+    def __release_connection(self, connection: RedisConnection):
+        """Return the connection to the pool, reset the failures"""
+
+        with self.__lock:
+            self.__failures = 0
+            if len(self.__idle_connections) < REDIS_MAX_IDLE_CONNECTIONS:
+                self.__idle_connections.append(connection)
+                return
+
+        connection.close()
+
+    def __on_failure(self, e: Exception):
+        """Bypass the server for a backoff period"""
+
+        with self.__lock:
+            self.__failures += 1
+            backoff_seconds = min(
+                REDIS_BACKOFF_SECONDS * 2 ** (self.__failures - 1),
+                REDIS_BACKOFF_MAX_SECONDS,
+            )
+            self.__bypass_until = time.monotonic() + backoff_seconds
+
+            # Connections in the pool are most likely broken as well
+            idle_connections = self.__idle_connections
+            self.__idle_connections = []
+
+        for connection in idle_connections:
+            connection.close()
+
+        logger.warning(
+            f"Could not connect to API cache backend, bypassing it for {backoff_seconds} seconds: {str(e)}"
+        )
+
+
+def get_api_cache_backend() -> ApiCacheBackend | None:
+    """Get the second level API cache backend configured in settings"""
+
+    if settings.API_CACHE_BACKEND == "disk":
+        return DiskApiCacheBackend(
+            directory=settings.API_CACHE_DISK_DIRECTORY,
+            ttl_seconds=settings.API_CACHE_TTL_SECONDS,
+            max_bytes=settings.API_CACHE_DISK_MAX_BYTES,
+        )
+    if settings.API_CACHE_BACKEND == "redis":
+        return RedisApiCacheBackend(
+            url=settings.API_CACHE_REDIS_URL,
+            ttl_seconds=settings.API_CACHE_TTL_SECONDS,
+        )
+
+    return None
@@ -24,9 +24,7 @@ SOFTWARE.
 """
 
 import datetime
-from io import StringIO
 
-import pandas as pd
 from azure.storage.blob import (
     ContainerClient,
     BlobSasPermissions,
@@ -90,27 +88,24 @@ def clear_container(container_name: str, skip_blobs: list[str]):
         container_client.delete_blob(blob.name)
 
 
-def upload_df_as_csv(container_name: str, df: pd.DataFrame, csv_filename: str):
-    """Upload dataframe as CSV"""
-
-    # Save to buffer
-    buffer = StringIO()
-    df.to_csv(path_or_buf=buffer, index=False, header=True)
+def upload_file(container_name: str, source_filename: str, blob_name: str):
+    """Upload file"""
 
     # Get blob client
     blob_client = BlobClient.from_connection_string(
         conn_str=settings.AZURE_STORAGE_CONNECTION_STRING,
         container_name=container_name,
-        blob_name=csv_filename,
+        blob_name=blob_name,
         max_block_size=4 * 1024 * 1024,  # 4mb
         max_single_put_size=16 * 1024 * 1024,  # 16mb
     )
 
     # Upload
-    blob_client.upload_blob(
-        data=buffer.getvalue(),
-        connection_timeout=10 * 60,  # 10 minutes
-    )
+    with open(source_filename, "rb") as file:
+        blob_client.upload_blob(
+            data=file,
+            connection_timeout=10 * 60,  # 10 minutes
+        )
 
 
 def blob_exists(container_name: str, blob_name: str) -> bool:
@@ -26,24 +26,35 @@ SOFTWARE.
 import logging
 import operator
 import os
-import random
 from collections import Counter
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
+from typing import Any, Callable, Iterator
 
 import numpy as np
 import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
 from app import constants, utils
 from app import crud
 from app import global_variables
 from app.core.settings import get_settings
+from app.enums.campaign_section import CampaignSection
 from app.enums.legacy_campaign_code import LegacyCampaignCode
 from app.helpers import category_hierarchy
+from app.helpers import content_encoding
+from app.helpers import cursors
 from app.helpers import filters
+from app.helpers import membership_counts
 from app.helpers import q_col_names
+from app.helpers import row_selection
 from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
+from app.helpers.ngram_table import NgramTable
 from app.logginglib import init_custom_logger
 from app.schemas.campaign import Campaign
+from app.schemas.facet_counts import FacetCounts
 from app.schemas.filter import Filter
 from app.schemas.filter_options import FilterOptions
 from app.schemas.option_bool import OptionBool
@@ -51,9 +62,10 @@ from app.schemas.option_str import OptionStr
 from app.schemas.q_code import Question
 from app.schemas.response_column import ResponseSampleColumn
 from app.schemas.response_topic import ResponseTopic
+from app.schemas.responses_page import ResponsesPage
 from app.services import azure_blob_storage_interactions
 from app.services import google_cloud_storage_interactions
-from app.services import google_maps_interactions
+from app.services.region_geocoder import RegionGeocoder
 from app.services.translator import Translator
 from app.types import TCloudService
 
@@ -65,6 +77,70 @@ settings = get_settings()
 # Cloud service
 CLOUD_SERVICE: TCloudService = settings.CLOUD_SERVICE
 
+# Executor for computing campaign sections concurrently
+if settings.CAMPAIGN_SECTIONS_EXECUTOR == "thread":
+    sections_executor = ThreadPoolExecutor(
+        max_workers=settings.CAMPAIGN_SECTIONS_WORKERS,
+        thread_name_prefix="campaign-sections",
+    )
+
+    def __reset_sections_executor():
+        """The threads of the executor do not exist in a forked process, create a new executor"""
+
+        global sections_executor
+        sections_executor = ThreadPoolExecutor(
+            max_workers=settings.CAMPAIGN_SECTIONS_WORKERS,
+            thread_name_prefix="campaign-sections",
+        )
+
+    os.register_at_fork(after_in_child=__reset_sections_executor)
+else:
+    sections_executor = None
+
+# Amount of responses built and serialized at a time when streaming responses
+RESPONSES_NDJSON_CHUNK_SIZE = 500
+
+# Amount of rows encoded at a time when streaming the campaign data as CSV
+CSV_EXPORT_CHUNK_SIZE = 10000
+
+# Date format of the campaign data CSV (filename and ingestion time)
+CSV_EXPORT_DATE_FORMAT = "%Y_%m_%d"
+
+# Fields of the filters that select the options of each facet
+# Options of a facet are counted without these fields, so other options of the same facet can still be selected
+FACET_FILTER_FIELDS: dict[str, tuple[str, ...]] = {
+    "countries": ("countries",),
+    "regions": ("regions", "provinces"),
+    "provinces": ("regions", "provinces"),
+    "response_topics": ("response_topics",),
+    "ages": ("ages", "age_buckets"),
+    "age_buckets": ("ages", "age_buckets"),
+    "age_buckets_default": ("ages", "age_buckets"),
+    "genders": ("genders",),
+    "living_settings": ("living_settings",),
+    "professions": ("professions",),
+    "years": ("years",),
+}
+
+# Quantiles included in the age summary
+AGE_SUMMARY_QUANTILES = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+# Sections included if no sections were requested
+DEFAULT_SECTIONS: list[CampaignSection] = [
+    x for x in CampaignSection if x != CampaignSection.age_summary
+]
+
+# Empty values of sections with texts, used in place of sections that were not requested while translating
+EMPTY_SECTIONS: dict[CampaignSection, dict | list] = {
+    CampaignSection.top_words_and_phrases: {},
+    CampaignSection.responses_sample: {},
+    CampaignSection.responses_breakdown: {},
+    CampaignSection.living_settings_breakdown: [],
+    CampaignSection.histogram: {},
+    CampaignSection.genders_breakdown: [],
+    CampaignSection.world_bubble_maps_coordinates: {},
+}
+
 
 class CampaignService:
     """
@@ -108,45 +184,6 @@ class CampaignService:
         if self.__language != "en":
             self.__translate_filter_keywords_to_en()
 
-        # Get dataframe
-        df = self.__crud.get_dataframe()
-
-        # Filter response year
-        if self.__response_year:
-            df = df[df["response_year"] == self.__response_year]
-
-        # Apply filter 1
-        if self.__filter_1:
-            self.__df_1 = filters.apply_filter_to_df(
-                df=df,
-                data_filter=self.__filter_1,
-                campaign_crud=self.__crud,
-                campaign_code=self.__campaign_code,
-            )
-        else:
-            self.__df_1 = df
-
-        # Apply filter 2
-        if self.__filter_2:
-            self.__df_2 = filters.apply_filter_to_df(
-                df=df,
-                data_filter=self.__filter_2,
-                campaign_crud=self.__crud,
-                campaign_code=self.__campaign_code,
-            )
-        else:
-            self.__df_2 = df
-
-        # Filter 1 description
-        self.__filter_1_description = self.__get_filter_description(
-            respondents_count=len(self.__df_1.index), data_filter=self.__filter_1
-        )
-
-        # Filter 2 description
-        self.__filter_2_description = self.__get_filter_description(
-            respondents_count=len(self.__df_2.index), data_filter=self.__filter_2
-        )
-
         # If filter 1 was requested, then do not use the cached ngrams
         self.__filter_1_use_ngrams_unfiltered = True
         if self.__filter_1 and not filters.check_if_filter_is_default(
@@ -161,37 +198,27 @@ class CampaignService:
         ):
             self.__filter_2_use_ngrams_unfiltered = False
 
-        # Campaign question codes
-        self.__campaign_q_codes = self.__crud.get_q_codes()
-
-        # Ngrams
-        self.__ngrams_1 = {}
-        self.__ngrams_2 = {}
-        for q_code in self.__campaign_q_codes:
-            # Ngrams 1
-            if self.__filter_1:
-                self.__ngrams_1[q_code] = self.__get_ngrams_1(
-                    only_multi_word_phrases_containing_filter_term=self.__filter_1.only_multi_word_phrases_containing_filter_term,
-                    keyword=self.__filter_1.keyword_filter,
-                    q_code=q_code,
-                )
-            else:
-                self.__ngrams_1[q_code] = self.__get_ngrams_1(
-                    only_multi_word_phrases_containing_filter_term=False,
-                    keyword="",
-                    q_code=q_code,
-                )
-
-            # Ngrams 2
-            self.__ngrams_2[q_code] = self.__get_ngrams_2(q_code=q_code)
-
         # Check if filters are identical or not
         self.__filters_are_identical = filters.check_if_filters_are_identical(
             filter_1=filter_1, filter_2=filter_2
         )
 
-    def get_campaign(self, q_code: str) -> Campaign:
-        """Get campaign"""
+        # Filtered dataframes, ngrams, filter descriptions and sections are computed on first use
+        self.__memo: dict[tuple, Future] = {}
+        self.__memo_lock = threading.Lock()
+
+    def get_campaign(
+        self, q_code: str, sections: list[CampaignSection] = None
+    ) -> Campaign:
+        """
+        Get campaign.
+
+        :param q_code: The question code.
+        :param sections: The sections to include, if not provided the default sections are included.
+        """
+
+        if sections is None:
+            sections = DEFAULT_SECTIONS
 
         # Included response years
         if self.__response_year:
@@ -199,48 +226,26 @@ class CampaignService:
         else:
             current_response_years = self.__all_response_years
 
-        # Top words and phrases
-        top_words_and_phrases = {
-            "top_words": self.__get_top_words(q_code=q_code),
-            "two_word_phrases": self.__get_two_word_phrases(q_code=q_code),
-            "three_word_phrases": self.__get_three_word_phrases(q_code=q_code),
-            "wordcloud_words": self.__get_wordcloud_words(q_code=q_code),
-        }
-
-        # Responses sample
-        responses_sample = {
-            "columns": [x.dict() for x in self.__get_responses_sample_columns()],
-            "data": self.__get_responses_sample(q_code=q_code),
-        }
-
-        # Responses breakdown
-        responses_breakdown = self.__get_responses_breakdown(q_code=q_code)
-
-        # Living settings breakdown
-        living_settings_breakdown = self.__get_living_settings_breakdown()
-
-        # Histogram
-        histogram = self.__get_histogram()
-
-        # Genders breakdown
-        genders_breakdown = self.__get_genders_breakdown()
-
-        # World bubble maps coordinates
-        world_bubble_maps_coordinates = self.__get_world_bubble_maps_coordinates()
+        # Sections
+        campaign_sections = self.__get_sections(sections=sections, q_code=q_code)
 
         # Respondents count
-        filter_1_respondents_count = self.__get_respondents_count(df=self.__df_1)
-        filter_2_respondents_count = self.__get_respondents_count(df=self.__df_2)
+        filter_1_respondents_count = self.__get_respondents_count(df=self.__get_df_1())
+        filter_2_respondents_count = self.__get_respondents_count(df=self.__get_df_2())
 
         # Average age
-        filter_1_average_age = self.__get_average_age(df=self.__df_1)
-        filter_2_average_age = self.__get_average_age(df=self.__df_2)
-        filter_1_average_age_bucket = self.__get_average_age_bucket(df=self.__df_1)
-        filter_2_average_age_bucket = self.__get_average_age_bucket(df=self.__df_2)
+        filter_1_average_age = self.__get_average_age(df=self.__get_df_1())
+        filter_2_average_age = self.__get_average_age(df=self.__get_df_2())
+        filter_1_average_age_bucket = self.__get_average_age_bucket(
+            df=self.__get_df_1()
+        )
+        filter_2_average_age_bucket = self.__get_average_age_bucket(
+            df=self.__get_df_2()
+        )
 
         # Filters Description
-        filter_1_description = self.__filter_1_description
-        filter_2_description = self.__filter_2_description
+        filter_1_description = self.__get_filter_1_description()
+        filter_2_description = self.__get_filter_2_description()
 
         # Filters are identical
         filters_are_identical = self.__get_filters_are_identical()
@@ -270,6 +275,12 @@ class CampaignService:
                 translator = Translator(cloud_service=CLOUD_SERVICE)
                 translator.set_target_language(target_language=self.__language)
 
+                # Sections that were not requested are translated as empty values
+                sections_to_translate = {
+                    section.value: campaign_sections.get(section.value, empty_section)
+                    for section, empty_section in EMPTY_SECTIONS.items()
+                }
+
                 # Extract texts
                 translator.apply_t_function_campaign(
                     t=translator.extract_text,
@@ -277,13 +288,7 @@ class CampaignService:
                     language=self.__language,
                     current_question=current_question,
                     all_questions=all_questions,
-                    responses_sample=responses_sample,
-                    responses_breakdown=responses_breakdown,
-                    living_settings_breakdown=living_settings_breakdown,
-                    top_words_and_phrases=top_words_and_phrases,
-                    histogram=histogram,
-                    genders_breakdown=genders_breakdown,
-                    world_bubble_maps_coordinates=world_bubble_maps_coordinates,
+                    **sections_to_translate,
                     filter_1_average_age=filter_1_average_age,
                     filter_2_average_age=filter_2_average_age,
                     filter_1_description=filter_1_description,
@@ -300,13 +305,7 @@ class CampaignService:
                     language=self.__language,
                     current_question=current_question,
                     all_questions=all_questions,
-                    responses_sample=responses_sample,
-                    responses_breakdown=responses_breakdown,
-                    living_settings_breakdown=living_settings_breakdown,
-                    top_words_and_phrases=top_words_and_phrases,
-                    histogram=histogram,
-                    genders_breakdown=genders_breakdown,
-                    world_bubble_maps_coordinates=world_bubble_maps_coordinates,
+                    **sections_to_translate,
                     filter_1_average_age=filter_1_average_age,
                     filter_2_average_age=filter_2_average_age,
                     filter_1_description=filter_1_description,
@@ -316,17 +315,11 @@ class CampaignService:
                 # Apply translations to texts
                 current_question = translations_result["current_question"]
                 all_questions = translations_result["all_questions"]
-                responses_sample = translations_result["responses_sample"]
-                responses_breakdown = translations_result["responses_breakdown"]
-                living_settings_breakdown = translations_result[
-                    "living_settings_breakdown"
-                ]
-                top_words_and_phrases = translations_result["top_words_and_phrases"]
-                histogram = translations_result["histogram"]
-                genders_breakdown = translations_result["genders_breakdown"]
-                world_bubble_maps_coordinates = translations_result[
-                    "world_bubble_maps_coordinates"
-                ]
+                for section_name in sections_to_translate.keys():
+                    if section_name in campaign_sections:
+                        campaign_sections[section_name] = translations_result[
+                            section_name
+                        ]
                 filter_1_average_age = translations_result["filter_1_average_age"]
                 filter_2_average_age = translations_result["filter_2_average_age"]
                 filter_1_description = translations_result["filter_1_description"]
@@ -336,19 +329,14 @@ class CampaignService:
                     f"An error occurred during translation of campaign: {str(e)}"
                 )
 
-        return Campaign(
+        # Sections are built with the types of the model, skip validation
+        return Campaign.construct(
             campaign_code=self.__campaign_code,
             current_question=current_question,
             all_questions=all_questions,
             current_response_years=current_response_years,
             all_response_years=self.__all_response_years,
-            responses_sample=responses_sample,
-            responses_breakdown=responses_breakdown,
-            living_settings_breakdown=living_settings_breakdown,
-            top_words_and_phrases=top_words_and_phrases,
-            histogram=histogram,
-            genders_breakdown=genders_breakdown,
-            world_bubble_maps_coordinates=world_bubble_maps_coordinates,
+            **campaign_sections,
             filter_1_respondents_count=filter_1_respondents_count,
             filter_2_respondents_count=filter_2_respondents_count,
             filter_1_average_age=filter_1_average_age,
@@ -360,6 +348,169 @@ class CampaignService:
             filters_are_identical=filters_are_identical,
         )
 
+    def __memoize(self, key: tuple, func: Callable) -> Any:
+        """
+        Compute a value on first use and keep it for this service instance.
+        If sections are computed concurrently, a value being computed by another thread is waited for.
+        """
+
+        with self.__memo_lock:
+            future = self.__memo.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.__memo[key] = future
+
+        if is_owner:
+            try:
+                future.set_result(func())
+            except BaseException as e:
+                # Do not keep the error, the value can be computed again
+                with self.__memo_lock:
+                    self.__memo.pop(key, None)
+                future.set_exception(e)
+                raise
+
+        return future.result()
+
+    def __get_sections(
+        self, sections: list[CampaignSection], q_code: str
+    ) -> dict[str, dict | list]:
+        """Get sections, computed concurrently if a sections executor is configured"""
+
+        sections = [x for x in CampaignSection if x in sections]
+
+        if not sections_executor or len(sections) < 2:
+            return {
+                section.value: self.__get_section(section=section, q_code=q_code)
+                for section in sections
+            }
+
+        # The filtered dataframes are shared by the sections, compute them before dispatching
+        self.__get_df_1()
+        self.__get_df_2()
+
+        futures = {
+            section.value: sections_executor.submit(
+                self.__get_section, section=section, q_code=q_code
+            )
+            for section in sections
+        }
+
+        return {
+            section_name: future.result() for section_name, future in futures.items()
+        }
+
+    def __get_section(self, section: CampaignSection, q_code: str) -> dict | list:
+        """Get section"""
+
+        if section == CampaignSection.top_words_and_phrases:
+            func = lambda: {
+                "top_words": self.__get_top_words(q_code=q_code),
+                "two_word_phrases": self.__get_two_word_phrases(q_code=q_code),
+                "three_word_phrases": self.__get_three_word_phrases(q_code=q_code),
+                "wordcloud_words": self.__get_wordcloud_words(q_code=q_code),
+            }
+        elif section == CampaignSection.responses_sample:
+            func = lambda: {
+                "columns": [x.dict() for x in self.__get_responses_sample_columns()],
+                **self.__get_responses_sample(q_code=q_code),
+            }
+        elif section == CampaignSection.responses_breakdown:
+            func = lambda: self.__get_responses_breakdown(q_code=q_code)
+        elif section == CampaignSection.living_settings_breakdown:
+            func = self.__get_living_settings_breakdown
+            q_code = ""
+        elif section == CampaignSection.histogram:
+            func = self.__get_histogram
+            q_code = ""
+        elif section == CampaignSection.genders_breakdown:
+            func = self.__get_genders_breakdown
+            q_code = ""
+        elif section == CampaignSection.world_bubble_maps_coordinates:
+            func = self.__get_world_bubble_maps_coordinates
+            q_code = ""
+        elif section == CampaignSection.age_summary:
+            func = lambda: {
+                "filter_1": self.__get_age_summary(df=self.__get_df_1()),
+                "filter_2": self.__get_age_summary(df=self.__get_df_2()),
+            }
+            q_code = ""
+        else:
+            raise Exception(f"Unknown section {section}.")
+
+        return self.__memoize(key=(section, q_code), func=func)
+
+    def __get_df(self) -> pd.DataFrame:
+        """Get dataframe (filtered by response year)"""
+
+        def get_df() -> pd.DataFrame:
+            df = self.__crud.get_dataframe()
+
+            # Filter response year
+            if self.__response_year:
+                df = df[df["response_year"] == self.__response_year]
+
+            return df
+
+        return self.__memoize(key=("df",), func=get_df)
+
+    def __get_df_1(self) -> pd.DataFrame:
+        """Get dataframe 1"""
+
+        def get_df_1() -> pd.DataFrame:
+            # Apply filter 1
+            if self.__filter_1:
+                return filters.apply_filter_to_df(
+                    df=self.__get_df(),
+                    data_filter=self.__filter_1,
+                    campaign_crud=self.__crud,
+                    campaign_code=self.__campaign_code,
+                )
+
+            return self.__get_df()
+
+        return self.__memoize(key=("df_1",), func=get_df_1)
+
+    def __get_df_2(self) -> pd.DataFrame:
+        """Get dataframe 2"""
+
+        def get_df_2() -> pd.DataFrame:
+            # Apply filter 2
+            if self.__filter_2:
+                return filters.apply_filter_to_df(
+                    df=self.__get_df(),
+                    data_filter=self.__filter_2,
+                    campaign_crud=self.__crud,
+                    campaign_code=self.__campaign_code,
+                )
+
+            return self.__get_df()
+
+        return self.__memoize(key=("df_2",), func=get_df_2)
+
+    def __get_filter_1_description(self) -> str:
+        """Get filter 1 description"""
+
+        return self.__memoize(
+            key=("filter_1_description",),
+            func=lambda: self.__get_filter_description(
+                respondents_count=len(self.__get_df_1().index),
+                data_filter=self.__filter_1,
+            ),
+        )
+
+    def __get_filter_2_description(self) -> str:
+        """Get filter 2 description"""
+
+        return self.__memoize(
+            key=("filter_2_description",),
+            func=lambda: self.__get_filter_description(
+                respondents_count=len(self.__get_df_2().index),
+                data_filter=self.__filter_2,
+            ),
+        )
+
     def get_filter_options(self) -> FilterOptions:
         """Get filter options"""
 
@@ -384,7 +535,8 @@ class CampaignService:
             }
 
             provinces_found = set()
-            for region in sorted(country.regions, key=lambda r: r.name):
+            # Regions are sorted by name
+            for region in country.regions:
                 # Region
                 region_options["options"].append(
                     OptionStr(value=region.code, label=region.name).dict()
@@ -581,6 +733,120 @@ class CampaignService:
             only_multi_word_phrases_containing_filter_term=only_multi_word_phrases_containing_filter_term_options,
         )
 
+    def get_filter_options_payload(self) -> content_encoding.EncodedPayload:
+        """
+        Get filter options serialized as JSON and precompressed.
+
+        Created once per language and stored in the campaign's db, cleared when the data is reloaded.
+        """
+
+        payload = self.__crud.get_filter_options_payload(language=self.__language)
+        if payload is None:
+            payload = content_encoding.EncodedPayload(
+                body=JSONResponse(
+                    content=jsonable_encoder(self.get_filter_options())
+                ).body
+            )
+            self.__crud.set_filter_options_payload(
+                language=self.__language, payload=payload
+            )
+
+        return payload
+
+    def get_facet_counts(self, q_code: str) -> FacetCounts:
+        """
+        Get the respondents count of each filter option in filter 1 and filter 2.
+
+        The options of a facet are counted with the filters of all other facets applied, but not with the facet's own
+        filter (disjunctive facets), this is the count the respondents would have if the option is also selected.
+        All options of a facet are counted in a single pass.
+        """
+
+        def get_dimension_facet_counts(facet: str, column_name: str) -> list[dict]:
+            """Get dimension facet counts"""
+
+            codes, labels = self.__crud.get_dimension_codes(column_names=(column_name,))
+            counts_1, counts_2 = membership_counts.count_per_filter(
+                codes=codes,
+                membership=self.__get_facet_membership(facet=facet),
+                codes_count=len(labels),
+            )
+
+            return [
+                {"value": label, "count_1": count_1, "count_2": count_2}
+                for label, count_1, count_2 in zip(
+                    labels.tolist(), counts_1.tolist(), counts_2.tolist()
+                )
+                if label
+            ]
+
+        def get_category_facet_counts(column_name: str) -> dict[str, tuple[int, int]]:
+            """Get category facet counts, each category is counted once per row"""
+
+            rows, codes, labels = self.__crud.get_category_codes(
+                column_name=column_name
+            )
+            rows, codes = membership_counts.unique_entries(
+                rows=rows, codes=codes, codes_count=len(labels)
+            )
+            membership = self.__get_facet_membership(facet="response_topics")
+            counts_1, counts_2 = membership_counts.count_per_filter(
+                codes=codes, membership=membership[rows], codes_count=len(labels)
+            )
+
+            return dict(zip(labels.tolist(), zip(counts_1.tolist(), counts_2.tolist())))
+
+        # Response topic counts
+        parent_category_counts = get_category_facet_counts(
+            column_name=q_col_names.get_parent_category_col_name(q_code=q_code)
+        )
+        sub_category_counts = get_category_facet_counts(
+            column_name=q_col_names.get_canonical_code_col_name(
+                q_code=q_code, campaign_code=self.__campaign_code
+            )
+        )
+        response_topic_counts = []
+        for response_topic in self.__get_response_topics():
+            if response_topic.is_parent:
+                counts = parent_category_counts.get(response_topic.code, (0, 0))
+            else:
+                counts = sub_category_counts.get(response_topic.code, (0, 0))
+            response_topic_counts.append(
+                {
+                    "value": response_topic.code,
+                    "count_1": counts[0],
+                    "count_2": counts[1],
+                }
+            )
+
+        return FacetCounts(
+            countries=get_dimension_facet_counts(
+                facet="countries", column_name="alpha2country"
+            ),
+            regions=get_dimension_facet_counts(facet="regions", column_name="region"),
+            provinces=get_dimension_facet_counts(
+                facet="provinces", column_name="province"
+            ),
+            response_topics=response_topic_counts,
+            ages=get_dimension_facet_counts(facet="ages", column_name="age"),
+            age_buckets=get_dimension_facet_counts(
+                facet="age_buckets", column_name="age_bucket"
+            ),
+            age_buckets_default=get_dimension_facet_counts(
+                facet="age_buckets_default", column_name="age_bucket_default"
+            ),
+            genders=get_dimension_facet_counts(facet="genders", column_name="gender"),
+            living_settings=get_dimension_facet_counts(
+                facet="living_settings", column_name="setting"
+            ),
+            professions=get_dimension_facet_counts(
+                facet="professions", column_name="profession"
+            ),
+            years=get_dimension_facet_counts(
+                facet="years", column_name="response_year"
+            ),
+        )
+
     def get_histogram_options(self) -> list[dict]:
         """Get histogram options"""
 
@@ -748,86 +1014,265 @@ class CampaignService:
 
         return responses_sample_columns
 
-    def __get_responses_sample(self, q_code: str) -> list[dict]:
-        """Get responses sample"""
+    def __get_responses_sample(self, q_code: str) -> dict:
+        """Get responses sample, only the first page of responses is included"""
 
-        # Get copy to not modify original
-        df_1 = self.__get_df_1_copy()
+        page_size = constants.RESPONSES_SAMPLE_PAGE_SIZE
+        rows = self.__get_responses_sample_rows(q_code=q_code, n=page_size)
 
-        response_sample_1 = self.__get_df_responses_sample(df=df_1, q_code=q_code)
+        return {
+            "data": self.__get_responses_sample_data(rows=rows, q_code=q_code),
+            "next_cursor": self.get_responses_next_cursor(
+                q_code=q_code, offset=0, limit=page_size
+            ),
+            "total_count": self.__get_responses_count(q_code=q_code),
+        }
 
-        # Only set responses_sample_2 if filter 2 was applied
-        if self.__filter_2:
-            # Get copy to not modify original
-            df_2 = self.__get_df_2_copy()
+    def get_responses_page(self, q_code: str, offset: int, limit: int) -> ResponsesPage:
+        """
+        Get a page of responses.
 
-            response_sample_2 = self.__get_df_responses_sample(df=df_2, q_code=q_code)
-        else:
-            response_sample_2 = []
+        The responses of filter 1 and filter 2 are interleaved, pages are stable for the same filters and data.
+        """
 
-        responses_sample = response_sample_1 + response_sample_2
+        rows = self.__get_responses_sample_rows(q_code=q_code, n=offset + limit)
+        data = self.__get_responses_sample_data(rows=rows[offset:], q_code=q_code)
 
-        # Shuffle
-        random.shuffle(responses_sample)
+        # Translate
+        if settings.TRANSLATIONS_ENABLED and self.__language != "en":
+            data = self.__translate_responses_sample_data(data=data)
 
-        return responses_sample
+        return ResponsesPage(
+            columns=[x.dict() for x in self.__get_responses_sample_columns()],
+            data=data,
+            next_cursor=self.get_responses_next_cursor(
+                q_code=q_code, offset=offset, limit=limit
+            ),
+            total_count=self.__get_responses_count(q_code=q_code),
+        )
 
-    def __get_df_responses_sample(self, df: pd.DataFrame, q_code: str) -> list[dict]:
-        """Get df responses sample"""
+    def iter_responses_ndjson(
+        self, q_code: str, offset: int, limit: int
+    ) -> Iterator[bytes]:
+        """Iterate over the responses of a page as lines of JSON, built in chunks"""
+
+        rows = self.__get_responses_sample_rows(q_code=q_code, n=offset + limit)
+        page_rows = rows[offset:]
+
+        for chunk_start in range(0, len(page_rows), RESPONSES_NDJSON_CHUNK_SIZE):
+            chunk_rows = page_rows[
+                chunk_start : chunk_start + RESPONSES_NDJSON_CHUNK_SIZE
+            ]
+            data = self.__get_responses_sample_data(rows=chunk_rows, q_code=q_code)
+
+            # Translate
+            if settings.TRANSLATIONS_ENABLED and self.__language != "en":
+                data = self.__translate_responses_sample_data(data=data)
+
+            yield b"".join(
+                JSONResponse(content=jsonable_encoder(x)).body + b"\n" for x in data
+            )
+
+    def get_responses_next_cursor(
+        self, q_code: str, offset: int, limit: int
+    ) -> str | None:
+        """Get the cursor of the page after a page of responses"""
+
+        if offset + limit < self.__get_responses_count(q_code=q_code):
+            return cursors.encode_cursor(
+                offset=offset + limit, version=self.__crud.get_version()
+            )
+
+        return None
+
+    def get_responses_offset(self, cursor: str) -> int:
+        """Get the offset of the page of responses at cursor"""
+
+        if not cursor:
+            return 0
+
+        return cursors.decode_cursor(cursor=cursor, version=self.__crud.get_version())
+
+    def __translate_responses_sample_data(self, data: list[dict]) -> list[dict]:
+        """Translate the data of responses"""
+
+        try:
+            translator = Translator(cloud_service=CLOUD_SERVICE)
+            translator.set_target_language(target_language=self.__language)
+            translator.apply_t_function_responses_sample(
+                t=translator.extract_text,
+                campaign_code=self.__campaign_code,
+                language=self.__language,
+                responses_sample={"data": data},
+            )
+            translator.translate_extracted_texts()
+
+            return translator.apply_t_function_responses_sample(
+                t=translator.translate_text,
+                campaign_code=self.__campaign_code,
+                language=self.__language,
+                responses_sample={"data": data},
+            )["data"]
+        except (Exception,) as e:
+            logger.warning(
+                f"An error occurred during translation of responses: {str(e)}"
+            )
+
+            return data
+
+    def __get_responses_sample_rows(self, q_code: str, n: int) -> np.ndarray:
+        """
+        Get the row ids of the first n responses of filter 1 and filter 2 in a seed-stable order.
+        The rows of filter 1 and filter 2 are interleaved.
+        """
+
+        rows_1 = self.__get_filter_responses_sample_rows(
+            q_code=q_code, in_filter=membership_counts.IN_FILTER_1, n=n
+        )
+
+        # Only include rows of filter 2 if filter 2 was applied
+        if not self.__filter_2:
+            return rows_1
+
+        rows_2 = self.__get_filter_responses_sample_rows(
+            q_code=q_code, in_filter=membership_counts.IN_FILTER_2, n=n
+        )
+
+        return row_selection.interleave_rows(rows_1=rows_1, rows_2=rows_2)[:n]
+
+    def __get_filter_responses_sample_rows(
+        self, q_code: str, in_filter: int, n: int
+    ) -> np.ndarray:
+        """
+        Get the row ids of the first n responses of a filter.
+        The ids precomputed by the loader are in a seeded random order, the ids in the filter keep this order and are
+        read lazily, only as many as needed for n responses.
+        """
+
+        n = min(n, self.__get_responses_sample_max_count())
+
+        responses_sample_rows = self.__get_all_responses_sample_rows(q_code=q_code)
+        if not self.__is_filtered(in_filter=in_filter):
+            return responses_sample_rows[:n]
+
+        return row_selection.select_rows(
+            rows=responses_sample_rows,
+            membership=self.__get_membership(),
+            in_filter=in_filter,
+            n=n,
+        )
+
+    def __get_responses_count(self, q_code: str) -> int:
+        """Get the amount of responses of filter 1 and filter 2 in all pages"""
+
+        def get_responses_count() -> int:
+            responses_sample_rows = self.__get_all_responses_sample_rows(q_code=q_code)
+            in_filters = [membership_counts.IN_FILTER_1]
+            if self.__filter_2:
+                in_filters.append(membership_counts.IN_FILTER_2)
+
+            count = 0
+            for in_filter in in_filters:
+                if self.__is_filtered(in_filter=in_filter):
+                    filter_count = np.count_nonzero(
+                        self.__get_membership()[responses_sample_rows] & in_filter
+                    )
+                else:
+                    filter_count = len(responses_sample_rows)
+                count += min(filter_count, self.__get_responses_sample_max_count())
+
+            return count
+
+        return self.__memoize(key=("responses_count", q_code), func=get_responses_count)
+
+    def __get_responses_sample_max_count(self) -> int:
+        """
+        Get the maximum amount of responses of a filter.
+        For languages that are not English the responses are translated, their amount is limited.
+        """
+
+        if self.__language == "en":
+            return np.iinfo(np.int64).max
+
+        if self.__filter_2:
+            return constants.N_RESPONSES_SAMPLE_NOT_ENGLISH // 2  # 50
+
+        return constants.N_RESPONSES_SAMPLE_NOT_ENGLISH  # 100
+
+    def __get_all_responses_sample_rows(self, q_code: str) -> np.ndarray:
+        """Get the row ids with a non-empty response and canonical code (precomputed by the loader)"""
 
-        # Set column names based on question code
-        description_col_name = q_col_names.get_description_col_name(q_code=q_code)
         canonical_code_col_name = q_col_names.get_canonical_code_col_name(
             q_code=q_code, campaign_code=self.__campaign_code
         )
-        response_col_name = q_col_names.get_response_col_name(q_code=q_code)
 
-        # Remove rows where response is empty
-        df = df[df[response_col_name] != ""]
+        return self.__crud.get_responses_sample_rows(
+            q_code=q_code, canonical_code_col_name=canonical_code_col_name
+        )
 
-        # Remove rows where canonical_code is empty
-        df = df[df[canonical_code_col_name] != ""]
+    def __is_filtered(self, in_filter: int) -> bool:
+        """Check if the filter selects fewer rows than all rows"""
 
-        # Limit the sample for languages that are not English
-        if self.__language == "en":
-            if self.__filter_2:
-                n_sample = constants.N_RESPONSES_SAMPLE // 2  # 500
-            else:
-                n_sample = constants.N_RESPONSES_SAMPLE  # 1000
+        if in_filter == membership_counts.IN_FILTER_1:
+            df = self.__get_df_1()
         else:
-            if self.__filter_2:
-                n_sample = constants.N_RESPONSES_SAMPLE // 2 // 10  # 50
-            else:
-                n_sample = constants.N_RESPONSES_SAMPLE // 10  # 100
+            df = self.__get_df_2()
 
-        if len(df.index) > 0:
-            if len(df.index) < n_sample:
-                n_sample = len(df.index)
-            df = df.sample(n=n_sample, random_state=1)
-        else:
+        return len(df.index) < self.__crud.get_rows_count()
+
+    def __get_responses_sample_data(self, rows: np.ndarray, q_code: str) -> list[dict]:
+        """Get the data of responses, only the rows requested are built from the column arrays"""
+
+        if len(rows) == 0:
             return []
 
-        df[description_col_name] = df[canonical_code_col_name].apply(
-            lambda x: self.__get_code_descriptions(x)
+        # Set column names based on question code
+        description_col_name = q_col_names.get_description_col_name(q_code=q_code)
+        canonical_code_col_name = q_col_names.get_canonical_code_col_name(
+            q_code=q_code, campaign_code=self.__campaign_code
         )
 
         # Column ids
         column_ids = self.__get_responses_sample_column_ids(q_code=q_code)
 
+        # Build the columns of the sampled rows only
+        mapping_to_description = category_hierarchy.get_mapping_code_to_description(
+            campaign_code=self.__campaign_code
+        )
+        columns: dict[str, np.ndarray | list] = {}
+        for column_id in column_ids:
+            if column_id == description_col_name:
+                canonical_codes = self.__crud.get_column_values(
+                    column_name=canonical_code_col_name, rows=rows
+                )
+                values = [
+                    self.__get_code_descriptions(
+                        code=x, mapping_to_description=mapping_to_description
+                    )
+                    for x in canonical_codes
+                ]
+            else:
+                values = self.__crud.get_column_values(column_name=column_id, rows=rows)
+
+            # Rename columns e.g. q1_response -> response
+            columns[column_id.replace(f"{q_code}_", "")] = values
+
         # For these campaigns use age if the value is available, else use age bucket
         if (
             self.__campaign_code == LegacyCampaignCode.dataexchange.value
             or self.__campaign_code == LegacyCampaignCode.allcampaigns.value
-        ) and "age" in column_ids:
-            df["age"] = np.where(df["age"] == "", df["age_bucket_default"], df["age"])
-
-        # Rename columns e.g. q1_response -> response
-        columns_to_rename = {x: x.replace(f"{q_code}_", "") for x in column_ids}
-        df = df.rename(columns=columns_to_rename)
+        ) and "age" in columns:
+            age_buckets_default = self.__crud.get_column_values(
+                column_name="age_bucket_default", rows=rows
+            )
+            columns["age"] = np.where(
+                columns["age"] == "", age_buckets_default, columns["age"]
+            )
 
-        responses_sample_data: list[dict] = df[columns_to_rename.values()].to_dict(
-            "records"
-        )
+        column_names = list(columns.keys())
+        responses_sample_data: list[dict] = [
+            dict(zip(column_names, row)) for row in zip(*columns.values())
+        ]
 
         return responses_sample_data
 
@@ -845,12 +1290,15 @@ class CampaignService:
 
         return [col.id for col in columns]
 
-    def __get_code_descriptions(self, code: str) -> str:
+    def __get_code_descriptions(
+        self, code: str, mapping_to_description: dict = None
+    ) -> str:
         """Get code descriptions"""
 
-        mapping_to_description = category_hierarchy.get_mapping_code_to_description(
-            campaign_code=self.__campaign_code
-        )
+        if mapping_to_description is None:
+            mapping_to_description = category_hierarchy.get_mapping_code_to_description(
+                campaign_code=self.__campaign_code
+            )
 
         descriptions = mapping_to_description.get(
             code,
@@ -987,50 +1435,44 @@ class CampaignService:
 
             return responses_breakdown_data
 
-        def get_df_responses_breakdown_parent_categories(
-            df: pd.DataFrame,
-        ) -> list[dict]:
+        def get_responses_breakdown_categories(
+            column_name: str,
+        ) -> tuple[list[dict], list[dict]]:
             """
-            Get df responses breakdown.
+            Get responses breakdown of filter 1 and filter 2.
 
-            Only parent categories.
+            Categories are counted in a single pass for both filters.
             """
 
             # Count occurrence of response topics (categories)
-            category_counter = Counter()
-            for parent_category in df[parent_category_col_name]:
-                # Check if the parent category was already included to not include it twice
-                seen_codes = set()
-
-                for c in parent_category.split("/"):
-                    if c:
-                        if c not in seen_codes:
-                            category_counter[c.strip()] += 1
-                        seen_codes.add(c)
+            category_counter_1, category_counter_2 = self.__get_category_counters(
+                column_name=column_name
+            )
 
-            responses_breakdown_data = category_counter_to_responses_breakdown_data(
-                category_counter
+            responses_breakdown_data_1 = category_counter_to_responses_breakdown_data(
+                category_counter_1
+            )
+            responses_breakdown_data_2 = category_counter_to_responses_breakdown_data(
+                category_counter_2
             )
 
-            return responses_breakdown_data
+            return responses_breakdown_data_1, responses_breakdown_data_2
 
-        def get_df_responses_breakdown_sub_categories(
+        def get_df_responses_breakdown_sub_categories_from_parent(
             df: pd.DataFrame,
-            include_only_sub_categories_from_parent: bool = False,
         ) -> list[dict]:
             """
             Get df responses breakdown.
 
-            Only sub-categories.
+            Only sub-categories from only_parent_category.
             """
 
             # Only keep parent category from only_parent_category
-            if include_only_sub_categories_from_parent and only_parent_category_found:
-                df = df[
-                    df[parent_category_col_name].str.contains(
-                        r"\b" + only_parent_category_found + r"\b", regex=True
-                    )
-                ]
+            df = df[
+                df[parent_category_col_name].str.contains(
+                    r"\b" + only_parent_category_found + r"\b", regex=True
+                )
+            ]
 
             mapping_code_to_parent_category = (
                 category_hierarchy.get_mapping_code_to_parent_category_code(
@@ -1045,15 +1487,9 @@ class CampaignService:
                     if c:
                         # Only count sub-categories from only_parent_category
                         if (
-                            include_only_sub_categories_from_parent
-                            and only_parent_category_found
+                            mapping_code_to_parent_category.get(c.strip())
+                            == only_parent_category_found
                         ):
-                            if (
-                                mapping_code_to_parent_category.get(c.strip())
-                                == only_parent_category_found
-                            ):
-                                category_counter[c.strip()] += 1
-                        else:
                             category_counter[c.strip()] += 1
 
             responses_breakdown_data = category_counter_to_responses_breakdown_data(
@@ -1068,27 +1504,25 @@ class CampaignService:
             if only_parent_category_found:
                 responses_breakdown_parent_1 = []
                 responses_breakdown_parent_2 = []
-                responses_breakdown_sub_1 = get_df_responses_breakdown_sub_categories(
-                    df=self.__get_df_1_copy(),
-                    include_only_sub_categories_from_parent=True,
-                )
-                responses_breakdown_sub_2 = get_df_responses_breakdown_sub_categories(
-                    df=self.__get_df_2_copy(),
-                    include_only_sub_categories_from_parent=True,
-                )
-
-            # Else get the parent categories breakdown
-            else:
-                responses_breakdown_parent_1 = (
-                    get_df_responses_breakdown_parent_categories(
+                responses_breakdown_sub_1 = (
+                    get_df_responses_breakdown_sub_categories_from_parent(
                         df=self.__get_df_1_copy()
                     )
                 )
-                responses_breakdown_parent_2 = (
-                    get_df_responses_breakdown_parent_categories(
+                responses_breakdown_sub_2 = (
+                    get_df_responses_breakdown_sub_categories_from_parent(
                         df=self.__get_df_2_copy()
                     )
                 )
+
+            # Else get the parent categories breakdown
+            else:
+                (
+                    responses_breakdown_parent_1,
+                    responses_breakdown_parent_2,
+                ) = get_responses_breakdown_categories(
+                    column_name=parent_category_col_name
+                )
                 responses_breakdown_sub_1 = []
                 responses_breakdown_sub_2 = []
         elif (
@@ -1097,25 +1531,19 @@ class CampaignService:
         ):
             responses_breakdown_parent_1 = []
             responses_breakdown_parent_2 = []
-            responses_breakdown_sub_1 = get_df_responses_breakdown_sub_categories(
-                df=self.__get_df_1_copy()
-            )
-            responses_breakdown_sub_2 = get_df_responses_breakdown_sub_categories(
-                df=self.__get_df_2_copy()
-            )
+            (
+                responses_breakdown_sub_1,
+                responses_breakdown_sub_2,
+            ) = get_responses_breakdown_categories(column_name=canonical_code_col_name)
         else:
-            responses_breakdown_parent_1 = get_df_responses_breakdown_parent_categories(
-                df=self.__get_df_1_copy()
-            )
-            responses_breakdown_parent_2 = get_df_responses_breakdown_parent_categories(
-                df=self.__get_df_2_copy()
-            )
-            responses_breakdown_sub_1 = get_df_responses_breakdown_sub_categories(
-                df=self.__get_df_1_copy()
-            )
-            responses_breakdown_sub_2 = get_df_responses_breakdown_sub_categories(
-                df=self.__get_df_2_copy()
-            )
+            (
+                responses_breakdown_parent_1,
+                responses_breakdown_parent_2,
+            ) = get_responses_breakdown_categories(column_name=parent_category_col_name)
+            (
+                responses_breakdown_sub_1,
+                responses_breakdown_sub_2,
+            ) = get_responses_breakdown_categories(column_name=canonical_code_col_name)
 
         # Get all unique codes from responses breakdown parent
         parent_codes_1 = [x[code_col_name] for x in responses_breakdown_parent_1]
@@ -1160,31 +1588,18 @@ class CampaignService:
     def __get_living_settings_breakdown(self) -> list[dict[str, int]]:
         """Get living setting settings breakdown"""
 
-        df_1 = self.__get_df_1_copy()
-        df_2 = self.__get_df_2_copy()
-
         # Get row count
-        grouped_by_column_1 = df_1.groupby("setting")["setting"].count()
-        grouped_by_column_2 = df_2.groupby("setting")["setting"].count()
+        counts = self.__get_dimension_counts(column_names=("setting",))
 
         # Add count
-        names = list(
-            set(grouped_by_column_1.index.tolist() + grouped_by_column_2.index.tolist())
-        )
+        names = list(counts.keys())
         names: list[str] = [name for name in names if name]
 
         living_settings_breakdown = []
 
         # Set count values
         for name in names:
-            try:
-                count_1 = grouped_by_column_1[name].item()
-            except KeyError:
-                count_1 = 0
-            try:
-                count_2 = grouped_by_column_2[name].item()
-            except KeyError:
-                count_2 = 0
+            count_1, count_2 = counts[name]
 
             # Value & label
             value = name
@@ -1229,16 +1644,13 @@ class CampaignService:
     def __get_wordcloud_words(self, q_code: str) -> list[dict]:
         """Get wordcloud words"""
 
-        unigram_count_dict_1 = self.__ngrams_1.get(q_code)
-        unigram_count_dict_2 = self.__ngrams_2.get(q_code)
-
-        unigram_count_dict_1 = unigram_count_dict_1[0] if unigram_count_dict_1 else ()
-        unigram_count_dict_2 = unigram_count_dict_2[0] if unigram_count_dict_2 else ()
+        unigram_table_1 = self.__get_ngrams_1(q_code=q_code)[0]
+        unigram_table_2 = self.__get_ngrams_2(q_code=q_code)[0]
 
         # Get wordcloud words
         wordcloud_words = self.__get_ngram_top_words_or_phrases(
-            ngram_count_dict_1=unigram_count_dict_1,
-            ngram_count_dict_2=unigram_count_dict_2,
+            ngram_table_1=unigram_table_1,
+            ngram_table_2=unigram_table_2,
         )
 
         if not wordcloud_words:
@@ -1266,16 +1678,13 @@ class CampaignService:
     def __get_top_words(self, q_code: str) -> list[dict]:
         """Get top words"""
 
-        unigram_count_dict_1 = self.__ngrams_1.get(q_code)
-        unigram_count_dict_2 = self.__ngrams_2.get(q_code)
-
-        unigram_count_dict_1 = unigram_count_dict_1[0] if unigram_count_dict_1 else ()
-        unigram_count_dict_2 = unigram_count_dict_2[0] if unigram_count_dict_2 else ()
+        unigram_table_1 = self.__get_ngrams_1(q_code=q_code)[0]
+        unigram_table_2 = self.__get_ngrams_2(q_code=q_code)[0]
 
         # Get top words
         top_words = self.__get_ngram_top_words_or_phrases(
-            ngram_count_dict_1=unigram_count_dict_1,
-            ngram_count_dict_2=unigram_count_dict_2,
+            ngram_table_1=unigram_table_1,
+            ngram_table_2=unigram_table_2,
         )
 
         if not top_words:
@@ -1293,15 +1702,12 @@ class CampaignService:
     def __get_two_word_phrases(self, q_code: str) -> list[dict]:
         """Get two word phrases"""
 
-        bigram_count_dict_1 = self.__ngrams_1.get(q_code)
-        bigram_count_dict_2 = self.__ngrams_2.get(q_code)
-
-        bigram_count_dict_1 = bigram_count_dict_1[1] if bigram_count_dict_1 else {}
-        bigram_count_dict_2 = bigram_count_dict_2[1] if bigram_count_dict_2 else {}
+        bigram_table_1 = self.__get_ngrams_1(q_code=q_code)[1]
+        bigram_table_2 = self.__get_ngrams_2(q_code=q_code)[1]
 
         top_words = self.__get_ngram_top_words_or_phrases(
-            ngram_count_dict_1=bigram_count_dict_1,
-            ngram_count_dict_2=bigram_count_dict_2,
+            ngram_table_1=bigram_table_1,
+            ngram_table_2=bigram_table_2,
         )
 
         if not top_words:
@@ -1319,15 +1725,12 @@ class CampaignService:
     def __get_three_word_phrases(self, q_code: str) -> list[dict]:
         """Get three word phrases"""
 
-        trigram_count_dict_1 = self.__ngrams_1.get(q_code)
-        trigram_count_dict_2 = self.__ngrams_2.get(q_code)
-
-        trigram_count_dict_1 = trigram_count_dict_1[2] if trigram_count_dict_1 else {}
-        trigram_count_dict_2 = trigram_count_dict_2[2] if trigram_count_dict_2 else {}
+        trigram_table_1 = self.__get_ngrams_1(q_code=q_code)[2]
+        trigram_table_2 = self.__get_ngrams_2(q_code=q_code)[2]
 
         top_words = self.__get_ngram_top_words_or_phrases(
-            ngram_count_dict_1=trigram_count_dict_1,
-            ngram_count_dict_2=trigram_count_dict_2,
+            ngram_table_1=trigram_table_1,
+            ngram_table_2=trigram_table_2,
         )
 
         if not top_words:
@@ -1343,45 +1746,32 @@ class CampaignService:
         return top_words
 
     def __get_ngram_top_words_or_phrases(
-        self, ngram_count_dict_1: dict, ngram_count_dict_2: dict
+        self, ngram_table_1: NgramTable, ngram_table_2: NgramTable
     ) -> list:
         """Get ngram top words/phrases"""
 
-        if len(ngram_count_dict_1) == 0:
+        if len(ngram_table_1) == 0:
             return []
 
-        unigram_count_dict_1 = sorted(
-            ngram_count_dict_1.items(), key=operator.itemgetter(1)
-        )
-        max1 = 0
-
-        if len(unigram_count_dict_1) > 0:
-            max1 = unigram_count_dict_1[-1][1]
-
         # n words
         n_words = max([constants.N_WORDCLOUD_WORDS, constants.N_TOP_WORDS])
 
-        if len(unigram_count_dict_1) > n_words:
-            unigram_count_dict_1 = unigram_count_dict_1[-n_words:]
+        # Top ngrams 1 sorted by count (ASC)
+        top_ngrams_1 = ngram_table_1.get_top(n=n_words)
+        max1 = top_ngrams_1[-1][1]
 
         # words list + top words 1 frequency
-        if len(unigram_count_dict_1) == 0:
-            word_list, freq_list_top_1 = [], []
-        else:
-            word_list, freq_list_top_1 = zip(*unigram_count_dict_1)
-        if (
-            len(ngram_count_dict_2) > 0
-            and len(unigram_count_dict_1) > 0
-            and len(freq_list_top_1) > 0
-        ):
-            max2 = max(ngram_count_dict_2.values())
+        word_list, freq_list_top_1 = zip(*top_ngrams_1)
+        if len(ngram_table_2) > 0:
+            max2 = ngram_table_2.get_max_count()
             normalisation_factor = max1 / max2
         else:
             normalisation_factor = 1
 
         # Top words 2 frequency
         freq_list_top_2 = [
-            int(ngram_count_dict_2.get(w, 0) * normalisation_factor) for w in word_list
+            int(count * normalisation_factor)
+            for count in ngram_table_2.get_counts(ngrams=list(word_list))
         ]
 
         top_words = [
@@ -1426,12 +1816,12 @@ class CampaignService:
     def __get_df_1_copy(self) -> pd.DataFrame:
         """Get dataframe 1 copy"""
 
-        return self.__df_1.copy()
+        return self.__get_df_1().copy()
 
     def __get_df_2_copy(self) -> pd.DataFrame:
         """Get dataframe 2 copy"""
 
-        return self.__df_2.copy()
+        return self.__get_df_2().copy()
 
     def __get_filter_description(
         self, respondents_count: int, data_filter: Filter
@@ -1465,10 +1855,8 @@ class CampaignService:
 
         return len(df.index)
 
-    def __get_average_age(self, df: pd.DataFrame) -> str:
-        """Get average age"""
-
-        average_age = "N/A"
+    def __get_age_values(self, df: pd.DataFrame) -> np.ndarray:
+        """Get the numeric ages of the rows in df (NaN if not numeric)"""
 
         if (
             self.__campaign_code == LegacyCampaignCode.dataexchange.value
@@ -1478,18 +1866,19 @@ class CampaignService:
         else:
             column = "age"
 
-        # Only keep columns age and age_midpoint_range
-        df_age = df[[column]].copy()
+        return self.__crud.get_age_values(column_name=column)[df.index.to_numpy()]
 
-        # Age column to numeric
-        df_age[column] = df_age[column].apply(
-            lambda x: int(x) if isinstance(x, str) and x.isnumeric() else np.NaN
-        )
-        df_age = df_age.dropna()
+    def __get_average_age(self, df: pd.DataFrame) -> str:
+        """Get average age"""
+
+        average_age = "N/A"
+
+        age_values = self.__get_age_values(df=df)
+        age_values = age_values[~np.isnan(age_values)]
 
         # Calculate average
-        if len(df_age.index) > 0:
-            average_age = df_age[column].mean()
+        if len(age_values) > 0:
+            average_age = age_values.mean()
             average_age = int(round(average_age))
 
         return str(average_age)
@@ -1507,14 +1896,47 @@ class CampaignService:
         else:
             column = "age_bucket"
 
-        # Only keep age_bucket column
-        df_age_bucket = df[[column]].copy()
-
-        if len(df_age_bucket.index) > 0:
-            average_age_bucket = " ".join(df_age_bucket[column].mode())
+        if len(df.index) > 0:
+            # The most common age buckets (sorted)
+            codes, labels = self.__crud.get_dimension_codes(column_names=(column,))
+            codes = codes[df.index.to_numpy()]
+            counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+            if len(counts) > 0 and counts.max() > 0:
+                average_age_bucket = " ".join(labels[counts == counts.max()])
+            else:
+                average_age_bucket = ""
 
         return average_age_bucket
 
+    def __get_age_summary(self, df: pd.DataFrame) -> dict:
+        """Get age summary (count, mean, median, mode and quantiles of numeric ages)"""
+
+        age_values = self.__get_age_values(df=df)
+        age_values = age_values[~np.isnan(age_values)]
+
+        if len(age_values) == 0:
+            return {
+                "count": 0,
+                "mean": None,
+                "median": None,
+                "mode": None,
+                "quantiles": {},
+            }
+
+        quantiles = np.quantile(age_values, AGE_SUMMARY_QUANTILES)
+        ages, ages_counts = np.unique(age_values, return_counts=True)
+
+        return {
+            "count": len(age_values),
+            "mean": round(float(age_values.mean()), 1),
+            "median": float(np.median(age_values)),
+            "mode": float(ages[np.argmax(ages_counts)]),
+            "quantiles": {
+                str(q): float(value)
+                for q, value in zip(AGE_SUMMARY_QUANTILES, quantiles)
+            },
+        }
+
     def generate_ngrams(
         self,
         df: pd.DataFrame,
@@ -1606,54 +2028,62 @@ class CampaignService:
 
         return unigram_count_dict, bigram_count_dict, trigram_count_dict
 
-    def __get_ngrams_1(
-        self,
-        only_multi_word_phrases_containing_filter_term: bool,
-        keyword: str,
-        q_code: str,
-    ) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
+    def __get_ngrams_1(self, q_code: str) -> tuple[NgramTable, NgramTable, NgramTable]:
         """Get ngrams 1"""
 
-        # Return the cached ngrams (this is when filter 1 was not requested)
-        if self.__filter_1_use_ngrams_unfiltered:
-            return self.__crud.get_ngrams_unfiltered(q_code=q_code)
-
-        (
-            unigram_count_dict,
-            bigram_count_dict,
-            trigram_count_dict,
-        ) = self.generate_ngrams(
-            df=self.__get_df_1_copy(),
-            only_multi_word_phrases_containing_filter_term=only_multi_word_phrases_containing_filter_term,
-            keyword=keyword,
-            q_code=q_code,
-        )
+        def get_ngrams_1() -> tuple[NgramTable, NgramTable, NgramTable]:
+            # Return the cached ngrams (this is when filter 1 was not requested)
+            if self.__filter_1_use_ngrams_unfiltered:
+                return self.__crud.get_ngrams_unfiltered(q_code=q_code)
+
+            (
+                unigram_count_dict,
+                bigram_count_dict,
+                trigram_count_dict,
+            ) = self.generate_ngrams(
+                df=self.__get_df_1_copy(),
+                only_multi_word_phrases_containing_filter_term=self.__filter_1.only_multi_word_phrases_containing_filter_term,
+                keyword=self.__filter_1.keyword_filter,
+                q_code=q_code,
+            )
 
-        return unigram_count_dict, bigram_count_dict, trigram_count_dict
+            return NgramTable.create_tables(
+                ngram_counts_list=[
+                    unigram_count_dict,
+                    bigram_count_dict,
+                    trigram_count_dict,
+                ]
+            )
 
-    def __get_ngrams_2(
-        self, q_code: str
-    ) -> tuple[dict[str, int], dict[str, int], dict[str, int]]:
-        """Get ngrams 2"""
+        return self.__memoize(key=("ngrams_1", q_code), func=get_ngrams_1)
 
-        # Return the cached ngrams (this is when filter 2 was not requested)
-        if self.__filter_2_use_ngrams_unfiltered:
-            return self.__crud.get_ngrams_unfiltered(q_code=q_code)
+    def __get_ngrams_2(self, q_code: str) -> tuple[NgramTable, NgramTable, NgramTable]:
+        """Get ngrams 2"""
 
-        (
-            unigram_count_dict,
-            bigram_count_dict,
-            trigram_count_dict,
-        ) = self.generate_ngrams(df=self.__get_df_2_copy(), q_code=q_code)
+        def get_ngrams_2() -> tuple[NgramTable, NgramTable, NgramTable]:
+            # Return the cached ngrams (this is when filter 2 was not requested)
+            if self.__filter_2_use_ngrams_unfiltered:
+                return self.__crud.get_ngrams_unfiltered(q_code=q_code)
+
+            (
+                unigram_count_dict,
+                bigram_count_dict,
+                trigram_count_dict,
+            ) = self.generate_ngrams(df=self.__get_df_2_copy(), q_code=q_code)
+
+            return NgramTable.create_tables(
+                ngram_counts_list=[
+                    unigram_count_dict,
+                    bigram_count_dict,
+                    trigram_count_dict,
+                ]
+            )
 
-        return unigram_count_dict, bigram_count_dict, trigram_count_dict
+        return self.__memoize(key=("ngrams_2", q_code), func=get_ngrams_2)
 
     def __get_histogram(self) -> dict:
         """Get histogram"""
 
-        df_1 = self.__get_df_1_copy()
-        df_2 = self.__get_df_2_copy()
-
         # Use age_midpoint_range for these two campaigns
         if (
             self.__campaign_code == LegacyCampaignCode.allcampaigns.value
@@ -1663,17 +2093,15 @@ class CampaignService:
         else:
             age_col = "age"
 
-        # Rename columns
-        columns_rename = {
-            age_col: "ages",
-            "age_bucket": "age_buckets",
-            "age_bucket_default": "age_buckets_default",
-            "gender": "genders",
-            "profession": "professions",
-            "canonical_country": "canonical_countries",
+        # Column of each histogram key
+        histogram_columns = {
+            "ages": age_col,
+            "age_buckets": "age_bucket",
+            "age_buckets_default": "age_bucket_default",
+            "genders": "gender",
+            "professions": "profession",
+            "canonical_countries": "canonical_country",
         }
-        df_1 = df_1.rename(columns=columns_rename)
-        df_2 = df_2.rename(columns=columns_rename)
 
         # Get histogram for the keys used in the dictionary below
         histogram = {
@@ -1687,16 +2115,12 @@ class CampaignService:
 
         for column_name in list(histogram.keys()):
             # For each unique column value, get its row count
-            grouped_by_column_1 = df_1.groupby(column_name)["q1_response"].count()
-            grouped_by_column_2 = df_2.groupby(column_name)["q1_response"].count()
+            counts = self.__get_dimension_counts(
+                column_names=(histogram_columns[column_name],)
+            )
 
             # Add count for each unique column value
-            names = list(
-                set(
-                    grouped_by_column_1.index.tolist()
-                    + grouped_by_column_2.index.tolist()
-                )
-            )
+            names = list(counts.keys())
             names = [name for name in names if name]
 
             # Sort age or age_bucket
@@ -1714,14 +2138,7 @@ class CampaignService:
 
             # Set count values
             for name in names:
-                try:
-                    count_1 = grouped_by_column_1[name].item()
-                except KeyError:
-                    count_1 = 0
-                try:
-                    count_2 = grouped_by_column_2[name].item()
-                except KeyError:
-                    count_2 = 0
+                count_1, count_2 = counts[name]
 
                 histogram[column_name].append(
                     {
@@ -1778,7 +2195,11 @@ class CampaignService:
 
         df_1 = self.__get_df_1_copy()
 
-        gender_counts = df_1["gender"].value_counts(ascending=True).to_dict()
+        # Counted as objects, a categorical column (e.g. in a memory-mapped snapshot) would also count the genders that
+        # are not in the dataframe and order ties differently
+        gender_counts = (
+            df_1["gender"].astype(object).value_counts(ascending=True).to_dict()
+        )
 
         genders_breakdown = []
         for key, value in gender_counts.items():
@@ -1843,39 +2264,30 @@ class CampaignService:
                     )
                     continue
 
-                country_regions_coordinates = global_variables.region_coordinates.get(
-                    alpha2country
+                country_regions_coordinates = (
+                    global_variables.region_coordinates.get(alpha2country) or {}
                 )
-
-                # Check if the region's coordinate already exists
-                coordinate_found = False
-                if country_regions_coordinates and country_regions_coordinates.get(
-                    region
-                ):
-                    coordinate_found = True
-
-                # Get coordinate from googlemaps if it was not found
-                if not coordinate_found:
-                    coordinate = google_maps_interactions.get_coordinate(
-                        location=f"{canonical_country}, {region}"
+                coordinate = country_regions_coordinates.get(region)
+
+                # If the region's coordinate is not known yet, request it in the background
+                if coordinate is None:
+                    RegionGeocoder().request(
+                        country_alpha2_code=alpha2country,
+                        country_name=canonical_country,
+                        region=region,
                     )
-                    if not coordinate:
-                        continue
 
-                    # Add the new coordinate
-                    if not global_variables.region_coordinates.get(alpha2country):
-                        global_variables.region_coordinates[alpha2country] = {}
-                    global_variables.region_coordinates[alpha2country][
-                        region
-                    ] = coordinate
+                # Use the country's coordinate until the region's coordinate is known
+                if coordinate:
+                    lat = coordinate.get("lat")
+                    lon = coordinate.get("lon")
+                else:
+                    coordinate_country = constants.COUNTRY_COORDINATE.get(alpha2country)
+                    if not coordinate_country:
+                        continue
+                    lat = coordinate_country[0]
+                    lon = coordinate_country[1]
 
-                # Create region_coordinates
-                lat = global_variables.region_coordinates[alpha2country][region].get(
-                    "lat"
-                )
-                lon = global_variables.region_coordinates[alpha2country][region].get(
-                    "lon"
-                )
                 region_coordinates.append(
                     {
                         "location_code": region,
@@ -1888,29 +2300,16 @@ class CampaignService:
 
             return region_coordinates
 
-        # Get copy to not modify original
-        df_1_copy = self.__get_df_1_copy()
-        df_2_copy = self.__get_df_2_copy()
-
         # For these campaigns, use region as location
         if (
             self.__campaign_code == LegacyCampaignCode.giz.value
             or self.__campaign_code == LegacyCampaignCode.wwwpakistan.value
         ):
             # Get count of each region per country
-            region_counts_1 = (
-                df_1_copy[["alpha2country", "canonical_country", "region"]]
-                .value_counts(ascending=True)
-                .to_dict()
+            region_counts_1, region_counts_2 = self.__get_dimension_value_counts(
+                column_names=("alpha2country", "canonical_country", "region")
             )
             coordinates_1 = get_region_coordinates(region_counts=region_counts_1)
-
-            # Get count of each region per country
-            region_counts_2 = (
-                df_2_copy[["alpha2country", "canonical_country", "region"]]
-                .value_counts(ascending=True)
-                .to_dict()
-            )
             coordinates_2 = get_region_coordinates(region_counts=region_counts_2)
 
             coordinates = {
@@ -1921,17 +2320,13 @@ class CampaignService:
         # For other campaigns, use country as location
         else:
             # Get count of each country
-            alpha2country_counts_1 = (
-                df_1_copy["alpha2country"].value_counts(ascending=True).to_dict()
-            )
+            (
+                alpha2country_counts_1,
+                alpha2country_counts_2,
+            ) = self.__get_dimension_value_counts(column_names=("alpha2country",))
             coordinates_1 = get_country_coordinates(
                 alpha2country_counts=alpha2country_counts_1
             )
-
-            # Get count of each country
-            alpha2country_counts_2 = (
-                df_2_copy["alpha2country"].value_counts(ascending=True).to_dict()
-            )
             coordinates_2 = get_country_coordinates(
                 alpha2country_counts=alpha2country_counts_2
             )
@@ -1943,6 +2338,136 @@ class CampaignService:
 
         return coordinates
 
+    def __get_membership(self) -> np.ndarray:
+        """Get the membership of each row in filter 1 and filter 2"""
+
+        return self.__memoize(
+            key=("membership",),
+            func=lambda: membership_counts.get_rows_membership(
+                rows_count=self.__crud.get_rows_count(),
+                rows_1=self.__get_df_1().index.to_numpy(),
+                rows_2=self.__get_df_2().index.to_numpy(),
+            ),
+        )
+
+    def __get_facet_membership(self, facet: str) -> np.ndarray:
+        """
+        Get the membership of each row in filter 1 and filter 2 without the fields of the filters that select the
+        options of the facet.
+        """
+
+        filter_fields = FACET_FILTER_FIELDS[facet]
+
+        def get_facet_rows(data_filter: Filter | None, df: pd.DataFrame) -> np.ndarray:
+            """Get the rows of a filter without the fields of the facet"""
+
+            # The facet does not restrict the filter
+            if not data_filter or not any(
+                getattr(data_filter, x) for x in filter_fields
+            ):
+                return df.index.to_numpy()
+
+            return filters.apply_filter_to_df(
+                df=self.__get_df(),
+                data_filter=data_filter.copy(update={x: [] for x in filter_fields}),
+                campaign_crud=self.__crud,
+                campaign_code=self.__campaign_code,
+            ).index.to_numpy()
+
+        def get_facet_membership() -> np.ndarray:
+            # Only a facet selected in one of the filters needs its own membership
+            if not any(
+                data_filter and getattr(data_filter, x)
+                for data_filter in (self.__filter_1, self.__filter_2)
+                for x in filter_fields
+            ):
+                return self.__get_membership()
+
+            return membership_counts.get_rows_membership(
+                rows_count=self.__crud.get_rows_count(),
+                rows_1=get_facet_rows(
+                    data_filter=self.__filter_1, df=self.__get_df_1()
+                ),
+                rows_2=get_facet_rows(
+                    data_filter=self.__filter_2, df=self.__get_df_2()
+                ),
+            )
+
+        # Facets with the same fields share the membership
+        return self.__memoize(
+            key=("facet_membership", filter_fields), func=get_facet_membership
+        )
+
+    def __get_dimension_counts(
+        self, column_names: tuple[str, ...]
+    ) -> dict[Any, tuple[int, int]]:
+        """
+        Get the count in filter 1 and filter 2 of each value of a dimension.
+        Only values that occur in at least one of the filters are included.
+        """
+
+        codes, labels = self.__crud.get_dimension_codes(column_names=column_names)
+        counts_1, counts_2 = membership_counts.count_per_filter(
+            codes=codes, membership=self.__get_membership(), codes_count=len(labels)
+        )
+
+        # Values of filter 1 followed by values of filter 2, each sorted
+        labels = labels.tolist()
+        counts_1 = counts_1.tolist()
+        counts_2 = counts_2.tolist()
+        names = [x for x, count in zip(labels, counts_1) if count > 0] + [
+            x for x, count in zip(labels, counts_2) if count > 0
+        ]
+        counts = dict(zip(labels, zip(counts_1, counts_2)))
+
+        return {name: counts[name] for name in set(names)}
+
+    def __get_dimension_value_counts(
+        self, column_names: tuple[str, ...]
+    ) -> tuple[dict[Any, int], dict[Any, int]]:
+        """
+        Get the count of each value of a dimension in filter 1 and in filter 2, sorted by count (ASC).
+        Values with the same count are sorted by value.
+        """
+
+        codes, labels = self.__crud.get_dimension_codes(column_names=column_names)
+        counts_1, counts_2 = membership_counts.count_per_filter(
+            codes=codes, membership=self.__get_membership(), codes_count=len(labels)
+        )
+
+        value_counts = []
+        for counts in (counts_1, counts_2):
+            order = np.argsort(counts, kind="stable")
+            value_counts.append(
+                {labels[i]: counts[i].item() for i in order if counts[i] > 0}
+            )
+
+        return value_counts[0], value_counts[1]
+
+    def __get_category_counters(self, column_name: str) -> tuple[Counter, Counter]:
+        """
+        Get the count of each category in filter 1 and in filter 2.
+        Categories are in order of first occurrence.
+        """
+
+        rows, codes, labels = self.__crud.get_category_codes(column_name=column_name)
+        membership = self.__get_membership()[rows]
+        counts_1, counts_2 = membership_counts.count_per_filter(
+            codes=codes, membership=membership, codes_count=len(labels)
+        )
+        first_1, first_2 = membership_counts.first_occurrence_per_filter(
+            codes=codes, membership=membership, codes_count=len(labels)
+        )
+
+        category_counters = []
+        for counts, first in ((counts_1, first_1), (counts_2, first_2)):
+            order = np.argsort(first, kind="stable")
+            category_counters.append(
+                Counter({labels[i]: counts[i].item() for i in order if counts[i] > 0})
+            )
+
+        return category_counters[0], category_counters[1]
+
     def __get_filters_are_identical(self) -> bool:
         """Get filters are identical"""
 
@@ -1978,31 +2503,13 @@ class CampaignService:
 
         return only_multi_word_phrases_containing_filter_term_options
 
-    def __get_campaign_df_export_and_filename(
-        self,
-        date_format: str,
-        from_date: date = None,
-        to_date: date = None,
-        unique_filename_code: str = "",
-    ):
-        """Get campaign dataframe for exporting and filename"""
+    def __get_campaign_df_export(
+        self, from_date: date = None, to_date: date = None
+    ) -> pd.DataFrame:
+        """Get campaign dataframe for exporting (filtered by date, not copied)"""
 
         # Dataframe
-        df_1 = self.__get_df_1_copy()
-
-        # Drop columns
-        df_1 = df_1.drop(
-            columns=[
-                "age_bucket_default",
-                "data_source",
-            ],
-            errors="ignore",
-        )
-
-        # CSV filename
-        if unique_filename_code:
-            unique_filename_code = f"_{unique_filename_code}"
-        csv_filename = f"export_{self.__campaign_code}{unique_filename_code}.csv"
+        df_1 = self.__get_df_1()
 
         # Filter by date
         if from_date and to_date:
@@ -2014,164 +2521,162 @@ class CampaignService:
             except AttributeError:
                 # If there is no date values in ingestion_time
                 df_1 = df_1[0:0]
-            finally:
-                csv_filename_without_ext = csv_filename.replace(".csv", "")
-                csv_filename = f"{csv_filename_without_ext}_{from_date.strftime(date_format)}_to_{to_date.strftime(date_format)}.csv"
-
-        # Convert date to string
-        df_1["ingestion_time"] = df_1["ingestion_time"].apply(
-            lambda x: x.strftime(date_format) if x and not isinstance(x, str) else ""
-        )
 
-        return df_1, csv_filename
+        return df_1
 
-    def get_campaign_data_url_and_filename(
+    def get_campaign_data_csv_filename(
         self,
-        cloud_service: TCloudService,
         from_date: date = None,
         to_date: date = None,
         unique_filename_code: str = "",
-    ) -> tuple[str, str]:
+    ) -> str:
         """
-        Get campaign data url and filename
+        Get campaign data CSV filename
 
-        :param cloud_service: Cloud service
         :param from_date: From Date
         :param to_date: to date
         :param unique_filename_code: Code to attach to filename uploaded to Cloud Storage.
         This code is unique per campaign_code and filters so that requesting the same filters does not have to create a new CSV file, but the existing file will be used.
+        The user should not see it in the filename.
         """
 
-        def remove_unique_filename_code(_csv_filename: str, _unique_filename_code):
-            """
-            Function used after the file has been uploaded to cloud Storage.
-            Remove the filename code because the user should not see it in the filename.
-            """
+        # CSV filename
+        if unique_filename_code:
+            unique_filename_code = f"_{unique_filename_code}"
+        csv_filename = f"export_{self.__campaign_code}{unique_filename_code}.csv"
 
-            _csv_filename = _csv_filename.replace(f"_{_unique_filename_code}", "")
+        # Date range
+        if from_date and to_date:
+            csv_filename_without_ext = csv_filename.replace(".csv", "")
+            csv_filename = f"{csv_filename_without_ext}_{from_date.strftime(CSV_EXPORT_DATE_FORMAT)}_to_{to_date.strftime(CSV_EXPORT_DATE_FORMAT)}.csv"
 
-            return _csv_filename
+        return csv_filename
 
-        # Date format
-        date_format = "%Y_%m_%d"
+    def get_campaign_data_storage_csv_filename(
+        self,
+        from_date: date = None,
+        to_date: date = None,
+        unique_filename_code: str = "",
+    ) -> str:
+        """Get filename of the campaign data CSV file in Cloud Storage (unique per version of the campaign data)"""
 
-        # Get df and filename
-        df, csv_filename = self.__get_campaign_df_export_and_filename(
-            date_format=date_format,
+        version_code = utils.get_string_hash_value(self.__crud.get_version())[:16]
+
+        return self.get_campaign_data_csv_filename(
             from_date=from_date,
             to_date=to_date,
-            unique_filename_code=unique_filename_code,
+            unique_filename_code=f"{unique_filename_code}{version_code}",
         )
 
-        # Google
-        if cloud_service == "google":
-            # File paths
-            csv_filepath = f"/tmp/{csv_filename}"
-            creating_csv_filepath = f"/tmp/wra_creating_{csv_filename}"
-            storage_csv_filepath = f"{csv_filename}"
-            bucket_name = settings.GOOGLE_CLOUD_STORAGE_BUCKET_TMP_DATA
-
-            # If file exists in Google Cloud Storage
-            if google_cloud_storage_interactions.blob_exists(
-                bucket_name=bucket_name,
-                blob_name=storage_csv_filepath,
-            ):
-                # Get url
-                url = google_cloud_storage_interactions.get_blob_url(
-                    bucket_name=bucket_name,
-                    blob_name=storage_csv_filepath,
-                )
+    def iter_campaign_data_csv(
+        self, from_date: date = None, to_date: date = None, csv_filepath: str = ""
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the campaign data as CSV, encoded in chunks of rows
 
-                # Remove unique filename code
-                if unique_filename_code:
-                    csv_filename = remove_unique_filename_code(
-                        _csv_filename=csv_filename,
-                        _unique_filename_code=unique_filename_code,
-                    )
+        :param from_date: From Date
+        :param to_date: to date
+        :param csv_filepath: If set, the CSV is also saved to this file. The file only exists after the iteration completed.
+        """
 
-                return url, csv_filename
+        df = self.__get_campaign_df_export(from_date=from_date, to_date=to_date)
 
-            # If file does not exist in Google Cloud Storage
-            else:
-                if not os.path.isfile(csv_filepath):
-                    # Cleanup
-                    if os.path.isfile(creating_csv_filepath):
-                        os.remove(creating_csv_filepath)
-
-                    # Save dataframe to csv file
-                    df.to_csv(
-                        path_or_buf=creating_csv_filepath, index=False, header=True
-                    )
+        part_csv_filepath = f"{csv_filepath}.part"
+        file = open(part_csv_filepath, "wb") if csv_filepath else None
 
-                    # Rename
-                    os.rename(src=creating_csv_filepath, dst=csv_filepath)
+        try:
+            # The first chunk includes the header, also if there are no rows
+            for chunk_start in range(0, max(len(df.index), 1), CSV_EXPORT_CHUNK_SIZE):
+                df_chunk = df.iloc[chunk_start : chunk_start + CSV_EXPORT_CHUNK_SIZE]
 
-                # Upload
-                google_cloud_storage_interactions.upload_file(
-                    bucket_name=bucket_name,
-                    source_filename=csv_filepath,
-                    destination_filename=storage_csv_filepath,
+                # Drop columns
+                df_chunk = df_chunk.drop(
+                    columns=[
+                        "age_bucket_default",
+                        "data_source",
+                    ],
+                    errors="ignore",
                 )
 
-                # Remove from tmp
-                os.remove(csv_filepath)
+                # Convert date to string (a missing date is NaT, which can not be formatted)
+                df_chunk["ingestion_time"] = df_chunk["ingestion_time"].apply(
+                    lambda x: x.strftime(CSV_EXPORT_DATE_FORMAT)
+                    if x and not pd.isnull(x) and not isinstance(x, str)
+                    else ""
+                )
 
-                # Get url
-                url = google_cloud_storage_interactions.get_blob_url(
-                    bucket_name=bucket_name,
-                    blob_name=storage_csv_filepath,
+                chunk = df_chunk.to_csv(index=False, header=chunk_start == 0).encode(
+                    "utf-8"
                 )
 
-                # Remove unique filename code
-                if unique_filename_code:
-                    csv_filename = remove_unique_filename_code(
-                        _csv_filename=csv_filename,
-                        _unique_filename_code=unique_filename_code,
-                    )
+                if file:
+                    file.write(chunk)
 
-                return url, csv_filename
+                yield chunk
+
+            if file:
+                file.close()
+                os.rename(src=part_csv_filepath, dst=csv_filepath)
+        finally:
+            if file:
+                file.close()
+                if os.path.isfile(part_csv_filepath):
+                    os.remove(part_csv_filepath)
+
+    def get_campaign_data_url(
+        self, cloud_service: TCloudService, csv_filename: str
+    ) -> str | None:
+        """Get url of the campaign data CSV file in Cloud Storage, None if it does not exist"""
+
+        # Google
+        if cloud_service == "google":
+            bucket_name = settings.GOOGLE_CLOUD_STORAGE_BUCKET_TMP_DATA
+            if google_cloud_storage_interactions.blob_exists(
+                bucket_name=bucket_name, blob_name=csv_filename
+            ):
+                return google_cloud_storage_interactions.get_blob_url(
+                    bucket_name=bucket_name, blob_name=csv_filename
+                )
 
         # Azure
         elif cloud_service == "azure":
-            container_name: str = settings.AZURE_STORAGE_CONTAINER_TMP_DATA
-
-            # If file exists in Azure Blob Storage
+            container_name = settings.AZURE_STORAGE_CONTAINER_TMP_DATA
             if azure_blob_storage_interactions.blob_exists(
                 container_name=container_name, blob_name=csv_filename
             ):
-                # Get url
-                url = azure_blob_storage_interactions.get_blob_url(
+                return azure_blob_storage_interactions.get_blob_url(
                     container_name=container_name, blob_name=csv_filename
                 )
 
-                # Remove unique filename code
-                if unique_filename_code:
-                    csv_filename = remove_unique_filename_code(
-                        _csv_filename=csv_filename,
-                        _unique_filename_code=unique_filename_code,
-                    )
+        return None
 
-                return url, csv_filename
+    @staticmethod
+    def upload_campaign_data_csv(
+        cloud_service: TCloudService, csv_filepath: str, csv_filename: str
+    ):
+        """Upload the campaign data CSV file to Cloud Storage and remove it"""
 
-            # If file does not exist in Azure Blob Storage
-            else:
-                # Upload
-                azure_blob_storage_interactions.upload_df_as_csv(
-                    container_name=container_name,
-                    df=df,
-                    csv_filename=csv_filename,
-                )
+        # Not saved e.g. the download was cancelled
+        if not os.path.isfile(csv_filepath):
+            return
 
-                # Get url
-                url = azure_blob_storage_interactions.get_blob_url(
-                    container_name=container_name, blob_name=csv_filename
+        try:
+            # Google
+            if cloud_service == "google":
+                google_cloud_storage_interactions.upload_file(
+                    bucket_name=settings.GOOGLE_CLOUD_STORAGE_BUCKET_TMP_DATA,
+                    source_filename=csv_filepath,
+                    destination_filename=csv_filename,
                 )
 
-                # Remove unique filename code
-                if unique_filename_code:
-                    csv_filename = remove_unique_filename_code(
-                        _csv_filename=csv_filename,
-                        _unique_filename_code=unique_filename_code,
-                    )
-
-                return url, csv_filename
+            # Azure
+            elif cloud_service == "azure":
+                azure_blob_storage_interactions.upload_file(
+                    container_name=settings.AZURE_STORAGE_CONTAINER_TMP_DATA,
+                    source_filename=csv_filepath,
+                    blob_name=csv_filename,
+                )
+        except (Exception,) as e:
+            logger.warning(f"Could not upload {csv_filename}: {str(e)}")
+        finally:
+            os.remove(csv_filepath)
@@ -0,0 +1,298 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import fcntl
+import json
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from app import databases
+from app.core.settings import get_settings
+from app.databases import Database
+from app.logginglib import init_custom_logger
+from app.schemas.user import UserInternal
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+settings = get_settings()
+
+# Arrays smaller than this are stored inside the pickle instead of in a separate file
+MIN_MEMORY_MAPPED_ARRAY_BYTES = 4096
+
+MANIFEST_FILENAME = "manifest.json"
+DB_FILENAME = "db.pkl"
+
+
+def save_dataframe(df: pd.DataFrame, directory: str) -> dict:
+    """
+    Save the columns of a dataframe to be memory-mapped, returns the description of the saved columns.
+    Numeric and datetime columns are saved as .npy files. Text columns with repeated values are saved as the codes of
+    their sorted categories (.npy file) and the categories. Columns of mostly unique values (e.g. responses) are kept
+    in the description.
+    """
+
+    columns = []
+    for i, (column_name, series) in enumerate(df.items()):
+        filepath = os.path.join(directory, f"dataframe_{i}.npy")
+        if isinstance(series.dtype, pd.DatetimeTZDtype):
+            np.save(filepath, series.array.asi8)
+            columns.append(
+                (column_name, "datetime", os.path.basename(filepath), series.dtype)
+            )
+            continue
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufmM":
+            np.save(filepath, series.to_numpy())
+            columns.append((column_name, "array", os.path.basename(filepath), None))
+            continue
+
+        try:
+            codes, categories = pd.factorize(series, sort=True)
+        except TypeError:
+            # Values that can not be sorted
+            codes, categories = None, None
+        if codes is not None and len(categories) <= len(series) // 2:
+            np.save(filepath, codes.astype(get_codes_dtype(len(categories))))
+            columns.append(
+                (column_name, "categorical", os.path.basename(filepath), categories)
+            )
+            continue
+
+        columns.append((column_name, "values", None, series.array))
+
+    return {"index": df.index, "columns": columns}
+
+
+def load_dataframe(dataframe: dict, directory: str) -> pd.DataFrame:
+    """
+    Load a dataframe saved with save_dataframe.
+    The columns are created over the memory-mapped files without copying them, text columns with repeated values
+    are categorical.
+    """
+
+    columns = {}
+    for column_name, kind, filename, value in dataframe["columns"]:
+        if kind == "values":
+            columns[column_name] = value
+            continue
+
+        values = np.load(os.path.join(directory, filename), mmap_mode="r")
+        if kind == "datetime":
+            columns[column_name] = pd.arrays.DatetimeArray(
+                values.view("M8[ns]"), dtype=value, copy=False
+            )
+        elif kind == "categorical":
+            columns[column_name] = pd.Categorical.from_codes(values, categories=value)
+        else:
+            columns[column_name] = values
+
+    # Without copy=False, columns of the same dtype would be copied into one block
+    return pd.DataFrame(columns, index=dataframe["index"], copy=False)
+
+
+def get_codes_dtype(categories_count: int) -> np.dtype:
+    """Get the dtype pandas uses for the codes of categories, codes of this dtype are not copied by pandas"""
+
+    for dtype in (np.int8, np.int16, np.int32):
+        if categories_count < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+
+    return np.dtype(np.int64)
+
+
+class SnapshotPickler(pickle.Pickler):
+    """
+    Pickles a campaign db.
+    Numeric arrays and the columns of the dataframe are saved as .npy files, the user is not saved.
+    """
+
+    def __init__(self, file, db: Database, directory: str):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__db = db
+        self.__directory = directory
+        self.__arrays_count = 0
+
+    def persistent_id(self, obj):
+        if obj is self.__db.dataframe:
+            return (
+                "dataframe",
+                save_dataframe(df=self.__db.dataframe, directory=self.__directory),
+            )
+        if obj is self.__db.user:
+            return ("user",)
+        if (
+            isinstance(obj, np.ndarray)
+            and obj.dtype.kind != "O"
+            and obj.nbytes >= MIN_MEMORY_MAPPED_ARRAY_BYTES
+        ):
+            filename = f"{self.__arrays_count}.npy"
+            self.__arrays_count += 1
+            np.save(os.path.join(self.__directory, filename), obj)
+
+            return ("array", filename)
+
+        return None
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    """
+    Unpickles a campaign db.
+    Arrays and the columns of the dataframe are memory-mapped read-only, processes attaching the same snapshot share
+    their memory.
+    """
+
+    def __init__(self, file, directory: str, user: UserInternal | None):
+        super().__init__(file)
+        self.__directory = directory
+        self.__user = user
+
+    def persistent_load(self, pid):
+        if pid[0] == "dataframe":
+            return load_dataframe(dataframe=pid[1], directory=self.__directory)
+        if pid[0] == "user":
+            return self.__user
+        if pid[0] == "array":
+            return np.load(os.path.join(self.__directory, pid[1]), mmap_mode="r")
+
+        raise pickle.UnpicklingError(f"Unknown persistent id: {pid}.")
+
+
+def publish_snapshot(campaign_code: str, db: Database):
+    """
+    Publish the snapshot of a campaign db.
+    The snapshot is written to a new directory, then the manifest is replaced to point to it.
+    """
+
+    campaign_directory = os.path.join(
+        settings.CAMPAIGN_SNAPSHOTS_DIRECTORY, campaign_code
+    )
+    version_directory = os.path.join(campaign_directory, db.version)
+    os.makedirs(campaign_directory, exist_ok=True)
+
+    # Write snapshot (the same version contains the same data)
+    if not os.path.isdir(version_directory):
+        tmp_directory = tempfile.mkdtemp(dir=campaign_directory, prefix=".tmp")
+        try:
+            with open(os.path.join(tmp_directory, DB_FILENAME), "wb") as file:
+                SnapshotPickler(file, db=db, directory=tmp_directory).dump(db)
+            os.rename(tmp_directory, version_directory)
+        except (Exception,):
+            shutil.rmtree(tmp_directory, ignore_errors=True)
+            if not os.path.isdir(version_directory):
+                raise
+
+    # Point the manifest to the new version
+    with lock_manifest():
+        manifest = read_manifest()
+        previous_version = manifest.get(campaign_code)
+        manifest[campaign_code] = db.version
+        write_manifest(manifest=manifest)
+
+    # Remove old versions, the previous version is kept for processes that did not attach the new version yet
+    for version in os.listdir(campaign_directory):
+        if version not in [db.version, previous_version]:
+            shutil.rmtree(os.path.join(campaign_directory, version), ignore_errors=True)
+
+
+def read_manifest() -> dict[str, str]:
+    """Read manifest, the published version of each campaign"""
+
+    try:
+        with open(
+            os.path.join(settings.CAMPAIGN_SNAPSHOTS_DIRECTORY, MANIFEST_FILENAME), "r"
+        ) as file:
+            return json.loads(file.read())
+    except FileNotFoundError:
+        return {}
+
+
+def attach_published_snapshots() -> list[str]:
+    """
+    Attach the published snapshots of campaigns whose version differs from the current db.
+    Returns the codes of the attached campaigns.
+    """
+
+    attached_campaigns_codes = []
+    for campaign_code, version in read_manifest().items():
+        db = databases.get_campaign_db(campaign_code=campaign_code)
+        if not db or db.version == version:
+            continue
+
+        try:
+            db_snapshot = load_snapshot(
+                campaign_code=campaign_code, version=version, user=db.user
+            )
+        except (Exception,) as e:
+            logger.warning(
+                f"Could not attach snapshot {version} of campaign {campaign_code}: {str(e)}"
+            )
+            continue
+
+        databases.set_campaign_db(campaign_code=campaign_code, db=db_snapshot)
+        attached_campaigns_codes.append(campaign_code)
+
+    return attached_campaigns_codes
+
+
+def load_snapshot(
+    campaign_code: str, version: str, user: UserInternal | None
+) -> Database:
+    """Load the snapshot of a campaign db"""
+
+    version_directory = os.path.join(
+        settings.CAMPAIGN_SNAPSHOTS_DIRECTORY, campaign_code, version
+    )
+    with open(os.path.join(version_directory, DB_FILENAME), "rb") as file:
+        return SnapshotUnpickler(file, directory=version_directory, user=user).load()
+
+
+def write_manifest(manifest: dict[str, str]):
+    """Write manifest"""
+
+    filename = os.path.join(settings.CAMPAIGN_SNAPSHOTS_DIRECTORY, MANIFEST_FILENAME)
+    tmp_filename = f"{filename}.tmp"
+    with open(tmp_filename, "w") as file:
+        file.write(json.dumps(manifest, indent=2))
+    os.replace(tmp_filename, filename)
+
+
+@contextmanager
+def lock_manifest():
+    """Lock the manifest while it is updated, snapshots can be published by several processes"""
+
+    with open(
+        os.path.join(settings.CAMPAIGN_SNAPSHOTS_DIRECTORY, ".lock"), "w"
+    ) as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file, fcntl.LOCK_UN)
@@ -0,0 +1,152 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import asyncio
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable
+
+from app import http_exceptions
+from app.core.settings import get_settings
+from app.helpers.singleton_meta import SingletonMeta
+
+settings = get_settings()
+
+
+class DeadlineExceededError(Exception):
+    """Raised when a task starts after its deadline"""
+
+
+class ComputeExecutor(metaclass=SingletonMeta):
+    """
+    Runs heavy computations in a bounded thread pool (Singleton class).
+    Requests are rejected with 503 when the queue is full or when their deadline is exceeded,
+    light endpoints keep using the default thread pool.
+    """
+
+    def __init__(self):
+        self.__workers = settings.COMPUTE_WORKERS
+        self.__queue_size = settings.COMPUTE_QUEUE_SIZE
+        self.__timeout_seconds = settings.COMPUTE_TIMEOUT_SECONDS
+
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__workers, thread_name_prefix="compute"
+        )
+        self.__lock = Lock()
+
+        # Tasks running or waiting in the queue
+        self.__pending = 0
+
+        # Moving average of the duration of tasks, used to estimate Retry-After
+        self.__average_duration_seconds = 1.0
+
+        self.__stats = {"completed": 0, "rejected": 0, "timed_out": 0}
+
+        # The threads of the pool do not exist in a forked process
+        os.register_at_fork(after_in_child=self.__reset_executor)
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run func in the pool, raise ServiceUnavailableHTTPException if the request is not admitted or too slow"""
+
+        deadline = time.monotonic() + self.__timeout_seconds
+
+        with self.__lock:
+            if self.__pending >= self.__workers + self.__queue_size:
+                self.__stats["rejected"] += 1
+                raise http_exceptions.ServiceUnavailableHTTPException(
+                    detail="Too many requests are being processed, try again later",
+                    retry_after=self.__get_retry_after(),
+                )
+            self.__pending += 1
+
+        future = self.__executor.submit(self.__run_task, deadline, func, args, kwargs)
+        future.add_done_callback(self.__on_task_done)
+
+        try:
+            return await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=deadline - time.monotonic()
+            )
+        except (asyncio.TimeoutError, DeadlineExceededError):
+            with self.__lock:
+                self.__stats["timed_out"] += 1
+            raise http_exceptions.ServiceUnavailableHTTPException(
+                detail="The request took too long to process, try again later",
+                retry_after=self.__get_retry_after(),
+            )
+
+    def __run_task(
+        self, deadline: float, func: Callable, args: tuple, kwargs: dict
+    ) -> Any:
+        """Run task, skip it if the request already exceeded its deadline while queued"""
+
+        if time.monotonic() > deadline:
+            raise DeadlineExceededError()
+
+        start = time.monotonic()
+        result = func(*args, **kwargs)
+        duration = time.monotonic() - start
+
+        with self.__lock:
+            self.__average_duration_seconds = (
+                0.8 * self.__average_duration_seconds + 0.2 * duration
+            )
+
+        return result
+
+    def __on_task_done(self, future):
+        with self.__lock:
+            self.__pending -= 1
+            if not future.cancelled() and not future.exception():
+                self.__stats["completed"] += 1
+
+    def __get_retry_after(self) -> int:
+        """Estimate the seconds until the queue has room again"""
+
+        return max(
+            1,
+            math.ceil(
+                self.__average_duration_seconds * self.__pending / self.__workers
+            ),
+        )
+
+    def __reset_executor(self):
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__workers, thread_name_prefix="compute"
+        )
+        self.__lock = Lock()
+        self.__pending = 0
+
+    def get_stats(self) -> dict[str, int]:
+        """Get stats"""
+
+        with self.__lock:
+            return {
+                **self.__stats,
+                "pending": self.__pending,
+                "workers": self.__workers,
+                "queue_size": self.__queue_size,
+            }
@@ -0,0 +1,102 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import logging
+import os
+
+from fastapi import Request, Response
+
+from app.enums.geometry_resolution import GeometryResolution
+from app.helpers import content_encoding
+from app.helpers.singleton_meta import SingletonMeta
+from app.logginglib import init_custom_logger
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+# Geometry files served by the API
+# Source credit geo_json_world: https://raw.githubusercontent.com/holtzy/D3-graph-gallery/master/DATA/world.geojson
+# Source credit topo_json_mx: https://gist.githubusercontent.com/diegovalle/5129746/raw/c1c35e439b1d5e688bca20b79f0e53a1fc12bf9e/mx_tj.json
+GEOMETRY_FILEPATHS = {
+    "geo_json_world": "geo_json_world.json",
+    "topo_json_mx": "topo_json_mx.json",
+}
+
+# Directory with the simplified geometry files created by simplify_geometry.py
+SIMPLIFIED_GEOMETRY_DIRECTORY = "simplified_geometry"
+
+# Geometry only changes with a deployment, clients can keep it for a day and revalidate it with the ETag
+CACHE_CONTROL = "public, max-age=86400"
+
+
+def get_geometry_filepath(name: str, resolution: GeometryResolution) -> str:
+    """Get the filepath of the geometry file with resolution"""
+
+    if resolution == GeometryResolution.full:
+        return GEOMETRY_FILEPATHS[name]
+
+    return os.path.join(
+        SIMPLIFIED_GEOMETRY_DIRECTORY, f"{name}_{resolution.value}.json"
+    )
+
+
+class Geometry(metaclass=SingletonMeta):
+    """
+    Geometry files loaded once (Singleton class).
+    If a simplified resolution is missing, the full resolution is served instead.
+    """
+
+    def __init__(self):
+        self.__payloads: dict[
+            tuple[str, GeometryResolution], content_encoding.EncodedPayload
+        ] = {}
+
+        for name in GEOMETRY_FILEPATHS:
+            for resolution in GeometryResolution:
+                filepath = get_geometry_filepath(name=name, resolution=resolution)
+                if not os.path.isfile(filepath):
+                    logger.warning(f"Could not find geometry file {filepath}.")
+                    continue
+
+                with open(filepath, "rb") as file:
+                    self.__payloads[
+                        (name, resolution)
+                    ] = content_encoding.EncodedPayload(body=file.read())
+
+    def get_response(
+        self, request: Request, name: str, resolution: GeometryResolution
+    ) -> Response:
+        """Get response with the geometry"""
+
+        payload = self.__payloads.get((name, resolution))
+        if not payload:
+            payload = self.__payloads[(name, GeometryResolution.full)]
+
+        return content_encoding.create_response(
+            request=request,
+            body=payload.body,
+            etag=payload.etag,
+            compressed=payload.compressed,
+            headers={"Cache-Control": CACHE_CONTROL},
+        )
@@ -23,6 +23,8 @@ SOFTWARE.
 
 """
 
+from functools import lru_cache
+
 import googlemaps
 
 from app.core.settings import get_settings
@@ -30,8 +32,9 @@ from app.core.settings import get_settings
 settings = get_settings()
 
 
+@lru_cache()
 def get_googlemaps_client() -> googlemaps.Client:
-    """Get Google Maps client"""
+    """Get Google Maps client (created once)"""
 
     return googlemaps.Client(key=settings.GOOGLE_MAPS_API_KEY)
 
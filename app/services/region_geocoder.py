@@ -0,0 +1,175 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+
+from app import global_variables
+from app.core.settings import get_settings
+from app.helpers.singleton_meta import SingletonMeta
+from app.logginglib import init_custom_logger
+from app.services import google_maps_interactions
+
+logger = logging.getLogger(__name__)
+init_custom_logger(logger)
+
+settings = get_settings()
+
+# Attempts to resolve a region if requests fail e.g. network or quota errors
+RETRY_ATTEMPTS = 5
+
+# Seconds to wait before the first retry, doubled after each failed attempt
+RETRY_BACKOFF_SECONDS = 10
+
+
+class RegionGeocoder(metaclass=SingletonMeta):
+    """
+    Resolves coordinates of regions in a background thread (Singleton class).
+
+    Coordinates are stored in global_variables.region_coordinates and saved to the region coordinates file
+    after each batch, requests only read the coordinates that are already known.
+    """
+
+    def __init__(self):
+        self.__queue: queue.Queue[tuple[str, str, str, int]] = queue.Queue()
+        self.__pending: set[tuple[str, str]] = set()
+        self.__lock = threading.Lock()
+        self.__thread: threading.Thread | None = None
+
+    def request(self, country_alpha2_code: str, country_name: str, region: str):
+        """Request the coordinate of a region to be resolved in the background"""
+
+        # Can not resolve without Google Maps
+        if not settings.GOOGLE_MAPS_API_KEY:
+            return
+
+        with self.__lock:
+            if (country_alpha2_code, region) in self.__pending:
+                return
+            self.__pending.add((country_alpha2_code, region))
+            self.__queue.put((country_alpha2_code, country_name, region, 0))
+
+            # Start the worker
+            if not self.__thread or not self.__thread.is_alive():
+                self.__thread = threading.Thread(
+                    target=self.__work, name="region-geocoder", daemon=True
+                )
+                self.__thread.start()
+
+    def get_pending_count(self) -> int:
+        """Get the amount of regions waiting to be resolved"""
+
+        with self.__lock:
+            return len(self.__pending)
+
+    def __work(self):
+        """Resolve requested regions in batches"""
+
+        while True:
+            batch = [self.__queue.get()]
+            while len(batch) < settings.REGION_GEOCODER_BATCH_SIZE:
+                try:
+                    batch.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            for country_alpha2_code, country_name, region, attempt in batch:
+                try:
+                    coordinate = google_maps_interactions.get_coordinate(
+                        location=f"{country_name}, {region}"
+                    )
+                except (Exception,) as e:
+                    logger.warning(
+                        f"Could not get coordinate of region {region}: {str(e)}"
+                    )
+                    self.__retry(
+                        country_alpha2_code=country_alpha2_code,
+                        country_name=country_name,
+                        region=region,
+                        attempt=attempt + 1,
+                    )
+                    continue
+
+                # Add the new coordinate, an empty coordinate marks a region that was not found
+                country_regions_coordinates = (
+                    global_variables.region_coordinates.setdefault(
+                        country_alpha2_code, {}
+                    )
+                )
+                country_regions_coordinates[region] = coordinate
+
+                with self.__lock:
+                    self.__pending.discard((country_alpha2_code, region))
+
+            try:
+                save_region_coordinates(coordinates=global_variables.region_coordinates)
+            except (Exception,) as e:
+                logger.error(f"Could not save region coordinates: {str(e)}")
+
+    def __retry(
+        self, country_alpha2_code: str, country_name: str, region: str, attempt: int
+    ):
+        """Request a region again after a backoff, give up after the maximum amount of attempts"""
+
+        # The region stays unresolved and is requested again when the data is loaded again
+        if attempt >= RETRY_ATTEMPTS:
+            with self.__lock:
+                self.__pending.discard((country_alpha2_code, region))
+
+            return
+
+        timer = threading.Timer(
+            interval=RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1),
+            function=self.__queue.put,
+            args=((country_alpha2_code, country_name, region, attempt),),
+        )
+        timer.daemon = True
+        timer.start()
+
+
+def load_region_coordinates() -> dict:
+    """Load region coordinates from the region coordinates file"""
+
+    with open(settings.REGION_COORDINATES_JSON, "r") as file:
+        return json.loads(file.read())
+
+
+def save_region_coordinates(coordinates: dict):
+    """Save region coordinates to the region coordinates file"""
+
+    # Unique temporary file, workers can save at the same time
+    with tempfile.NamedTemporaryFile(
+        mode="w",
+        dir=os.path.dirname(os.path.abspath(settings.REGION_COORDINATES_JSON)),
+        prefix=f"{os.path.basename(settings.REGION_COORDINATES_JSON)}.",
+        suffix=".tmp",
+        delete=False,
+    ) as file:
+        file.write(json.dumps(coordinates, indent=2))
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, settings.REGION_COORDINATES_JSON)
@@ -419,36 +419,20 @@ class Translator:
     # The following functions are used for translating campaign data.
     #
 
-    def apply_t_function_campaign(
+    def apply_t_function_responses_sample(
         self,
         t: Callable,
         campaign_code: str,
         language: str,
-        current_question: dict,
-        all_questions: list,
         responses_sample: dict,
-        responses_breakdown: dict,
-        living_settings_breakdown: list,
-        top_words_and_phrases: dict,
-        histogram: dict,
-        genders_breakdown: list,
-        world_bubble_maps_coordinates: dict,
-        filter_1_average_age: str,
-        filter_2_average_age: str,
-        filter_1_description: str,
-        filter_2_description: str,
     ) -> dict:
         """
-        Apply extract/translate.
-
-        If the data structure of any argument has changed (except t, campaign_code and language), make sure
-        key_depth_rules is updated.
+        Apply extract/translate on responses sample.
         """
 
         # Create deep replacer instance
         deep_replacer = DeepReplacer()
 
-        # Responses sample
         # giz: Do not translate response if the language is es
         # giz: For other languages, only translate text between parenthesis
         if campaign_code == LegacyCampaignCode.giz.value:
@@ -460,6 +444,8 @@ class Translator:
                     key_depth_rules={
                         "columns:id": [key_depth_rules.IGNORE],
                         "columns:type": [key_depth_rules.IGNORE],
+                        "next_cursor": [key_depth_rules.IGNORE],
+                        "total_count": [key_depth_rules.IGNORE],
                         "data:response": [
                             key_depth_rules.APPLY_ON_TEXT_BETWEEN_PARENTHESIS
                         ],
@@ -473,9 +459,50 @@ class Translator:
                 key_depth_rules={
                     "columns:id": [key_depth_rules.IGNORE],
                     "columns:type": [key_depth_rules.IGNORE],
+                    "next_cursor": [key_depth_rules.IGNORE],
+                    "total_count": [key_depth_rules.IGNORE],
                 },
             )
 
+        return responses_sample
+
+    def apply_t_function_campaign(
+        self,
+        t: Callable,
+        campaign_code: str,
+        language: str,
+        current_question: dict,
+        all_questions: list,
+        responses_sample: dict,
+        responses_breakdown: dict,
+        living_settings_breakdown: list,
+        top_words_and_phrases: dict,
+        histogram: dict,
+        genders_breakdown: list,
+        world_bubble_maps_coordinates: dict,
+        filter_1_average_age: str,
+        filter_2_average_age: str,
+        filter_1_description: str,
+        filter_2_description: str,
+    ) -> dict:
+        """
+        Apply extract/translate.
+
+        If the data structure of any argument has changed (except t, campaign_code and language), make sure
+        key_depth_rules is updated.
+        """
+
+        # Create deep replacer instance
+        deep_replacer = DeepReplacer()
+
+        # Responses sample
+        responses_sample = self.apply_t_function_responses_sample(
+            t=t,
+            campaign_code=campaign_code,
+            language=language,
+            responses_sample=responses_sample,
+        )
+
         # Current question
         current_question = deep_replacer.replace(
             data=current_question,
@@ -28,11 +28,21 @@ import hashlib
 import json
 import os
 import re
+from functools import lru_cache
 from hashlib import sha256
+from typing import Any
+
+import inflect
+import orjson
+import pandas as pd
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
 
 from app import constants
 from app.helpers import q_col_names
 
+inflect_engine = inflect.engine()
+
 
 def contains_letters(text: str):
     """
@@ -144,6 +154,19 @@ def get_string_hash_value(string: str) -> str:
     return sha256(string.encode()).hexdigest()
 
 
+def get_dataframe_hash_value(df: pd.DataFrame) -> str:
+    """
+    Get dataframe hash value.
+    The same data gives the same value in every process.
+    """
+
+    sha256_hash = sha256()
+    sha256_hash.update(json.dumps(df.columns.tolist()).encode())
+    sha256_hash.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+
+    return sha256_hash.hexdigest()
+
+
 def get_translation_languages(cloud_service: str) -> dict:
     """
     Get translation languages.
@@ -179,3 +202,31 @@ def get_required_columns(q_codes: list[str]) -> list[str]:
         columns.append(q_col_names.get_lemmatized_col_name(q_code=q_code))
 
     return columns
+
+
+@lru_cache(maxsize=4096)
+def get_plural(word: str) -> str:
+    """
+    Get the plural of a word (cached per word).
+    """
+
+    return inflect_engine.plural(word)
+
+
+def dumps_json(value: Any) -> bytes:
+    """
+    Serialize value to JSON with orjson, pydantic models are serialized without validating them again.
+    Values orjson does not support are encoded with FastAPI's jsonable_encoder.
+    """
+
+    def default(obj: Any):
+        if isinstance(obj, BaseModel):
+            return obj.dict()
+
+        return jsonable_encoder(obj)
+
+    return orjson.dumps(
+        value,
+        default=default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+    )
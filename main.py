@@ -24,20 +24,28 @@ SOFTWARE.
 """
 
 import asyncio
+import threading
+from contextlib import asynccontextmanager
 
 import uvicorn
-from fastapi import FastAPI, status
+from fastapi import FastAPI, concurrency, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import databases
 from app import utils
 from app.api.v1.api import api_router
+from app.core.compression_middleware import CompressionMiddleware
 from app.core.settings import get_settings
+from app.helpers import data_loader
 from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
+from app.prefork import PreforkLauncher
 from app.scheduler import app as app_rocketry
 
 settings = get_settings()
 
+# Interval at which worker processes check for new campaigns snapshots
+CAMPAIGN_SNAPSHOTS_CHECK_INTERVAL_SECONDS = 10
+
 # Create dirs required in local development.
 # In production these dirs are already present.
 if settings.STAGE == "dev":
@@ -48,6 +56,31 @@ databases.create_databases(
     campaign_codes=[x.campaign_code for x in CAMPAIGNS_CONFIG.values()]
 )
 
+
+async def attach_campaigns_snapshots():
+    """
+    Attach the campaigns snapshots published by the main process.
+    Check for new snapshots periodically, e.g. after data was reloaded.
+    """
+
+    await concurrency.run_in_threadpool(data_loader.load_worker_initial_data)
+
+    while True:
+        await asyncio.sleep(CAMPAIGN_SNAPSHOTS_CHECK_INTERVAL_SECONDS)
+        await concurrency.run_in_threadpool(data_loader.attach_campaigns_snapshots)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # With multiple workers attaching snapshots, this is a worker process
+    if settings.WORKERS > 1 and settings.WORKERS_MODE == "snapshots":
+        task = asyncio.create_task(attach_campaigns_snapshots())
+        yield
+        task.cancel()
+    else:
+        yield
+
+
 # Tags metadata
 tags_metadata = [
     {
@@ -86,6 +119,7 @@ app_fastapi = FastAPI(
     version=settings.VERSION,
     docs_url="/docs",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
     contact={
         "name": settings.OWNER_NAME,
         "url": settings.OWNER_URL,
@@ -100,6 +134,8 @@ app_fastapi.add_middleware(
     allow_headers=settings.CORS["allow_headers"],
 )
 
+app_fastapi.add_middleware(middleware_class=CompressionMiddleware)
+
 app_fastapi.include_router(api_router, prefix=settings.API_PREFIX)
 
 
@@ -140,5 +176,54 @@ async def main():
     await asyncio.wait([scheduler, api])
 
 
+def main_multiple_workers():
+    """
+    Serve with multiple worker processes.
+    Rocketry runs in this process, it loads the campaigns data and publishes snapshots that the workers attach.
+    """
+
+    scheduler = threading.Thread(target=app_rocketry.run, daemon=True)
+
+    print("INFO:\t  Starting applications...")
+    scheduler.start()
+    uvicorn.run(
+        app="main:app_fastapi",
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.WORKERS,
+        loop="asyncio",
+    )
+    app_rocketry.session.shut_down()
+
+
+def main_prefork_workers():
+    """
+    Serve with multiple worker processes forked after the data was loaded.
+    Workers share the data copy-on-write, send SIGHUP to this process to reload data and replace the workers.
+    """
+
+    # Data is loaded by the launcher instead
+    app_rocketry.session["do_once_load_initial_data"].disabled = True
+    scheduler = threading.Thread(target=app_rocketry.run, daemon=True)
+
+    print("INFO:\t  Starting applications...")
+    scheduler.start()
+    PreforkLauncher(
+        config=uvicorn.Config(
+            app=app_fastapi,
+            host=settings.HOST,
+            port=settings.PORT,
+            loop="asyncio",
+        ),
+        workers=settings.WORKERS,
+    ).run()
+    app_rocketry.session.shut_down()
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    if settings.WORKERS > 1 and settings.WORKERS_MODE == "prefork":
+        main_prefork_workers()
+    elif settings.WORKERS > 1:
+        main_multiple_workers()
+    else:
+        asyncio.run(main())
@@ -0,0 +1,236 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import json
+import os
+
+from app.enums.geometry_resolution import GeometryResolution
+from app.services import geometry
+
+# Tolerance in degrees used for simplifying lines, and decimals kept in coordinates
+RESOLUTIONS_PARAMETERS = {
+    GeometryResolution.medium: {"tolerance": 0.02, "decimals": 2},
+    GeometryResolution.low: {"tolerance": 0.1, "decimals": 1},
+}
+
+
+def get_point_line_distance(
+    point: list[float], start: list[float], end: list[float]
+) -> float:
+    """Get distance of point to the line through start and end"""
+
+    dx = end[0] - start[0]
+    dy = end[1] - start[1]
+    if dx == 0 and dy == 0:
+        return ((point[0] - start[0]) ** 2 + (point[1] - start[1]) ** 2) ** 0.5
+
+    return abs(
+        dy * point[0] - dx * point[1] + end[0] * start[1] - end[1] * start[0]
+    ) / ((dx**2 + dy**2) ** 0.5)
+
+
+def simplify_line(points: list[list[float]], tolerance: float) -> list[list[float]]:
+    """Simplify line with the Ramer-Douglas-Peucker algorithm, the first and last points are kept"""
+
+    if len(points) < 3:
+        return points
+
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        max_distance = 0.0
+        max_index = start
+        for index in range(start + 1, end):
+            distance = get_point_line_distance(
+                point=points[index], start=points[start], end=points[end]
+            )
+            if distance > max_distance:
+                max_distance = distance
+                max_index = index
+        if max_distance > tolerance:
+            keep[max_index] = True
+            stack.append((start, max_index))
+            stack.append((max_index, end))
+
+    return [point for point, kept in zip(points, keep) if kept]
+
+
+def remove_repeated_points(points: list[list[float]]) -> list[list[float]]:
+    """Remove consecutive repeated points"""
+
+    result = []
+    for point in points:
+        if not result or point != result[-1]:
+            result.append(point)
+
+    return result
+
+
+def simplify_geo_json_ring(
+    ring: list[list[float]], tolerance: float, decimals: int
+) -> list[list[float]] | None:
+    """Simplify ring of a GeoJSON polygon, None if the ring collapsed"""
+
+    simplified = simplify_line(points=ring, tolerance=tolerance)
+    simplified = remove_repeated_points(
+        points=[[round(x, decimals), round(y, decimals)] for x, y in simplified]
+    )
+
+    # A ring needs at least 4 points, the first and last point being the same
+    if len(simplified) < 4:
+        return None
+
+    return simplified
+
+
+def simplify_geo_json(data: dict, tolerance: float, decimals: int) -> dict:
+    """Simplify GeoJSON, polygons that collapsed are removed"""
+
+    def simplify_polygon(polygon: list) -> list | None:
+        rings = []
+        for index, ring in enumerate(polygon):
+            simplified = simplify_geo_json_ring(
+                ring=ring, tolerance=tolerance, decimals=decimals
+            )
+            if simplified:
+                rings.append(simplified)
+            elif index == 0:
+                # Exterior ring collapsed
+                return None
+
+        return rings
+
+    for feature in data["features"]:
+        geometry_ = feature["geometry"]
+        if geometry_["type"] == "Polygon":
+            polygon = simplify_polygon(polygon=geometry_["coordinates"])
+            if polygon:
+                geometry_["coordinates"] = polygon
+            else:
+                # Keep a tiny country visible with its original exterior ring
+                geometry_["coordinates"] = [
+                    [
+                        [round(x, decimals), round(y, decimals)]
+                        for x, y in geometry_["coordinates"][0]
+                    ]
+                ]
+        elif geometry_["type"] == "MultiPolygon":
+            polygons = [simplify_polygon(polygon=x) for x in geometry_["coordinates"]]
+            polygons = [x for x in polygons if x]
+            if polygons:
+                geometry_["coordinates"] = polygons
+
+    return data
+
+
+def simplify_topo_json(data: dict, tolerance: float) -> dict:
+    """
+    Simplify TopoJSON.
+    Arcs are simplified keeping their first and last points, shared borders stay shared.
+    Coordinates are quantized again with a coarser scale.
+    """
+
+    scale_x, scale_y = data["transform"]["scale"]
+
+    # Coarser quantization, a few steps per tolerance
+    factor = max(1, round(tolerance / (4 * max(scale_x, scale_y))))
+    data["transform"]["scale"] = [scale_x * factor, scale_y * factor]
+
+    arcs = []
+    for arc in data["arcs"]:
+        # Decode delta encoded positions
+        points = []
+        x, y = 0, 0
+        for dx, dy in arc:
+            x += dx
+            y += dy
+            points.append([x, y])
+
+        # Simplify in degrees
+        points_degrees = [[px * scale_x, py * scale_y] for px, py in points]
+        simplified = simplify_line(points=points_degrees, tolerance=tolerance)
+
+        # Quantize again and delta encode
+        quantized = [
+            [round(px / scale_x / factor), round(py / scale_y / factor)]
+            for px, py in simplified
+        ]
+        quantized = remove_repeated_points(points=quantized)
+        if len(quantized) < 2:
+            quantized = quantized * 2
+
+        encoded = [quantized[0]]
+        for previous, current in zip(quantized, quantized[1:]):
+            encoded.append([current[0] - previous[0], current[1] - previous[1]])
+        arcs.append(encoded)
+
+    data["arcs"] = arcs
+
+    # Quantized positions of points objects
+    for obj in data["objects"].values():
+        for geometry_ in obj.get("geometries", [obj]):
+            if geometry_.get("type") == "Point":
+                x, y = geometry_["coordinates"]
+                geometry_["coordinates"] = [round(x / factor), round(y / factor)]
+
+    return data
+
+
+def simplify_geometry():
+    """Create the simplified geometry files for every resolution"""
+
+    if not os.path.isdir(geometry.SIMPLIFIED_GEOMETRY_DIRECTORY):
+        os.mkdir(geometry.SIMPLIFIED_GEOMETRY_DIRECTORY)
+
+    for name, filepath in geometry.GEOMETRY_FILEPATHS.items():
+        for resolution, parameters in RESOLUTIONS_PARAMETERS.items():
+            with open(filepath, "r", encoding="utf-8") as file:
+                data = json.loads(file.read())
+
+            if data.get("type") == "Topology":
+                data = simplify_topo_json(data=data, tolerance=parameters["tolerance"])
+            else:
+                data = simplify_geo_json(
+                    data=data,
+                    tolerance=parameters["tolerance"],
+                    decimals=parameters["decimals"],
+                )
+
+            simplified_filepath = geometry.get_geometry_filepath(
+                name=name, resolution=resolution
+            )
+            with open(simplified_filepath, "w", encoding="utf-8") as file:
+                file.write(json.dumps(data, separators=(",", ":")))
+
+            print(
+                f"Created {simplified_filepath} "
+                f"({os.path.getsize(filepath)} -> {os.path.getsize(simplified_filepath)} bytes)."
+            )
+
+
+if __name__ == "__main__":
+    simplify_geometry()
@@ -0,0 +1,96 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import os
+
+os.environ.setdefault("STAGE", "dev")
+
+import numpy as np
+import pandas as pd
+
+from app.databases import Database
+from app.services import campaign_snapshots
+
+ROWS_COUNT = 10000
+
+
+def is_memory_mapped(values: np.ndarray) -> bool:
+    """Check if the buffer of values belongs to a memory-mapped file"""
+
+    while values is not None:
+        if isinstance(values, np.memmap):
+            return True
+        values = values.base
+
+    return False
+
+
+def test_dataframe_columns_memory_mapped(monkeypatch, tmp_path):
+    """The columns of an attached snapshot are memory-mapped, except columns of mostly unique text"""
+
+    monkeypatch.setattr(
+        campaign_snapshots.settings, "CAMPAIGN_SNAPSHOTS_DIRECTORY", str(tmp_path)
+    )
+
+    rng = np.random.default_rng(seed=1)
+    df = pd.DataFrame(
+        {
+            "q1_response": [f"response {i}" for i in range(ROWS_COUNT)],
+            "gender": rng.choice(["Female", "Male", ""], size=ROWS_COUNT).astype(
+                object
+            ),
+            "age": rng.integers(15, 80, size=ROWS_COUNT),
+            "ingestion_time": pd.date_range(
+                "2021-01-01", periods=ROWS_COUNT, freq="h", tz="UTC"
+            ),
+        }
+    )
+    db = Database(
+        respondent_noun_singular="respondent",
+        responses_sample_columns=[],
+        parent_categories=[],
+    )
+    db.dataframe = df
+    db.version = "version"
+
+    campaign_snapshots.publish_snapshot(campaign_code="campaign", db=db)
+    df_snapshot = campaign_snapshots.load_snapshot(
+        campaign_code="campaign", version="version", user=None
+    ).dataframe
+
+    # Same values
+    pd.testing.assert_frame_equal(
+        df_snapshot.astype({"gender": object}), df, check_exact=True
+    )
+    assert (
+        df_snapshot["gender"].isin(["Female"]).sum() == (df["gender"] == "Female").sum()
+    )
+
+    # Memory-mapped
+    assert isinstance(df_snapshot["gender"].dtype, pd.CategoricalDtype)
+    assert is_memory_mapped(df_snapshot["gender"].array.codes)
+    assert is_memory_mapped(df_snapshot["age"].to_numpy())
+    assert is_memory_mapped(df_snapshot["ingestion_time"].array.asi8)
+    assert not is_memory_mapped(df_snapshot["q1_response"].to_numpy())
@@ -0,0 +1,113 @@
+"""
+MIT License
+
+Copyright (c) 2023 World We Want. Maintainers: Thomas Wood, https://fastdatascience.com, Zairon Jacobs, https://zaironjacobs.com.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+
+"""
+
+import asyncio
+import os
+import time
+
+os.environ.setdefault("STAGE", "dev")
+
+import httpx
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+import main
+from app import databases
+from app.api import dependencies
+from app.core.settings import get_settings
+from app.helpers import filters
+from app.helpers.campaigns_config_loader import CAMPAIGNS_CONFIG
+from app.services.translator import Translator
+
+settings = get_settings()
+
+# Duration of the stubbed translation request
+TRANSLATION_SECONDS = 1.0
+
+# Interval between health checks sent while a campaign is requested
+HEALTH_CHECK_INTERVAL_SECONDS = 0.05
+
+
+@pytest.mark.parametrize("path", ["", "/batch", "/responses"])
+def test_health_check_not_blocked_by_filter_keyword_translation(monkeypatch, path):
+    """A slow translation of filter keywords must not block the event loop"""
+
+    campaign_code = next(iter(CAMPAIGNS_CONFIG))
+    databases.create_databases(campaign_codes=[campaign_code])
+
+    translated_texts = []
+
+    def quick_translate_text(
+        self, text: str, source_language: str, target_language: str
+    ) -> str:
+        time.sleep(TRANSLATION_SECONDS)
+        translated_texts.append(text)
+
+        return text
+
+    monkeypatch.setattr(Translator, "quick_translate_text", quick_translate_text)
+
+    app = main.app_fastapi
+    monkeypatch.setitem(
+        app.dependency_overrides, dependencies.language_check, lambda: "fr"
+    )
+    monkeypatch.setitem(
+        app.dependency_overrides, dependencies.q_code_check, lambda: "q1"
+    )
+
+    filter_1 = filters.get_default_filter(campaign_code=campaign_code)
+    filter_1.keyword_filter = "eau"
+
+    async def request_campaign_and_health_checks() -> list[tuple[int, float]]:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as client:
+            campaign_request = asyncio.create_task(
+                client.post(
+                    f"{settings.API_PREFIX}/campaigns/{campaign_code}{path}",
+                    json={"filter_1": jsonable_encoder(filter_1)},
+                )
+            )
+
+            # Send health checks until the campaign request is done
+            # The delay of a health check is measured from when it was due, a blocked event loop delays it
+            health_checks = []
+            due = time.monotonic()
+            while not campaign_request.done():
+                due += HEALTH_CHECK_INTERVAL_SECONDS
+                await asyncio.sleep(max(0.0, due - time.monotonic()))
+                response = await client.get(f"{settings.API_PREFIX}/health-check")
+                health_checks.append((response.status_code, time.monotonic() - due))
+
+            await campaign_request
+
+            return health_checks
+
+    health_checks = asyncio.run(request_campaign_and_health_checks())
+
+    assert translated_texts == ["eau"]
+    assert all(status_code == 200 for status_code, _ in health_checks)
+    assert max(delay for _, delay in health_checks) < TRANSLATION_SECONDS / 2